@@ -0,0 +1,140 @@
+"""Compare requests/sec of the fast response path against the pydantic path.
+
+Run with ``uv run python dev/benchmarks/bench_chat_completions.py``. Apps are
+driven through httpx's ASGI transport against an in-process backend stub.
+Two bare routes build the same completion and differ only in how it is
+returned: a ``ChatCompletionResponse`` validated and encoded by FastAPI's
+``response_model`` machinery (the previous path), or pre-encoded JSON bytes,
+so their ratio isolates the response path. The full router, dependencies
+and all, is measured as well for reference.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from typing import Any, Sequence
+
+from fastapi import FastAPI, Response
+from httpx import ASGITransport, AsyncClient
+
+from nexus.api.models import ChatCompletionRequest, ChatCompletionResponse
+from nexus.api.router import _build_chat_completion_response, router
+from nexus.api.serialization import JSONBytesResponse, dumps
+from nexus.dependencies import get_llm_client
+
+BACKEND_RESPONSE: dict[str, Any] = {
+    "choices": [
+        {
+            "index": 0,
+            "message": {"role": "assistant", "content": "lorem ipsum " * 200},
+            "finish_reason": "stop",
+        }
+    ],
+    "usage": {"prompt_tokens": 512, "completion_tokens": 400, "total_tokens": 912},
+}
+
+
+class StaticClient:
+    """Backend stub returning a fixed OpenAI-style completion."""
+
+    async def invoke(self, messages: Any, **kwargs: Any) -> Any:
+        return BACKEND_RESPONSE
+
+    async def stream(self, messages: Any, **kwargs: Any) -> Any:
+        raise NotImplementedError
+
+    def bind_tools(self, tools: list[Any]) -> "StaticClient":
+        return self
+
+
+def _app(client: StaticClient) -> FastAPI:
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_llm_client] = lambda: client
+    return app
+
+
+def _bare_app(client: StaticClient, *, encode: bool) -> FastAPI:
+    """Serve completions without the router's admission and cache plumbing."""
+
+    app = FastAPI()
+
+    @app.post("/v1/chat/completions", response_model=ChatCompletionResponse)
+    async def create_chat_completion(
+        request: ChatCompletionRequest,
+    ) -> ChatCompletionResponse | Response:
+        backend_response = await client.invoke(request.messages, model=request.model)
+        completion = _build_chat_completion_response(backend_response, request.model)
+        if encode:
+            return JSONBytesResponse(dumps(completion))
+        return ChatCompletionResponse.model_validate(completion)
+
+    return app
+
+
+async def _measure(
+    app: FastAPI, requests: int, concurrency: int, warmup: int = 50
+) -> float:
+    payload = {
+        "model": "bench-model",
+        "messages": [{"role": "user", "content": "benchmark " * 50}],
+    }
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://bench") as client:
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _one() -> None:
+            async with semaphore:
+                response = await client.post("/v1/chat/completions", json=payload)
+                response.raise_for_status()
+
+        await asyncio.gather(*(_one() for _ in range(warmup)))
+        started = time.perf_counter()
+        await asyncio.gather(*(_one() for _ in range(requests)))
+        elapsed = time.perf_counter() - started
+    return requests / elapsed
+
+
+async def compare(
+    *, requests: int, concurrency: int, rounds: int, warmup: int = 50
+) -> dict[str, float]:
+    """Return the best requests/sec of each app over ``rounds``."""
+
+    client = StaticClient()
+    apps = {
+        "pydantic response_model path": _bare_app(client, encode=False),
+        "fast JSON bytes path": _bare_app(client, encode=True),
+        "full router (fast path)": _app(client),
+    }
+    best = dict.fromkeys(apps, 0.0)
+    for _ in range(rounds):
+        for name, app in apps.items():
+            rps = await _measure(app, requests, concurrency, warmup)
+            best[name] = max(best[name], rps)
+    return best
+
+
+async def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--warmup", type=int, default=50)
+    args = parser.parse_args(argv)
+
+    best = await compare(
+        requests=args.requests,
+        concurrency=args.concurrency,
+        rounds=args.rounds,
+        warmup=args.warmup,
+    )
+    for name, rps in best.items():
+        print(f"{name + ':':<30}{rps:9.1f} req/s")
+    speed_up = best["fast JSON bytes path"] / best["pydantic response_model path"]
+    print(f"{'speed-up:':<30}{speed_up:9.2f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,9 +1,12 @@
 """nexus package exposing FastAPI app and configuration."""
 
 __all__ = [
+    "admission",
     "api",
+    "cache",
     "clients",
     "config",
     "container",
+    "dispatch",
     "protocols",
 ]
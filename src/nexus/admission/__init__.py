@@ -0,0 +1,35 @@
+"""Admission control for requests forwarded to LLM backends."""
+
+from .adaptive import GradientLimit
+from .controller import AdmissionController
+from .fair_queue import FairQueue
+from .limiter import (
+    AdmissionRejectedError,
+    ConcurrencyLimiter,
+    Permit,
+    PermitGroup,
+    acquire_all,
+)
+from .token_bucket import (
+    MemoryTokenBucketStore,
+    SQLiteTokenBucketStore,
+    TokenRateLimiter,
+    TokenReservation,
+    estimate_prompt_tokens,
+)
+
+__all__ = [
+    "AdmissionController",
+    "AdmissionRejectedError",
+    "ConcurrencyLimiter",
+    "FairQueue",
+    "GradientLimit",
+    "MemoryTokenBucketStore",
+    "Permit",
+    "PermitGroup",
+    "SQLiteTokenBucketStore",
+    "TokenRateLimiter",
+    "TokenReservation",
+    "acquire_all",
+    "estimate_prompt_tokens",
+]
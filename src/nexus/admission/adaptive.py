@@ -0,0 +1,97 @@
+"""Latency-driven concurrency limit, after Netflix's gradient limiter."""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+
+from ..dispatch.replica_pool import LatencySample
+
+
+@dataclass
+class _Trend:
+    """Short- and long-term averages of one latency signal."""
+
+    short: float
+    long: float
+
+    def update(self, sample: float, short_alpha: float, long_alpha: float) -> None:
+        self.short += short_alpha * (sample - self.short)
+        self.long += long_alpha * (sample - self.long)
+        # After latency drops for good (e.g. a faster model), the slow
+        # long-term average would stay far above the short-term one and hide
+        # the next rise in queueing, so decay it faster while it is more than
+        # twice the short-term average.
+        if self.long / self.short > 2:
+            self.long *= 0.95
+
+    def gradient(self, tolerance: float) -> float:
+        return max(0.5, min(1.0, tolerance * self.long / self.short))
+
+
+class GradientLimit:
+    """Adjust a concurrency limit from the trend of observed latencies.
+
+    Each signal (time to first token and total latency) keeps a short- and
+    a long-term average. While the short-term latency stays within
+    ``tolerance`` times the long-term baseline the limit grows by about
+    ``sqrt(limit)`` per sample; once latency rises (requests queue inside the
+    backend) the limit shrinks proportionally. Failed requests back off
+    multiplicatively. Changes are smoothed and clamped to
+    ``[min_limit, max_limit]``.
+    """
+
+    def __init__(
+        self,
+        *,
+        initial: int,
+        min_limit: int,
+        max_limit: int,
+        tolerance: float = 1.5,
+        smoothing: float = 0.2,
+        backoff: float = 0.9,
+        short_alpha: float = 0.5,
+        long_alpha: float = 0.01,
+    ) -> None:
+        self._limit = float(min(max(initial, min_limit), max_limit))
+        self._min = min_limit
+        self._max = max_limit
+        self._tolerance = tolerance
+        self._smoothing = smoothing
+        self._backoff = backoff
+        self._short_alpha = short_alpha
+        self._long_alpha = long_alpha
+        self._trends: dict[str, _Trend] = {}
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    def update(self, sample: LatencySample, in_flight: int) -> int:
+        """Feed one completed request and return the new limit."""
+
+        if sample.failed:
+            self._limit = max(self._limit * self._backoff, self._min)
+            return self.limit
+
+        gradients = [
+            self._observe(name, value)
+            for name, value in (("ttft", sample.ttft), ("total", sample.total))
+            if value is not None and value > 0
+        ]
+        # Without demand the latency says nothing about capacity.
+        if not gradients or in_flight < self._limit / 2:
+            return self.limit
+
+        target = self._limit * min(gradients) + math.sqrt(self._limit)
+        smoothed = (1 - self._smoothing) * self._limit + self._smoothing * target
+        self._limit = min(max(smoothed, self._min), self._max)
+        return self.limit
+
+    def _observe(self, name: str, value: float) -> float:
+        trend = self._trends.get(name)
+        if trend is None:
+            trend = self._trends[name] = _Trend(short=value, long=value)
+        else:
+            trend.update(value, self._short_alpha, self._long_alpha)
+        return trend.gradient(self._tolerance)
@@ -0,0 +1,112 @@
+"""Per-backend admission limiters."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from ..config.admission_settings import AdmissionSettings
+from ..dispatch.replica_pool import LatencyObserver, LatencySample
+from .adaptive import GradientLimit
+from .fair_queue import FairQueue
+from .limiter import ConcurrencyLimiter
+
+# Bulkhead shared by every model without a limit of its own.
+DEFAULT_MODEL_PARTITION = "*"
+
+
+class AdmissionController:
+    """Create and track one :class:`ConcurrencyLimiter` per backend.
+
+    Models with a per-model limit additionally get their own bulkhead
+    limiter, taken before the backend's, so a slow model queues behind its
+    own bulkhead instead of filling the shared backend. All other models
+    share one default bulkhead (reported as ``backend/*``), so arbitrary
+    model names cannot create limiters. Each limiter queues
+    by the configured priority classes and tenant weights. With adaptive
+    limits enabled each backend also gets a :class:`GradientLimit`, fed
+    through :meth:`observer` by the backend client's latency samples.
+    """
+
+    def __init__(self, settings: AdmissionSettings) -> None:
+        self._settings = settings
+        self._model_limits = settings.model_limits()
+        self._limiters: dict[str, ConcurrencyLimiter] = {}
+        self._model_limiters: dict[tuple[str, str], ConcurrencyLimiter] = {}
+        self._algorithms: dict[str, GradientLimit] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self._settings.max_concurrency > 0
+
+    def limiter(self, backend: str) -> ConcurrencyLimiter | None:
+        """Return the limiter guarding ``backend``, or ``None`` if disabled."""
+
+        if not self.enabled:
+            return None
+        limiter = self._limiters.get(backend)
+        if limiter is None:
+            settings = self._settings
+            limit = settings.max_concurrency
+            if settings.adaptive:
+                # Start halfway and let observed latency find the real limit.
+                algorithm = GradientLimit(
+                    initial=max(settings.max_concurrency // 2, 1),
+                    min_limit=min(settings.min_concurrency, settings.max_concurrency),
+                    max_limit=settings.max_concurrency,
+                    tolerance=settings.latency_tolerance,
+                )
+                self._algorithms[backend] = algorithm
+                limit = algorithm.limit
+            limiter = self._create_limiter(limit)
+            self._limiters[backend] = limiter
+        return limiter
+
+    def model_limiter(self, backend: str, model: str) -> ConcurrencyLimiter | None:
+        """Return the bulkhead isolating ``model`` on ``backend``, if it has one."""
+
+        if model not in self._model_limits:
+            model = DEFAULT_MODEL_PARTITION
+        key = (backend, model)
+        limiter = self._model_limiters.get(key)
+        if limiter is None:
+            limit = self._settings.model_limit(model)
+            if limit <= 0:
+                return None
+            limiter = self._create_limiter(limit)
+            self._model_limiters[key] = limiter
+        return limiter
+
+    def observer(self, backend: str) -> LatencyObserver | None:
+        """Return a callback feeding ``backend``'s adaptive limit, if enabled."""
+
+        if not (self.enabled and self._settings.adaptive):
+            return None
+
+        def _observe(sample: LatencySample) -> None:
+            limiter = self.limiter(backend)
+            if limiter is not None:
+                algorithm = self._algorithms[backend]
+                limiter.set_limit(algorithm.update(sample, limiter.in_flight))
+
+        return _observe
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Return monitoring stats keyed by backend and ``backend/model``."""
+
+        stats = {name: limiter.stats() for name, limiter in self._limiters.items()}
+        for (backend, model), limiter in self._model_limiters.items():
+            stats[f"{backend}/{model}"] = limiter.stats()
+        return stats
+
+    def _create_limiter(self, limit: int) -> ConcurrencyLimiter:
+        settings = self._settings
+        return ConcurrencyLimiter(
+            limit,
+            max_queue=settings.max_queue,
+            max_wait=settings.max_queue_wait,
+            queue=FairQueue(
+                settings.priorities(),
+                default_priority=settings.default_priority,
+                weights=settings.weights(),
+            ),
+        )
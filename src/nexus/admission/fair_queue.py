@@ -0,0 +1,152 @@
+"""Strict-priority queue with weighted fair queuing between tenants."""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass, field
+from itertools import count
+from typing import Generic, Hashable, Iterator, Mapping, Sequence, TypeVar
+
+T = TypeVar("T", bound=Hashable)
+
+DEFAULT_PRIORITY = "default"
+DEFAULT_TENANT = "default"
+
+
+@dataclass
+class _Class(Generic[T]):
+    """Queued items of one priority class, one FIFO per tenant."""
+
+    tenants: dict[str, deque[tuple[float, int, T]]] = field(default_factory=dict)
+    last_finish: dict[str, float] = field(default_factory=dict)
+    virtual_time: float = 0.0
+    size: int = 0
+
+
+class FairQueue(Generic[T]):
+    """Queue that serves priority classes strictly and tenants fairly.
+
+    ``priorities`` lists class names from most to least urgent; a lower
+    class is served only while every higher class is empty. Within a class
+    each tenant gets a share of dequeues proportional to its weight (weighted
+    fair queuing with virtual finish times), so a tenant flooding the queue
+    only delays itself. With a single tenant and class this is plain FIFO.
+    """
+
+    def __init__(
+        self,
+        priorities: Sequence[str] = (DEFAULT_PRIORITY,),
+        *,
+        default_priority: str = DEFAULT_PRIORITY,
+        weights: Mapping[str, float] | None = None,
+    ) -> None:
+        if default_priority not in priorities:
+            raise ValueError(f"Unknown default priority {default_priority!r}")
+        self.priorities = list(priorities)
+        self._ranks = {name: rank for rank, name in enumerate(self.priorities)}
+        self._default_rank = self._ranks[default_priority]
+        self._weights = dict(weights or {})
+        self._classes: list[_Class[T]] = [_Class() for _ in self.priorities]
+        self._index: dict[T, tuple[int, str]] = {}
+        self._sequence = count()
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(list(self._index))
+
+    def rank(self, priority: str | None) -> int:
+        """Return the rank of ``priority`` (0 is most urgent)."""
+
+        if priority is None:
+            return self._default_rank
+        return self._ranks.get(priority, self._default_rank)
+
+    def push(self, item: T, *, priority: str | None, tenant: str | None) -> None:
+        rank = self.rank(priority)
+        tenant = tenant or DEFAULT_TENANT
+        queue_class = self._classes[rank]
+        start = max(queue_class.virtual_time, queue_class.last_finish.get(tenant, 0.0))
+        finish = start + 1.0 / self._weights.get(tenant, 1.0)
+        queue_class.last_finish[tenant] = finish
+        queue_class.tenants.setdefault(tenant, deque()).append(
+            (finish, next(self._sequence), item)
+        )
+        queue_class.size += 1
+        self._index[item] = (rank, tenant)
+
+    def pop(self) -> T | None:
+        """Remove and return the next item to serve, or ``None`` when empty."""
+
+        for queue_class in self._classes:
+            if not queue_class.size:
+                continue
+            tenant = min(
+                queue_class.tenants, key=lambda name: queue_class.tenants[name][0][:2]
+            )
+            finish, _sequence, item = queue_class.tenants[tenant].popleft()
+            queue_class.virtual_time = finish
+            self._drop(queue_class, tenant, item)
+            return item
+        return None
+
+    def remove(self, item: T) -> bool:
+        """Remove ``item`` wherever it is queued; return whether it was found."""
+
+        location = self._index.get(item)
+        if location is None:
+            return False
+        rank, tenant = location
+        queue_class = self._classes[rank]
+        entries = queue_class.tenants[tenant]
+        for entry in entries:
+            if entry[2] is item:
+                entries.remove(entry)
+                break
+        # The abandoned request was never served: do not charge its tenant.
+        queue_class.last_finish[tenant] = (
+            entries[-1][0] if entries else queue_class.virtual_time
+        )
+        self._drop(queue_class, tenant, item)
+        return True
+
+    def pop_lowest(self, below: int) -> T | None:
+        """Remove the newest item of the least urgent class ranked after ``below``.
+
+        Used to make room for a more urgent request when the queue is full.
+        """
+
+        for rank in range(len(self._classes) - 1, below, -1):
+            queue_class = self._classes[rank]
+            if not queue_class.size:
+                continue
+            tenant = max(
+                queue_class.tenants, key=lambda name: queue_class.tenants[name][-1][:2]
+            )
+            entries = queue_class.tenants[tenant]
+            _finish, _sequence, item = entries.pop()
+            # Give the evicted request's share back to its tenant.
+            queue_class.last_finish[tenant] = (
+                entries[-1][0] if entries else queue_class.virtual_time
+            )
+            self._drop(queue_class, tenant, item)
+            return item
+        return None
+
+    def sizes(self) -> dict[str, int]:
+        """Return the number of queued items per priority class."""
+
+        return {
+            name: queue_class.size
+            for name, queue_class in zip(self.priorities, self._classes)
+        }
+
+    def _drop(self, queue_class: _Class[T], tenant: str, item: T) -> None:
+        del self._index[item]
+        queue_class.size -= 1
+        if not queue_class.tenants[tenant]:
+            del queue_class.tenants[tenant]
+            # An idle tenant restarts at the current virtual time.
+            if queue_class.last_finish.get(tenant, 0.0) <= queue_class.virtual_time:
+                queue_class.last_finish.pop(tenant, None)
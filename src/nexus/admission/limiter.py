@@ -0,0 +1,270 @@
+"""Concurrency limiting with a bounded, prioritised wait queue."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Sequence
+
+from ..dispatch.deadline import Deadline, DeadlineExceededError
+from .fair_queue import FairQueue
+
+# Smoothing for the service and queue-wait averages used in Retry-After.
+_EWMA_ALPHA = 0.2
+
+
+class AdmissionRejectedError(RuntimeError):
+    """Raised when a request cannot be admitted to the backend in time.
+
+    ``status_code`` is 429 when the wait queue is full and 503 when the
+    request waited longer than allowed; ``retry_after`` estimates in seconds
+    when a retry is likely to be admitted.
+    """
+
+    def __init__(self, message: str, *, status_code: int, retry_after: float) -> None:
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+class Permit:
+    """A slot held on a :class:`ConcurrencyLimiter`; release it exactly once."""
+
+    def __init__(self, limiter: "ConcurrencyLimiter", started: float) -> None:
+        self._limiter = limiter
+        self._started = started
+        self._released = False
+
+    def release(self) -> None:
+        if not self._released:
+            self._released = True
+            self._limiter._release(self._started)
+
+
+class ConcurrencyLimiter:
+    """Admit at most ``limit`` concurrent requests and queue the rest.
+
+    Up to ``max_queue`` requests wait for at most ``max_wait`` seconds, in
+    the order chosen by ``queue`` (FIFO unless priorities or tenants are
+    given). Beyond that requests are rejected immediately (429) or once
+    their wait expires (503) instead of piling onto the backend. When the
+    queue is full, a request may displace a queued one of lower priority.
+    A request with a deadline waits no longer than the deadline allows.
+    """
+
+    def __init__(
+        self,
+        limit: int,
+        *,
+        max_queue: int,
+        max_wait: float,
+        queue: FairQueue[asyncio.Future[None]] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._limit = limit
+        self._max_queue = max_queue
+        self._max_wait = max_wait
+        self._clock = clock
+        self._in_flight = 0
+        self._waiters: FairQueue[asyncio.Future[None]] = (
+            queue if queue is not None else FairQueue()
+        )
+        self._service_time: float | None = None
+        self._wait_time = 0.0
+        self._max_wait_seen = 0.0
+        self._admitted = 0
+        self._rejected_full = 0
+        self._rejected_timeout = 0
+        self._rejected_deadline = 0
+
+    @property
+    def limit(self) -> int:
+        return self._limit
+
+    def set_limit(self, limit: int) -> None:
+        """Change the limit; a higher limit admits queued requests at once."""
+
+        self._limit = max(limit, 1)
+        self._grant()
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+    async def acquire(
+        self,
+        *,
+        priority: str | None = None,
+        tenant: str | None = None,
+        deadline: Deadline | None = None,
+    ) -> Permit:
+        """Wait for a slot and return its permit.
+
+        ``priority`` names the request's class and ``tenant`` the identity it
+        is fairly queued under; both fall back to the queue's defaults.
+
+        Raises:
+            AdmissionRejectedError: If the queue is full or the wait expires.
+            DeadlineExceededError: If ``deadline`` passes before admission.
+        """
+
+        if deadline is not None and deadline.expired:
+            self._rejected_deadline += 1
+            raise DeadlineExceededError()
+        enqueued = self._clock()
+        if self._in_flight < self._limit and not self._waiters:
+            self._in_flight += 1
+            return self._admit(enqueued)
+        if len(self._waiters) >= self._max_queue:
+            # Either this request or a queued one of a lower class is shed.
+            self._rejected_full += 1
+            displaced = self._waiters.pop_lowest(self._waiters.rank(priority))
+            if displaced is None:
+                raise self._queue_full_error()
+            displaced.set_exception(self._queue_full_error())
+
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.push(waiter, priority=priority, tenant=tenant)
+        max_wait = self._max_wait
+        if deadline is not None:
+            max_wait = min(max_wait, deadline.remaining())
+        try:
+            await asyncio.wait({waiter}, timeout=max_wait)
+        except BaseException:
+            self._abandon(waiter)
+            raise
+        if not waiter.done():
+            self._abandon(waiter)
+            if max_wait < self._max_wait:
+                self._rejected_deadline += 1
+                raise DeadlineExceededError()
+            self._rejected_timeout += 1
+            raise AdmissionRejectedError(
+                "Timed out waiting for backend capacity",
+                status_code=503,
+                retry_after=self.retry_after(),
+            )
+        waiter.result()  # raises if a more urgent request displaced this one
+        return self._admit(enqueued)
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[Permit]:
+        """Hold a slot for the duration of the ``async with`` block."""
+
+        permit = await self.acquire()
+        try:
+            yield permit
+        finally:
+            permit.release()
+
+    def retry_after(self) -> float:
+        """Estimate seconds until a new request would be admitted."""
+
+        service_time = self._service_time or 1.0
+        backlog = len(self._waiters) + 1
+        return max(service_time * backlog / max(self._limit, 1), 1.0)
+
+    def stats(self) -> dict[str, Any]:
+        """Return counters and gauges for monitoring."""
+
+        return {
+            "limit": self._limit,
+            "in_flight": self._in_flight,
+            "queued": len(self._waiters),
+            "queued_by_priority": self._waiters.sizes(),
+            "admitted": self._admitted,
+            "rejected_queue_full": self._rejected_full,
+            "rejected_timeout": self._rejected_timeout,
+            "rejected_deadline": self._rejected_deadline,
+            "queue_wait_avg_seconds": self._wait_time,
+            "queue_wait_max_seconds": self._max_wait_seen,
+        }
+
+    def _admit(self, enqueued: float) -> Permit:
+        now = self._clock()
+        waited = now - enqueued
+        self._admitted += 1
+        self._wait_time += _EWMA_ALPHA * (waited - self._wait_time)
+        self._max_wait_seen = max(self._max_wait_seen, waited)
+        return Permit(self, now)
+
+    def _queue_full_error(self) -> AdmissionRejectedError:
+        return AdmissionRejectedError(
+            "Backend is saturated and the admission queue is full",
+            status_code=429,
+            retry_after=self.retry_after(),
+        )
+
+    def _abandon(self, waiter: asyncio.Future[None]) -> None:
+        if waiter.done():
+            if not waiter.cancelled() and waiter.exception() is None:
+                # The slot was handed over just as the waiter gave up: pass it on.
+                self._release_slot()
+            return
+        waiter.cancel()
+        self._waiters.remove(waiter)
+
+    def _release(self, started: float) -> None:
+        held = self._clock() - started
+        if self._service_time is None:
+            self._service_time = held
+        else:
+            self._service_time += _EWMA_ALPHA * (held - self._service_time)
+        self._release_slot()
+
+    def _release_slot(self) -> None:
+        self._in_flight -= 1
+        self._grant()
+
+    def _grant(self) -> None:
+        """Hand free slots to queued waiters in queue order."""
+
+        while self._waiters and self._in_flight < self._limit:
+            waiter = self._waiters.pop()
+            if waiter is None or waiter.done():
+                continue
+            self._in_flight += 1
+            waiter.set_result(None)
+
+
+class PermitGroup:
+    """Permits held on several limiters at once, released together."""
+
+    def __init__(self, permits: Sequence[Permit]) -> None:
+        self._permits = list(permits)
+
+    def release(self) -> None:
+        for permit in reversed(self._permits):
+            permit.release()
+
+
+async def acquire_all(
+    limiters: Sequence[ConcurrencyLimiter],
+    *,
+    priority: str | None = None,
+    tenant: str | None = None,
+    deadline: Deadline | None = None,
+) -> PermitGroup:
+    """Acquire a slot on each of ``limiters`` in order.
+
+    Slots already taken are given back if a later limiter rejects the
+    request, so a request stuck behind one bulkhead never holds another.
+    """
+
+    permits: list[Permit] = []
+    try:
+        for limiter in limiters:
+            permits.append(
+                await limiter.acquire(
+                    priority=priority, tenant=tenant, deadline=deadline
+                )
+            )
+    except BaseException:
+        PermitGroup(permits).release()
+        raise
+    return PermitGroup(permits)
@@ -0,0 +1,326 @@
+"""Per-tenant token budgets metered in LLM tokens rather than requests."""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+from ..dispatch.deadline import Deadline, DeadlineExceededError
+from ..protocols.token_bucket_store_protocol import TokenBucketStoreProtocol
+from .limiter import AdmissionRejectedError
+
+# Rough prompt overhead per message (role, separators) and characters per
+# token for English text; only used until the backend reports real usage.
+_TOKENS_PER_MESSAGE = 4
+_CHARS_PER_TOKEN = 4
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS buckets (
+    key TEXT PRIMARY KEY,
+    tokens REAL NOT NULL,
+    updated_at REAL NOT NULL
+)
+"""
+
+
+def estimate_prompt_tokens(messages: Any) -> int:
+    """Estimate the prompt tokens of ``messages`` from their text length."""
+
+    if isinstance(messages, str):
+        return math.ceil(len(messages) / _CHARS_PER_TOKEN) + _TOKENS_PER_MESSAGE
+    chars = 0
+    count = 0
+    for message in messages or ():
+        count += 1
+        content = message.get("content") if isinstance(message, dict) else message
+        if isinstance(content, list):
+            content = " ".join(
+                str(part.get("text", "")) if isinstance(part, dict) else str(part)
+                for part in content
+            )
+        chars += len(str(content or ""))
+    return math.ceil(chars / _CHARS_PER_TOKEN) + _TOKENS_PER_MESSAGE * count
+
+
+def _refill_and_take(
+    tokens: float | None,
+    updated_at: float,
+    now: float,
+    *,
+    cost: float,
+    required: float,
+    rate: float,
+    burst: float,
+) -> tuple[float, float]:
+    """Return the bucket's new level and the wait (``0`` if ``cost`` was taken)."""
+
+    if tokens is None:
+        tokens = burst
+    else:
+        tokens = min(burst, tokens + max(now - updated_at, 0.0) * rate)
+    if tokens < required:
+        return tokens, (required - tokens) / rate
+    return min(burst, tokens - cost), 0.0
+
+
+def _refill_period(rate: float, burst: float) -> float:
+    """Seconds an empty bucket takes to refill; full buckets are swept as often."""
+
+    return burst / rate if rate > 0 else math.inf
+
+
+class MemoryTokenBucketStore:
+    """Token buckets held in process memory.
+
+    A full bucket behaves exactly like a missing one, so buckets are dropped
+    once they refill: on their own debit, and by a sweep at most once per
+    refill period. Tenant names come from clients and would otherwise
+    accumulate forever.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self._buckets: dict[str, tuple[float, float]] = {}
+        self._next_sweep = -math.inf
+
+    async def take(
+        self, key: str, cost: float, *, required: float, rate: float, burst: float
+    ) -> float:
+        now = self._clock()
+        if now >= self._next_sweep:
+            self._sweep(now, rate, burst)
+        tokens, updated_at = self._buckets.get(key, (None, now))
+        tokens, wait = _refill_and_take(
+            tokens,
+            updated_at,
+            now,
+            cost=cost,
+            required=required,
+            rate=rate,
+            burst=burst,
+        )
+        if tokens >= burst:
+            self._buckets.pop(key, None)
+        else:
+            self._buckets[key] = (tokens, now)
+        return wait
+
+    async def aclose(self) -> None:
+        self._buckets.clear()
+
+    def _sweep(self, now: float, rate: float, burst: float) -> None:
+        self._buckets = {
+            key: (tokens, updated_at)
+            for key, (tokens, updated_at) in self._buckets.items()
+            if tokens + (now - updated_at) * rate < burst
+        }
+        self._next_sweep = now + _refill_period(rate, burst)
+
+
+class SQLiteTokenBucketStore:
+    """Token buckets in a SQLite file shared by every worker on a host.
+
+    Each debit is a read-modify-write inside ``BEGIN IMMEDIATE``, so
+    concurrent workers never spend the same tokens twice. Levels are
+    refilled from wall-clock time, which every process agrees on. Rows are
+    deleted once their bucket is full again, as in
+    :class:`MemoryTokenBucketStore`.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        busy_timeout: float = 5.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._path = Path(path)
+        self._busy_timeout = busy_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._connection: sqlite3.Connection | None = None
+        self._next_sweep = -math.inf
+
+    async def take(
+        self, key: str, cost: float, *, required: float, rate: float, burst: float
+    ) -> float:
+        return await asyncio.to_thread(
+            self._take, key, cost, required=required, rate=rate, burst=burst
+        )
+
+    async def aclose(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(
+                self._path,
+                timeout=self._busy_timeout,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(_SCHEMA)
+            self._connection = connection
+        return self._connection
+
+    def _take(
+        self, key: str, cost: float, *, required: float, rate: float, burst: float
+    ) -> float:
+        with self._lock:
+            connection = self._connect()
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                now = self._clock()
+                if now >= self._next_sweep:
+                    connection.execute(
+                        "DELETE FROM buckets"
+                        " WHERE tokens + (? - updated_at) * ? >= ?",
+                        (now, rate, burst),
+                    )
+                    self._next_sweep = now + _refill_period(rate, burst)
+                row = connection.execute(
+                    "SELECT tokens, updated_at FROM buckets WHERE key = ?", (key,)
+                ).fetchone()
+                tokens, updated_at = row if row is not None else (None, now)
+                tokens, wait = _refill_and_take(
+                    tokens,
+                    updated_at,
+                    now,
+                    cost=cost,
+                    required=required,
+                    rate=rate,
+                    burst=burst,
+                )
+                if tokens >= burst:
+                    connection.execute("DELETE FROM buckets WHERE key = ?", (key,))
+                else:
+                    connection.execute(
+                        "INSERT OR REPLACE INTO buckets VALUES (?, ?, ?)",
+                        (key, tokens, now),
+                    )
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+        return wait
+
+
+class TokenReservation:
+    """Tokens debited for one request, reconciled once its usage is known."""
+
+    def __init__(self, limiter: "TokenRateLimiter", key: str, estimate: int) -> None:
+        self._limiter = limiter
+        self._key = key
+        self.estimate = estimate
+        self._settled = False
+
+    async def settle(self, actual: int | None) -> None:
+        """Charge the difference between ``actual`` and the estimate.
+
+        ``None`` (usage unknown) keeps the estimate. Only the first call
+        has an effect.
+        """
+
+        if self._settled or actual is None:
+            return
+        self._settled = True
+        delta = actual - self.estimate
+        if delta:
+            await self._limiter._adjust(self._key, delta)
+
+
+class TokenRateLimiter:
+    """Per-tenant token buckets refilled at ``tokens_per_minute``.
+
+    A request debits its estimated prompt tokens at admission and is
+    reconciled against the reported usage on completion, so tenants pay
+    for what they actually consumed (and may go briefly into debt). When a
+    tenant's bucket cannot cover the estimate, the request waits up to
+    ``max_wait`` seconds for a refill, then gets a 429 with ``Retry-After``.
+    Requests larger than ``burst`` only need a full bucket.
+    """
+
+    def __init__(
+        self,
+        store: TokenBucketStoreProtocol,
+        *,
+        tokens_per_minute: int,
+        burst: int | None = None,
+        max_wait: float = 0.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._store = store
+        self._rate = tokens_per_minute / 60.0
+        self._burst = float(burst or tokens_per_minute)
+        self._max_wait = max_wait
+        self._clock = clock
+        self._reserved = 0
+        self._rejected = 0
+        self._waited = 0
+
+    async def reserve(
+        self, tenant: str, estimate: int, *, deadline: Deadline | None = None
+    ) -> TokenReservation:
+        """Debit ``estimate`` tokens from ``tenant``'s bucket.
+
+        Raises:
+            AdmissionRejectedError: If the budget stays exhausted for longer
+                than ``max_wait``.
+            DeadlineExceededError: If the refill would arrive after
+                ``deadline``.
+        """
+
+        required = min(estimate, self._burst)
+        give_up_at = self._clock() + self._max_wait
+        waited = False
+        while True:
+            wait = await self._store.take(
+                tenant, estimate, required=required, rate=self._rate, burst=self._burst
+            )
+            if wait <= 0:
+                break
+            if self._clock() + wait > give_up_at:
+                self._rejected += 1
+                raise AdmissionRejectedError(
+                    "Token budget exhausted",
+                    status_code=429,
+                    retry_after=max(wait, 1.0),
+                )
+            if deadline is not None and wait >= deadline.remaining():
+                self._rejected += 1
+                raise DeadlineExceededError()
+            waited = True
+            await asyncio.sleep(wait)
+        self._reserved += 1
+        self._waited += waited
+        return TokenReservation(self, tenant, estimate)
+
+    def stats(self) -> dict[str, Any]:
+        """Return counters for monitoring."""
+
+        return {
+            "tokens_per_minute": self._rate * 60,
+            "burst": self._burst,
+            "reserved": self._reserved,
+            "waited": self._waited,
+            "rejected": self._rejected,
+        }
+
+    async def aclose(self) -> None:
+        await self._store.aclose()
+
+    async def _adjust(self, key: str, delta: float) -> None:
+        await self._store.take(
+            key, delta, required=-math.inf, rate=self._rate, burst=self._burst
+        )
@@ -0,0 +1,127 @@
+"""Cancel upstream work as soon as the HTTP client goes away."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, AsyncIterator, Awaitable, Callable, TypeVar
+
+from starlette.requests import ClientDisconnect
+from starlette.types import Receive
+
+T = TypeVar("T")
+
+
+class DisconnectCounter:
+    """Count requests whose upstream work was cancelled by a client disconnect."""
+
+    def __init__(self) -> None:
+        self.completions = 0
+        self.streams = 0
+
+    def stats(self) -> dict[str, int]:
+        return {"completions": self.completions, "streams": self.streams}
+
+
+async def wait_for_disconnect(receive: Receive) -> None:
+    """Return once the ASGI server reports that the client disconnected.
+
+    Must only be used after the request body has been read, since it
+    consumes any further ``receive`` messages.
+    """
+
+    while (await receive())["type"] != "http.disconnect":
+        pass
+
+
+async def cancel_on_disconnect(
+    receive: Receive,
+    call: Callable[[], Awaitable[T]],
+    on_cancel: Callable[[], None] | None = None,
+) -> T:
+    """Await ``call()``, cancelling it if the client disconnects first.
+
+    The cancelled work is awaited so its cleanup (backend request, admission
+    permit) finishes before :class:`ClientDisconnect` is raised.
+    """
+
+    work = asyncio.ensure_future(call())
+    watcher = asyncio.ensure_future(wait_for_disconnect(receive))
+    try:
+        await asyncio.wait({work, watcher}, return_when=asyncio.FIRST_COMPLETED)
+    except BaseException:
+        work.cancel()
+        raise
+    finally:
+        watcher.cancel()
+    if not work.done():
+        await _cancel(work)
+        if on_cancel is not None:
+            on_cancel()
+        raise ClientDisconnect()
+    return work.result()
+
+
+async def stop_on_disconnect(
+    receive: Receive,
+    events: AsyncIterator[T],
+    on_cancel: Callable[[], None] | None = None,
+) -> AsyncIterator[T]:
+    """Relay ``events`` until they end or the client disconnects.
+
+    One watcher task per stream waits for the disconnect and cancels the task
+    consuming this generator while it awaits the next event, so a backend
+    that is still prefilling or pausing between tokens is cancelled right
+    away instead of when the next chunk fails to send.
+    """
+
+    consumer: asyncio.Task[Any] | None = None
+    disconnected = False
+
+    async def _watch() -> None:
+        nonlocal disconnected
+        await wait_for_disconnect(receive)
+        disconnected = True
+        if consumer is not None:
+            consumer.cancel()
+
+    iterator = events.__aiter__()
+    watcher = asyncio.ensure_future(_watch())
+    try:
+        while not disconnected:
+            consumer = asyncio.current_task()
+            try:
+                event = await iterator.__anext__()
+            except StopAsyncIteration:
+                return
+            except asyncio.CancelledError:
+                if not disconnected:
+                    raise
+                _uncancel(consumer)
+                break
+            finally:
+                consumer = None
+            yield event
+        if on_cancel is not None:
+            on_cancel()
+    finally:
+        watcher.cancel()
+        aclose = getattr(iterator, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+
+def _uncancel(task: asyncio.Task[Any] | None) -> None:
+    """Withdraw a cancellation request this module made (Python 3.11+)."""
+
+    uncancel = getattr(task, "uncancel", None)
+    if uncancel is not None:
+        uncancel()
+
+
+async def _cancel(task: asyncio.Future[Any]) -> None:
+    """Cancel ``task`` and wait for it, discarding whatever it ends with."""
+
+    task.cancel()
+    await asyncio.wait({task})
+    if not task.cancelled():
+        task.exception()
@@ -1,11 +1,40 @@
 """FastAPI application entry point for the template."""
 
+import asyncio
+import logging
+import math
+import signal
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from importlib import metadata
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, Response
+from pydantic import ValidationError
+from starlette.requests import ClientDisconnect
 
+from ..admission import AdmissionRejectedError
+from ..cache import IdempotencyConflictError, StreamExpiredError
+from ..dependencies import (
+    get_app_settings,
+    get_client_registry,
+    get_idempotency_store,
+    get_mlx_http_pool,
+    get_mlx_settings,
+    get_response_cache_store,
+    get_stream_replay_store,
+    get_token_budgets,
+    reload_settings,
+)
+from ..dispatch import (
+    BackendTimeoutError,
+    DeadlineExceededError,
+    NoHealthyReplicaError,
+)
 from .router import router
 
+LOGGER = logging.getLogger(__name__)
+
 
 def get_app_version(package_name: str, fallback_version: str = "0.1.0") -> str:
     """
@@ -22,9 +51,122 @@ def get_app_version(package_name: str, fallback_version: str = "0.1.0") -> str:
         return fallback_version
 
 
+def _reload_settings_on_signal() -> None:
+    try:
+        reload_settings()
+    except ValidationError:
+        LOGGER.exception("Ignoring SIGHUP reload: configuration is invalid")
+
+
+def _install_reload_signal_handler() -> bool:
+    if not hasattr(signal, "SIGHUP"):
+        return False
+    try:
+        asyncio.get_running_loop().add_signal_handler(
+            signal.SIGHUP, _reload_settings_on_signal
+        )
+    except (NotImplementedError, RuntimeError, ValueError):
+        # Not supported on this platform or outside the main thread.
+        return False
+    return True
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    """Open shared backend resources on startup and close them on shutdown."""
+    settings = get_app_settings()
+    if settings.llm_backend.lower() == "mlx" and not settings.use_mock_mlx:
+        pool = get_mlx_http_pool()
+        for url, _weight in get_mlx_settings().replica_endpoints():
+            pool.get(url)
+    sighup_installed = _install_reload_signal_handler()
+    try:
+        yield
+    finally:
+        if sighup_installed:
+            asyncio.get_running_loop().remove_signal_handler(signal.SIGHUP)
+        await get_client_registry().aclose()
+        await get_mlx_http_pool().aclose()
+        get_mlx_http_pool.cache_clear()
+        if get_response_cache_store.cache_info().currsize:
+            await get_response_cache_store().aclose()
+            get_response_cache_store.cache_clear()
+        if get_token_budgets.cache_info().currsize:
+            await get_token_budgets().aclose()
+            get_token_budgets.cache_clear()
+        if get_idempotency_store.cache_info().currsize:
+            await get_idempotency_store().aclose()
+            get_idempotency_store.cache_clear()
+        if get_stream_replay_store.cache_info().currsize:
+            await get_stream_replay_store().aclose()
+            get_stream_replay_store.cache_clear()
+
+
 app = FastAPI(
     title="Nexus API",
     description="Configurable FastAPI service that mediates LLM inference",
     version=get_app_version("nexus"),
+    lifespan=lifespan,
 )
 app.include_router(router)
+
+
+@app.exception_handler(NoHealthyReplicaError)
+async def no_healthy_replica_handler(
+    _request: Request, exc: NoHealthyReplicaError
+) -> JSONResponse:
+    """Fail fast with 503 while every backend replica's circuit is open."""
+    return JSONResponse(
+        status_code=503,
+        content={"detail": str(exc)},
+        headers={"Retry-After": str(max(math.ceil(exc.retry_after), 1))},
+    )
+
+
+@app.exception_handler(DeadlineExceededError)
+@app.exception_handler(BackendTimeoutError)
+async def timeout_handler(
+    _request: Request, exc: DeadlineExceededError
+) -> JSONResponse:
+    """Answer 504 when the request deadline passes or a backend stalls."""
+    return JSONResponse(status_code=exc.status_code, content={"detail": str(exc)})
+
+
+@app.exception_handler(AdmissionRejectedError)
+async def admission_rejected_handler(
+    _request: Request, exc: AdmissionRejectedError
+) -> JSONResponse:
+    """Shed load quickly with 429/503 when the backend queue is saturated."""
+    return JSONResponse(
+        status_code=exc.status_code,
+        content={"detail": str(exc)},
+        headers={"Retry-After": str(max(math.ceil(exc.retry_after), 1))},
+    )
+
+
+@app.exception_handler(StreamExpiredError)
+async def stream_expired_handler(
+    _request: Request, exc: StreamExpiredError
+) -> JSONResponse:
+    """Tell a reconnecting client its stream can no longer be resumed."""
+    return JSONResponse(status_code=exc.status_code, content={"detail": str(exc)})
+
+
+@app.exception_handler(IdempotencyConflictError)
+async def idempotency_conflict_handler(
+    _request: Request, exc: IdempotencyConflictError
+) -> JSONResponse:
+    """Refuse to reuse an idempotency key for a different request body."""
+    return JSONResponse(status_code=exc.status_code, content={"detail": str(exc)})
+
+
+@app.exception_handler(ClientDisconnect)
+async def client_disconnect_handler(
+    _request: Request, _exc: ClientDisconnect
+) -> Response:
+    """Answer requests abandoned by their client without logging a server error.
+
+    The client is gone, so the 499 (client closed request) only shows up in
+    access logs.
+    """
+    return Response(status_code=499)
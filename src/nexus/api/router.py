@@ -2,27 +2,119 @@
 
 from __future__ import annotations
 
+import hashlib
+import hmac
 import inspect
 import json
+import math
+import re
 import time
 import uuid
-from typing import Any, AsyncIterator, Dict, List
+from functools import partial
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List
 
-from fastapi import APIRouter, Depends
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import Response, StreamingResponse
+from pydantic import ValidationError
 
-from ..dependencies import get_llm_client
+from ..admission import (
+    ConcurrencyLimiter,
+    PermitGroup,
+    TokenRateLimiter,
+    TokenReservation,
+    acquire_all,
+    estimate_prompt_tokens,
+)
+from ..admission.fair_queue import DEFAULT_TENANT
+from ..cache import (
+    IdempotencyStore,
+    SingleFlight,
+    StreamExpiredError,
+    StreamMulticast,
+    StreamReplayStore,
+    SubscriberLaggedError,
+    completion_cache_key,
+)
+from ..config import NexusSettings
+from ..dependencies import (
+    ModelLimiterLookup,
+    get_admission_controller,
+    get_admission_settings,
+    get_app_settings,
+    get_backend_limiter,
+    get_disconnect_counter,
+    get_idempotency,
+    get_llm_client,
+    get_model_limiter,
+    get_response_cache,
+    get_single_flight,
+    get_stream_buffer_budget,
+    get_stream_multicast,
+    get_stream_replay,
+    get_token_budgets,
+    get_token_rate_limiter,
+    reload_settings,
+)
+from ..dispatch.deadline import (
+    Deadline,
+    DeadlineExceededError,
+    StreamTimer,
+    wait_within,
+)
 from ..protocols.llm_client_protocol import LLMClientProtocol
-from .models import (
-    ChatCompletionChoice,
-    ChatCompletionMessage,
-    ChatCompletionRequest,
-    ChatCompletionResponse,
-    Usage,
+from ..protocols.response_cache_protocol import ResponseCacheProtocol
+from .disconnect import cancel_on_disconnect, stop_on_disconnect
+from .models import ChatCompletionRequest, ChatCompletionResponse
+from .serialization import JSONBytesResponse, dumps
+from .sse import (
+    DONE_EVENT,
+    buffer_events,
+    coalesce_events,
+    encode_header_members,
+    format_sse,
+    prime_events,
+    splice_header,
 )
 
 router = APIRouter()
 
+AcquirePermit = Callable[[], Awaitable[PermitGroup]]
+ReserveTokens = Callable[[], Awaitable[TokenReservation]]
+RunIdempotent = Callable[
+    [Callable[[], Awaitable[bytes]]], Awaitable[tuple[bytes, bool]]
+]
+
+# Ask intermediaries not to buffer the event stream so tokens reach the client
+# as soon as the backend emits them.
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+# Reports whether a cacheable completion was served from the response cache
+# ("hit") or generated ("miss"); sending "bypass" skips the cache lookup.
+CACHE_STATUS_HEADER = "X-Nexus-Cache"
+
+# Admission scheduling identity; the same names are accepted as extra body
+# fields. Without a tenant, requests are grouped by their bearer token.
+PRIORITY_HEADER = "X-Nexus-Priority"
+TENANT_HEADER = "X-Nexus-Tenant"
+_ADMISSION_FIELDS = frozenset({"priority", "tenant"})
+
+# Sent by a reconnecting SSE client to continue a resumable stream after the
+# last event it received.
+LAST_EVENT_ID_HEADER = "Last-Event-ID"
+
+# Retries sending the same key get the first request's response instead of a
+# new generation; replayed responses are marked with the second header.
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+IDEMPOTENT_REPLAYED_HEADER = "Idempotent-Replayed"
+IDEMPOTENCY_KEY_MAX_LENGTH = 255
+
+# Seconds the caller is willing to wait for the whole request; it can only
+# shorten the configured NEXUS_REQUEST_TIMEOUT.
+TIMEOUT_HEADER = "X-Nexus-Timeout"
+
+# Finds the usage total in a relayed chunk without parsing the whole payload.
+_TOTAL_TOKENS = re.compile(rb'"total_tokens"\s*:\s*(\d+)')
+
 
 @router.get("/health")
 async def health_check() -> dict[str, str]:
@@ -30,36 +122,633 @@ async def health_check() -> dict[str, str]:
     return {"status": "ok"}
 
 
+def _require_admin(
+    http_request: Request, settings: NexusSettings = Depends(get_app_settings)
+) -> None:
+    """Allow admin endpoints only with the configured bearer token.
+
+    Without ``NEXUS_ADMIN_TOKEN`` the endpoints are disabled (404).
+    """
+
+    if not settings.admin_token:
+        raise HTTPException(status_code=404, detail="Not Found")
+    scheme, _, token = http_request.headers.get("authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not hmac.compare_digest(
+        token.strip().encode(), settings.admin_token.encode()
+    ):
+        raise HTTPException(
+            status_code=401,
+            detail="Invalid admin token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+
+@router.post("/admin/reload", dependencies=[Depends(_require_admin)])
+async def reload_configuration() -> dict[str, str]:
+    """Re-read settings from the environment and ``.env`` file atomically."""
+    try:
+        snapshot = reload_settings()
+    except ValidationError as exc:
+        raise HTTPException(
+            status_code=422, detail=f"Invalid configuration: {exc}"
+        ) from exc
+    return {"status": "reloaded", "fingerprint": snapshot.fingerprint}
+
+
+@router.get("/admin/metrics", dependencies=[Depends(_require_admin)])
+async def get_metrics() -> dict[str, Any]:
+    """Return admission, token budget and client disconnect counters."""
+    metrics: dict[str, Any] = {
+        "admission": get_admission_controller().stats(),
+        "client_disconnects": get_disconnect_counter().stats(),
+    }
+    if get_app_settings().sse_buffer_max_bytes > 0:
+        metrics["stream_buffer"] = get_stream_buffer_budget().stats()
+    if get_admission_settings().tokens_per_minute > 0:
+        metrics["token_budgets"] = get_token_budgets().stats()
+    return metrics
+
+
 @router.post("/v1/chat/completions", response_model=ChatCompletionResponse)
 async def create_chat_completion(
     request: ChatCompletionRequest,
+    http_request: Request,
     llm_client: LLMClientProtocol = Depends(get_llm_client),
-) -> ChatCompletionResponse | StreamingResponse:
+    settings: NexusSettings = Depends(get_app_settings),
+    response_cache: ResponseCacheProtocol | None = Depends(get_response_cache),
+    single_flight: SingleFlight | None = Depends(get_single_flight),
+    multicast: StreamMulticast | None = Depends(get_stream_multicast),
+    limiter: ConcurrencyLimiter | None = Depends(get_backend_limiter),
+    model_limiter: ModelLimiterLookup = Depends(get_model_limiter),
+    token_limiter: TokenRateLimiter | None = Depends(get_token_rate_limiter),
+    replay: StreamReplayStore | None = Depends(get_stream_replay),
+    idempotency: IdempotencyStore | None = Depends(get_idempotency),
+) -> ChatCompletionResponse | Response:
     """Create a chat completion compatible with the OpenAI Chat Completions API."""
 
+    last_event_id = http_request.headers.get(LAST_EVENT_ID_HEADER)
+    if replay is not None and last_event_id and request.stream:
+        # The generation was admitted and metered when it started.
+        return await _event_stream_response(
+            _stop_on_disconnect(http_request, replay.resume(last_event_id)),
+            settings,
+            buffered=False,
+        )
+
+    deadline = _request_deadline(http_request, settings)
+    if deadline is not None:
+        # Drop work whose caller has already given up.
+        deadline.check()
+    priority, tenant = _request_identity(http_request, request)
+    # The model's bulkhead is entered first so a saturated model waits in its
+    # own queue without occupying the backend's shared slots.
+    acquire = _admission([model_limiter(request.model), limiter], priority, tenant)
+    reserve = None
+    if token_limiter is not None:
+        reserve = partial(
+            token_limiter.reserve,
+            tenant or DEFAULT_TENANT,
+            estimate_prompt_tokens(request.messages),
+        )
+    scope = None
+    if idempotency is not None:
+        scope = await _idempotency_scope(http_request, tenant)
+    passthrough = _supports_passthrough(llm_client, request)
+    if scope is not None and request.stream and (replay is None or passthrough):
+        # Only resumable streams can be handed to a retry; refuse the key
+        # rather than silently generating twice.
+        raise HTTPException(
+            status_code=400,
+            detail=(
+                f"{IDEMPOTENCY_KEY_HEADER} on streaming requests requires "
+                "resumable streams and is not supported in passthrough mode"
+            ),
+        )
+    run_idempotent = None
+    if idempotency is not None and scope is not None:
+        run_idempotent = partial(idempotency.complete, *scope)
+    if passthrough:
+        return await _passthrough_chat_completion(
+            llm_client,
+            request,
+            http_request,
+            settings,
+            acquire,
+            reserve,
+            run_idempotent,
+            deadline,
+        )
+
     payload = request.model_dump(exclude_none=True)
+    for name in _ADMISSION_FIELDS:
+        payload.pop(name, None)
     messages = _normalize_messages(payload.pop("messages"))
     model_name = payload.pop("model")
     stream_enabled = payload.pop("stream", False)
     backend_options = payload
 
+    # Only deterministic requests may share results with other requests.
+    request_key: str | None = None
+    shares_results = any(
+        share is not None for share in (response_cache, single_flight, multicast)
+    )
+    if request.temperature == 0 and shares_results:
+        request_key = completion_cache_key(
+            settings.llm_backend, model_name, messages, backend_options
+        )
+
+    cache_key: str | None = None
+    if response_cache is not None and request_key is not None:
+        policy = _cache_policy(http_request)
+        if policy != "skip":
+            cache_key = request_key
+        if policy == "use":
+            cached = await response_cache.get(request_key)
+            if cached is not None:
+                return await _cached_completion_response(
+                    cached, model_name, stream_enabled, settings
+                )
+
     if stream_enabled:
-        return StreamingResponse(
-            _stream_chat_completions(
-                llm_client,
-                messages,
-                model_name,
-                backend_options,
+        shared = multicast is not None and request_key is not None
+        # Generations shared with other requests are not cut short by one
+        # caller's deadline; the caller only stops waiting for them.
+        own_deadline = None if shared or replay is not None else deadline
+        open_stream = partial(
+            _metered_stream,
+            _with_deadline(reserve, own_deadline),
+            partial(
+                _open_admitted_stream,
+                _with_deadline(acquire, own_deadline),
+                partial(
+                    _open_backend_stream,
+                    llm_client,
+                    messages,
+                    model_name,
+                    _backend_options(backend_options, own_deadline),
+                ),
             ),
-            media_type="text/event-stream",
         )
+        if multicast is not None and request_key is not None:
+            open_stream = partial(multicast.subscribe, request_key, open_stream)
+        response_id = _generate_response_id()
+        claimed = False
+        if replay is not None and idempotency is not None and scope is not None:
+            # Streams are shared through the replay buffer: a retry follows the
+            # first request's generation from its first event.
+            resumed = await _resume_claimed_stream(
+                idempotency, replay, scope, response_id
+            )
+            if resumed is not None:
+                return await _event_stream_response(
+                    _stop_on_disconnect(http_request, resumed),
+                    settings,
+                    headers={IDEMPOTENT_REPLAYED_HEADER: "true"},
+                    buffered=False,
+                )
+            claimed = True
+        events = _stream_chat_completions(
+            open_stream, model_name, shared=shared, response_id=response_id
+        )
+        if replay is not None:
+            # The replay buffer already drains the backend ahead of the client.
+            events = replay.start(response_id, events)
+        try:
+            return await _event_stream_response(
+                _stop_on_disconnect(http_request, _guarded_events(events, deadline)),
+                settings,
+                buffered=replay is None,
+            )
+        except Exception:
+            if claimed:
+                # Nothing was sent: a retry generates again instead of
+                # replaying this failure.
+                await idempotency.release(scope[0], response_id.encode())
+            raise
 
-    backend_response = await llm_client.invoke(
-        messages,
-        model=model_name,
-        **backend_options,
+    shared = single_flight is not None and request_key is not None
+    own_deadline = None if shared or run_idempotent is not None else deadline
+
+    def _invoke() -> Awaitable[Any]:
+        return _metered(
+            _with_deadline(reserve, own_deadline),
+            partial(
+                _admitted,
+                _with_deadline(acquire, own_deadline),
+                partial(
+                    llm_client.invoke,
+                    messages,
+                    model=model_name,
+                    **_backend_options(backend_options, own_deadline),
+                ),
+            ),
+            usage=_extract_usage,
+        )
+
+    async def _generate() -> bytes:
+        if single_flight is not None and request_key is not None:
+            backend_response = await single_flight.do(request_key, _invoke)
+        else:
+            backend_response = await _invoke()
+        completion = _build_chat_completion_response(backend_response, model_name)
+        if cache_key is not None:
+            await response_cache.set(
+                cache_key,
+                dumps({"choices": completion["choices"], "usage": completion["usage"]}),
+            )
+        return dumps(completion)
+
+    headers = {CACHE_STATUS_HEADER: "miss"} if cache_key is not None else {}
+    content, replayed = await wait_within(
+        _cancel_on_disconnect(
+            http_request, partial(_run_once, run_idempotent, _generate)
+        ),
+        deadline=deadline,
+    )
+    if replayed:
+        headers[IDEMPOTENT_REPLAYED_HEADER] = "true"
+    # Returning a Response skips FastAPI's response_model re-validation and
+    # jsonable_encoder; ChatCompletionResponse still documents the schema.
+    return JSONBytesResponse(content, headers=headers or None)
+
+
+def _request_deadline(
+    http_request: Request, settings: NexusSettings
+) -> Deadline | None:
+    """Return the request's deadline, if the caller or configuration sets one."""
+
+    timeout = settings.request_timeout or None
+    raw = http_request.headers.get(TIMEOUT_HEADER)
+    if raw is not None:
+        try:
+            requested = float(raw)
+        except ValueError:
+            requested = math.nan
+        if not requested >= 0:
+            raise HTTPException(
+                status_code=400,
+                detail=f"{TIMEOUT_HEADER} must be a non-negative number of seconds",
+            )
+        timeout = requested if timeout is None else min(timeout, requested)
+    return None if timeout is None else Deadline.after(timeout)
+
+
+def _with_deadline(call: Any, deadline: Deadline | None) -> Any:
+    """Bind ``deadline`` to an admission or token budget call, if both are set."""
+
+    if call is None or deadline is None:
+        return call
+    return partial(call, deadline=deadline)
+
+
+def _backend_options(
+    options: Dict[str, Any], deadline: Deadline | None
+) -> Dict[str, Any]:
+    if deadline is None:
+        return options
+    return {**options, "deadline": deadline}
+
+
+def _guarded_events(
+    events: AsyncIterator[bytes], deadline: Deadline | None
+) -> AsyncIterator[bytes]:
+    """End ``events`` at ``deadline`` and turn mid-stream failures into events.
+
+    Before the first event :class:`DeadlineExceededError` propagates, so the
+    caller gets a 504. Once the response has started, a passed deadline or a
+    multicast subscriber that fell behind ends the stream with an SSE error
+    event and ``[DONE]``, and the backend stream is closed.
+    """
+
+    if deadline is not None:
+        events = StreamTimer(deadline=deadline).chunks(events)
+    return _error_terminated_events(events)
+
+
+async def _error_terminated_events(
+    events: AsyncIterator[bytes],
+) -> AsyncIterator[bytes]:
+    started = False
+    # Relayed passthrough bytes may end mid-event; the error event must not be
+    # glued onto the partial one.
+    at_boundary = True
+    try:
+        async for event in events:
+            started = True
+            if event:
+                at_boundary = event.endswith(b"\n\n")
+            yield event
+    except (DeadlineExceededError, SubscriberLaggedError) as exc:
+        if not started:
+            raise
+        kind = (
+            "timeout_error"
+            if isinstance(exc, DeadlineExceededError)
+            else "server_error"
+        )
+        if not at_boundary:
+            yield b"\n\n"
+        yield format_sse({"error": {"message": str(exc), "type": kind}})
+        yield DONE_EVENT
+    finally:
+        await _aclose(events)
+
+
+async def _idempotency_scope(
+    http_request: Request, tenant: str | None
+) -> tuple[str, str] | None:
+    """Return the ``(key, fingerprint)`` of an idempotent request, if it is one.
+
+    Keys are scoped to the tenant so callers cannot collide, and bound to a
+    hash of the request body.
+    """
+
+    key = http_request.headers.get(IDEMPOTENCY_KEY_HEADER, "").strip()
+    if not key:
+        return None
+    if len(key) > IDEMPOTENCY_KEY_MAX_LENGTH:
+        raise HTTPException(
+            status_code=400,
+            detail=(
+                f"{IDEMPOTENCY_KEY_HEADER} must be at most "
+                f"{IDEMPOTENCY_KEY_MAX_LENGTH} characters"
+            ),
+        )
+    fingerprint = hashlib.sha256(await http_request.body()).hexdigest()
+    return f"{tenant or DEFAULT_TENANT}:{key}", fingerprint
+
+
+async def _resume_claimed_stream(
+    idempotency: IdempotencyStore,
+    replay: StreamReplayStore,
+    scope: tuple[str, str],
+    response_id: str,
+) -> AsyncIterator[bytes] | None:
+    """Return the stream a retry follows, or ``None`` if ``response_id`` is claimed.
+
+    The key stays bound for no longer than the stream is resumable; a binding
+    whose stream was evicted from the replay buffer is replaced.
+    """
+
+    while True:
+        claimed = await idempotency.claim(*scope, response_id.encode(), ttl=replay.ttl)
+        if claimed is None:
+            return None
+        try:
+            return replay.resume(claimed.decode() + ":-1")
+        except StreamExpiredError:
+            await idempotency.release(scope[0], claimed)
+
+
+async def _run_once(
+    run_idempotent: RunIdempotent | None, call: Callable[[], Awaitable[bytes]]
+) -> tuple[bytes, bool]:
+    """Return ``call()``'s result and whether it was replayed from a retry."""
+
+    if run_idempotent is None:
+        return await call(), False
+    return await run_idempotent(call)
+
+
+def _cache_policy(http_request: Request) -> str:
+    """Return ``use``, ``refresh`` (skip lookup, store) or ``skip`` (neither)."""
+
+    directives = {
+        directive.strip().lower()
+        for directive in http_request.headers.get("cache-control", "").split(",")
+    }
+    if "no-store" in directives:
+        return "skip"
+    bypass = http_request.headers.get(CACHE_STATUS_HEADER, "").lower() == "bypass"
+    if bypass or "no-cache" in directives:
+        return "refresh"
+    return "use"
+
+
+async def _cached_completion_response(
+    cached: bytes, model_name: str, stream_enabled: bool, settings: NexusSettings
+) -> Response:
+    """Serve a cached ``{"choices", "usage"}`` payload under a fresh id."""
+
+    headers = {CACHE_STATUS_HEADER: "hit"}
+    if stream_enabled:
+        return await _event_stream_response(
+            _replay_cached_completion(json.loads(cached), model_name),
+            settings,
+            headers=headers,
+            buffered=False,
+        )
+    header = dumps(
+        {
+            "id": _generate_response_id(),
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": model_name,
+        }
+    )
+    # Both halves are JSON objects: splice them without re-encoding the body.
+    return JSONBytesResponse(header[:-1] + b"," + cached[1:], headers=headers)
+
+
+async def _replay_cached_completion(
+    completion: Dict[str, Any], model_name: str
+) -> AsyncIterator[bytes]:
+    """Re-emit a cached completion as chat.completion.chunk events."""
+
+    header = {
+        "id": _generate_response_id(),
+        "object": "chat.completion.chunk",
+        "created": int(time.time()),
+        "model": model_name,
+    }
+    for choice in completion["choices"]:
+        message = choice["message"]
+        delta = {key: value for key, value in message.items() if value is not None}
+        if "tool_calls" in delta:
+            delta["tool_calls"] = [
+                {"index": position, **call}
+                for position, call in enumerate(delta["tool_calls"])
+            ]
+        for chunk_delta, finish_reason in (
+            (delta, None),
+            ({}, choice["finish_reason"]),
+        ):
+            yield format_sse(
+                {
+                    **header,
+                    "choices": [
+                        {
+                            "index": choice["index"],
+                            "delta": chunk_delta,
+                            "finish_reason": finish_reason,
+                        }
+                    ],
+                }
+            )
+    yield DONE_EVENT
+
+
+def _supports_passthrough(
+    llm_client: LLMClientProtocol, request: ChatCompletionRequest
+) -> bool:
+    # Bare-string prompts need normalising, so they take the regular path.
+    return bool(getattr(llm_client, "passthrough_enabled", False)) and isinstance(
+        request.messages, list
+    )
+
+
+async def _passthrough_chat_completion(
+    llm_client: Any,
+    request: ChatCompletionRequest,
+    http_request: Request,
+    settings: NexusSettings,
+    acquire: AcquirePermit | None,
+    reserve: ReserveTokens | None,
+    run_idempotent: RunIdempotent | None = None,
+    deadline: Deadline | None = None,
+) -> Response:
+    """Relay the raw request body upstream and the raw response back."""
+
+    body = await http_request.body()
+    provided = request.model_fields_set
+    if not provided.isdisjoint(_ADMISSION_FIELDS):
+        # Nexus-only fields cost one re-encode; other bodies are spliced as-is.
+        body = dumps(
+            {
+                key: value
+                for key, value in json.loads(body).items()
+                if key not in _ADMISSION_FIELDS
+            }
+        )
+        provided = provided.difference(_ADMISSION_FIELDS)
+    defaults = {
+        name: getattr(request, name)
+        for name in ("temperature", "top_p", "max_tokens")
+        if name not in provided and getattr(request, name) is not None
+    }
+
+    if request.stream:
+        open_stream = partial(
+            _metered_stream,
+            _with_deadline(reserve, deadline),
+            partial(
+                _open_admitted_stream,
+                _with_deadline(acquire, deadline),
+                partial(
+                    llm_client.passthrough_stream,
+                    body,
+                    provided,
+                    defaults,
+                    messages=request.messages,
+                    model=request.model,
+                    deadline=deadline,
+                ),
+            ),
+            count=_sse_event_count,
+        )
+        return await _event_stream_response(
+            _stop_on_disconnect(
+                http_request, _guarded_events(_relay_stream(open_stream), deadline)
+            ),
+            settings,
+        )
+
+    # An idempotent call keeps running for retries after its caller left.
+    own_deadline = None if run_idempotent is not None else deadline
+    content, replayed = await wait_within(
+        _cancel_on_disconnect(
+            http_request,
+            partial(
+                _run_once,
+                run_idempotent,
+                partial(
+                    _metered,
+                    _with_deadline(reserve, own_deadline),
+                    partial(
+                        _admitted,
+                        _with_deadline(acquire, own_deadline),
+                        partial(
+                            llm_client.passthrough,
+                            body,
+                            provided,
+                            defaults,
+                            messages=request.messages,
+                            model=request.model,
+                            deadline=own_deadline,
+                        ),
+                    ),
+                    usage=_passthrough_usage,
+                ),
+            ),
+        ),
+        deadline=deadline,
+    )
+    headers = {IDEMPOTENT_REPLAYED_HEADER: "true"} if replayed else None
+    return Response(content=content, media_type="application/json", headers=headers)
+
+
+def _cancel_on_disconnect(
+    http_request: Request, call: Callable[[], Awaitable[Any]]
+) -> Awaitable[Any]:
+    counter = get_disconnect_counter()
+
+    def _count() -> None:
+        counter.completions += 1
+
+    return cancel_on_disconnect(http_request.receive, call, _count)
+
+
+def _stop_on_disconnect(
+    http_request: Request, events: AsyncIterator[bytes]
+) -> AsyncIterator[bytes]:
+    counter = get_disconnect_counter()
+
+    def _count() -> None:
+        counter.streams += 1
+
+    return stop_on_disconnect(http_request.receive, events, _count)
+
+
+async def _relay_stream(
+    open_stream: Callable[[], Awaitable[AsyncIterator[bytes]]],
+) -> AsyncIterator[bytes]:
+    """Open ``open_stream`` on first iteration and relay it unchanged."""
+
+    iterator = await open_stream()
+    try:
+        async for chunk in iterator:
+            yield chunk
+    finally:
+        await _aclose(iterator)
+
+
+async def _event_stream_response(
+    events: AsyncIterator[bytes],
+    settings: NexusSettings,
+    headers: Dict[str, str] | None = None,
+    *,
+    buffered: bool = True,
+) -> StreamingResponse:
+    events = await prime_events(events)
+    if buffered and settings.sse_buffer_max_bytes > 0:
+        # Read the backend ahead of a slow client so its slot frees sooner.
+        events = buffer_events(
+            events,
+            max_bytes=settings.sse_buffer_max_bytes,
+            budget=get_stream_buffer_budget(),
+            overflow=settings.sse_buffer_overflow,
+        )
+    if settings.sse_coalesce_delay_ms > 0:
+        events = coalesce_events(
+            events,
+            max_delay=settings.sse_coalesce_delay_ms / 1000,
+            max_bytes=settings.sse_coalesce_max_bytes,
+        )
+    return StreamingResponse(
+        events,
+        media_type="text/event-stream",
+        headers={**SSE_HEADERS, **(headers or {})},
     )
-    return _build_chat_completion_response(backend_response, model_name)
 
 
 def _normalize_messages(messages: Any) -> List[Dict[str, Any]]:
@@ -68,151 +757,361 @@ def _normalize_messages(messages: Any) -> List[Dict[str, Any]]:
     return list(messages)
 
 
-async def _stream_chat_completions(
+def _request_identity(
+    http_request: Request, request: ChatCompletionRequest
+) -> tuple[str | None, str | None]:
+    """Return the request's ``(priority, tenant)`` for admission scheduling."""
+
+    extras = request.model_extra or {}
+    priority = http_request.headers.get(PRIORITY_HEADER) or extras.get("priority")
+    tenant = http_request.headers.get(TENANT_HEADER) or extras.get("tenant")
+    if not tenant:
+        scheme, _, token = http_request.headers.get("authorization", "").partition(" ")
+        if scheme.lower() == "bearer" and token.strip():
+            digest = hashlib.blake2b(token.strip().encode(), digest_size=8)
+            tenant = f"key-{digest.hexdigest()}"
+    return (str(priority) if priority else None, str(tenant) if tenant else None)
+
+
+def _admission(
+    limiters: List[ConcurrencyLimiter | None],
+    priority: str | None,
+    tenant: str | None,
+) -> AcquirePermit | None:
+    """Bind the request's priority class and tenant to acquiring ``limiters``."""
+
+    active = [limiter for limiter in limiters if limiter is not None]
+    if not active:
+        return None
+    return partial(acquire_all, active, priority=priority, tenant=tenant)
+
+
+async def _metered(
+    reserve: ReserveTokens | None,
+    call: Callable[[], Awaitable[Any]],
+    usage: Callable[[Any], Dict[str, int]] | None = None,
+) -> Any:
+    """Await ``call()`` after debiting the tenant's token budget, if limited.
+
+    With ``usage``, the estimated debit is reconciled against the tokens the
+    backend reports for the result; otherwise the estimate stands. Calls
+    that fail or are cancelled (e.g. rejected by admission) are refunded.
+    """
+
+    if reserve is None:
+        return await call()
+    reservation = await reserve()
+    try:
+        result = await call()
+    except BaseException:
+        await reservation.settle(0)
+        raise
+    if usage is not None:
+        await reservation.settle(usage(result)["total_tokens"] or None)
+    return result
+
+
+async def _metered_stream(
+    reserve: ReserveTokens | None,
+    open_stream: Callable[[], Awaitable[AsyncIterator[Any]]],
+    count: Callable[[Any], int] = lambda chunk: 1,
+) -> AsyncIterator[Any]:
+    """Open a stream that is charged to the tenant's token budget when it closes.
+
+    ``count`` returns the completion tokens a chunk stands for when the
+    backend does not report usage; by default each chunk is one token.
+    Streams that fail or are abandoned before their first chunk are refunded.
+    """
+
+    if reserve is None:
+        return await open_stream()
+    reservation = await reserve()
+    try:
+        iterator = await open_stream()
+    except BaseException:
+        await reservation.settle(0)
+        raise
+    return _settle_when_closed(iterator, reservation, count)
+
+
+async def _settle_when_closed(
+    iterator: AsyncIterator[Any],
+    reservation: TokenReservation,
+    count: Callable[[Any], int],
+) -> AsyncIterator[Any]:
+    """Relay ``iterator``, then settle ``reservation`` for what it generated.
+
+    A ``total_tokens`` reported by the backend (e.g. in a final usage chunk)
+    is charged as is; otherwise the counted chunks are added to the prompt
+    estimate.
+    """
+
+    generated = 0
+    reported: int | None = None
+    started = False
+    try:
+        async for chunk in iterator:
+            started = True
+            total = _reported_total_tokens(chunk)
+            if total is not None:
+                reported = total
+            else:
+                generated += count(chunk)
+            yield chunk
+    finally:
+        try:
+            await _aclose(iterator)
+        finally:
+            if reported is not None:
+                await reservation.settle(reported)
+            else:
+                await reservation.settle(
+                    reservation.estimate + generated if started else 0
+                )
+
+
+def _reported_total_tokens(chunk: Any) -> int | None:
+    """Return the ``total_tokens`` a stream chunk reports, if any."""
+
+    if isinstance(chunk, dict):
+        usage = chunk.get("usage")
+        if isinstance(usage, dict) and usage.get("total_tokens"):
+            return int(usage["total_tokens"])
+        return None
+    if isinstance(chunk, (bytes, bytearray)) and b'"usage"' in chunk:
+        # Raw payloads are only searched, not parsed, to keep relaying cheap.
+        match = _TOTAL_TOKENS.search(chunk)
+        return int(match.group(1)) if match else None
+    return None
+
+
+def _sse_event_count(chunk: bytes) -> int:
+    """Count the generated events in a chunk of raw upstream SSE bytes."""
+
+    return chunk.count(b"data:") - chunk.count(b"[DONE]")
+
+
+async def _admitted(
+    acquire: AcquirePermit | None, call: Callable[[], Awaitable[Any]]
+) -> Any:
+    """Await ``call()`` while holding an admission slot, if limits apply."""
+
+    if acquire is None:
+        return await call()
+    permit = await acquire()
+    try:
+        return await call()
+    finally:
+        permit.release()
+
+
+async def _open_admitted_stream(
+    acquire: AcquirePermit | None,
+    open_stream: Callable[[], Awaitable[AsyncIterator[Any]]],
+) -> AsyncIterator[Any]:
+    """Open a backend stream that holds an admission slot until it is closed."""
+
+    if acquire is None:
+        return await open_stream()
+    permit = await acquire()
+    try:
+        iterator = await open_stream()
+    except BaseException:
+        permit.release()
+        raise
+    return _release_when_closed(iterator, permit)
+
+
+async def _release_when_closed(
+    iterator: AsyncIterator[Any], permit: PermitGroup
+) -> AsyncIterator[Any]:
+    try:
+        async for item in iterator:
+            yield item
+    finally:
+        try:
+            await _aclose(iterator)
+        finally:
+            permit.release()
+
+
+async def _open_backend_stream(
     llm_client: LLMClientProtocol,
     messages: List[Dict[str, Any]],
     model_name: str,
     backend_options: Dict[str, Any],
-) -> AsyncIterator[str]:
-    response_id = _generate_response_id()
-    created = int(time.time())
-
-    def _format_chunk(chunk: Any) -> Dict[str, Any] | None:
-        if chunk is None:
-            return None
-        if isinstance(chunk, dict):
-            chunk.setdefault("id", response_id)
-            chunk.setdefault("object", "chat.completion.chunk")
-            chunk.setdefault("created", created)
-            chunk.setdefault("model", model_name)
-            return chunk
-        content = str(chunk)
-        return {
-            "id": response_id,
-            "object": "chat.completion.chunk",
-            "created": created,
-            "model": model_name,
-            "choices": [
-                {
-                    "index": 0,
-                    "delta": {"content": content},
-                    "finish_reason": None,
-                }
-            ],
-        }
-
+) -> AsyncIterator[Any]:
     stream_result = llm_client.stream(
         messages,
         model=model_name,
         **backend_options,
     )
     if inspect.iscoroutine(stream_result):
-        stream_iterator = await stream_result
-    else:
-        stream_iterator = stream_result
+        return await stream_result
+    return stream_result
+
 
+async def _stream_chat_completions(
+    open_stream: Callable[[], Awaitable[AsyncIterator[Any]]],
+    model_name: str,
+    *,
+    shared: bool = False,
+    response_id: str | None = None,
+) -> AsyncIterator[bytes]:
+    """Format backend chunks as SSE events under this response's header.
+
+    ``shared`` chunks are also delivered to other responses: they are never
+    mutated, and their upstream id is replaced by this response's own id.
+    """
+
+    response_id = response_id or _generate_response_id()
+    created = int(time.time())
+    header: Dict[str, Any] = {
+        "id": response_id,
+        "object": "chat.completion.chunk",
+        "created": created,
+        "model": model_name,
+    }
+    header_members = encode_header_members(header)
+
+    def _format_chunk(chunk: Any) -> bytes | None:
+        if chunk is None:
+            return None
+        if isinstance(chunk, (bytes, bytearray)):
+            # Relayed upstream payloads are spliced without a JSON round trip
+            # unless their header cannot be inspected at byte level.
+            spliced = None if shared else splice_header(bytes(chunk), header_members)
+            if spliced is not None:
+                return b"data: " + spliced + b"\n\n"
+            chunk = json.loads(chunk)
+        if isinstance(chunk, dict):
+            if shared:
+                return format_sse({**header, **chunk, "id": response_id})
+            for key, value in header.items():
+                chunk.setdefault(key, value)
+            return format_sse(chunk)
+        content = str(chunk)
+        return format_sse(
+            {
+                **header,
+                "choices": [
+                    {
+                        "index": 0,
+                        "delta": {"content": content},
+                        "finish_reason": None,
+                    }
+                ],
+            }
+        )
+
+    stream_iterator = await open_stream()
     try:
         async for chunk in stream_iterator:
             formatted = _format_chunk(chunk)
             if formatted is None:
                 continue
-            yield _format_sse(formatted)
+            yield formatted
     finally:
-        yield "data: [DONE]\n\n"
+        # Closing the backend iterator releases the upstream connection even
+        # when the downstream consumer goes away mid-stream.
+        await _aclose(stream_iterator)
+    yield DONE_EVENT
+
+
+async def _aclose(iterator: Any) -> None:
+    aclose = getattr(iterator, "aclose", None)
+    if aclose is not None:
+        await aclose()
 
 
 def _build_chat_completion_response(
     backend_response: Any,
     model_name: str,
-) -> ChatCompletionResponse:
-    response_id = _generate_response_id()
-    created = int(time.time())
+) -> Dict[str, Any]:
+    """Return a ``ChatCompletionResponse``-shaped payload as plain data."""
 
     choices = _extract_choices(backend_response)
     if not choices:
-        message = ChatCompletionMessage(role="assistant", content=str(backend_response))
-        choices = [
-            ChatCompletionChoice(
-                index=0,
-                message=message,
-                finish_reason="stop",
-            )
-        ]
+        choices = [_choice(0, "assistant", str(backend_response), None, "stop")]
 
-    usage = _extract_usage(backend_response)
+    return {
+        "id": _generate_response_id(),
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": model_name,
+        "choices": choices,
+        "usage": _extract_usage(backend_response),
+    }
 
-    return ChatCompletionResponse(
-        id=response_id,
-        created=created,
-        model=model_name,
-        choices=choices,
-        usage=usage,
-    )
+
+def _choice(
+    index: int,
+    role: str,
+    content: str | None,
+    tool_calls: List[Dict[str, Any]] | None,
+    finish_reason: str,
+) -> Dict[str, Any]:
+    return {
+        "index": index,
+        "message": {"role": role, "content": content, "tool_calls": tool_calls},
+        "finish_reason": finish_reason,
+    }
 
 
-def _extract_choices(backend_response: Any) -> List[ChatCompletionChoice]:
+def _extract_choices(backend_response: Any) -> List[Dict[str, Any]]:
     if isinstance(backend_response, dict):
         raw_choices = backend_response.get("choices")
         if isinstance(raw_choices, list):
-            parsed_choices: List[ChatCompletionChoice] = []
+            parsed_choices: List[Dict[str, Any]] = []
             for idx, choice in enumerate(raw_choices):
                 if not isinstance(choice, dict):
                     continue
                 message_payload = choice.get("message")
                 if isinstance(message_payload, dict):
                     content = message_payload.get("content")
+                    role = message_payload.get("role", "assistant")
                     tool_calls = message_payload.get("tool_calls")
-                    message = ChatCompletionMessage(
-                        role=message_payload.get("role", "assistant"),
-                        content=content,
-                        tool_calls=tool_calls,
-                    )
                 else:
-                    message = ChatCompletionMessage(
-                        role="assistant",
-                        content=str(message_payload),
-                    )
-                finish_reason = choice.get("finish_reason", "stop")
+                    content = str(message_payload)
+                    role = "assistant"
+                    tool_calls = None
                 parsed_choices.append(
-                    ChatCompletionChoice(
-                        index=choice.get("index", idx),
-                        message=message,
-                        finish_reason=finish_reason,
+                    _choice(
+                        choice.get("index", idx),
+                        role,
+                        None if content is None else str(content),
+                        tool_calls,
+                        choice.get("finish_reason") or "stop",
                     )
                 )
             return parsed_choices
 
     if isinstance(backend_response, str):
-        return [
-            ChatCompletionChoice(
-                index=0,
-                message=ChatCompletionMessage(
-                    role="assistant", content=backend_response
-                ),
-                finish_reason="stop",
-            )
-        ]
+        return [_choice(0, "assistant", backend_response, None, "stop")]
 
     return []
 
 
-def _extract_usage(backend_response: Any) -> Usage:
+def _extract_usage(backend_response: Any) -> Dict[str, int]:
     if isinstance(backend_response, dict):
         usage_data = backend_response.get("usage")
         if isinstance(usage_data, dict):
             try:
-                return Usage(
-                    prompt_tokens=int(usage_data.get("prompt_tokens") or 0),
-                    completion_tokens=int(usage_data.get("completion_tokens") or 0),
-                    total_tokens=int(usage_data.get("total_tokens") or 0),
-                )
+                return {
+                    "prompt_tokens": int(usage_data.get("prompt_tokens") or 0),
+                    "completion_tokens": int(usage_data.get("completion_tokens") or 0),
+                    "total_tokens": int(usage_data.get("total_tokens") or 0),
+                }
             except (ValueError, TypeError):
                 pass  # Fall through to default usage
-    return Usage(prompt_tokens=0, completion_tokens=0, total_tokens=0)
+    return {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
 
 
-def _format_sse(payload: Dict[str, Any]) -> str:
-    return f"data: {json.dumps(payload, separators=(',', ':'))}\n\n"
+def _passthrough_usage(content: bytes) -> Dict[str, int]:
+    try:
+        return _extract_usage(json.loads(content))
+    except ValueError:
+        return _extract_usage(None)
 
 
 def _generate_response_id() -> str:
@@ -0,0 +1,41 @@
+"""Fast JSON encoding for response bodies and streamed events."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+from fastapi.responses import Response
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    orjson = None  # type: ignore[assignment]
+
+
+def dumps(payload: Any) -> bytes:
+    """Serialise ``payload`` to compact JSON bytes.
+
+    Uses ``orjson`` when it is installed and falls back to the standard
+    library otherwise.
+    """
+
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+class JSONBytesResponse(Response):
+    """JSON response that encodes plain Python data straight to bytes.
+
+    Returning this from a route bypasses FastAPI's ``response_model``
+    validation and ``jsonable_encoder`` pass; the declared response model is
+    still used for the OpenAPI schema.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return dumps(content)
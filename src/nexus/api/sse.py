@@ -0,0 +1,340 @@
+"""Helpers for emitting OpenAI-style Server-Sent Events."""
+
+from __future__ import annotations
+
+import asyncio
+import re
+from collections import deque
+from typing import Any, AsyncIterator, Deque, Dict, Iterable, Tuple
+
+from .serialization import dumps
+
+# Top-level members every ``chat.completion.chunk`` is expected to carry.
+CHUNK_HEADER_KEYS: Tuple[str, ...] = ("id", "object", "created", "model")
+
+_HEADER_MEMBER = re.compile(rb'"(id|object|created|model)"\s*:')
+_CHOICES_KEY = b'"choices"'
+
+DONE_EVENT = b"data: [DONE]\n\n"
+
+
+def format_sse(payload: Dict[str, Any]) -> bytes:
+    """Serialise ``payload`` as a single SSE ``data:`` event."""
+
+    return b"data: " + dumps(payload) + b"\n\n"
+
+
+def encode_header_members(header: Dict[str, Any]) -> Tuple[Tuple[bytes, bytes], ...]:
+    """Pre-encode chunk header members once per stream for :func:`splice_header`."""
+
+    return tuple(
+        (key.encode(), dumps({key: value})[1:-1]) for key, value in header.items()
+    )
+
+
+def splice_header(data: bytes, members: Iterable[Tuple[bytes, bytes]]) -> bytes | None:
+    """Insert any missing top-level header members into a raw JSON chunk.
+
+    OpenAI-compatible servers emit the header fields before ``choices``.
+    That prefix is scanned at byte level; members it already carries are kept
+    as-is (matching ``dict.setdefault`` semantics) and missing ones are
+    spliced in after the opening brace. ``None`` is returned when the prefix
+    cannot be proven flat, in which case the caller must parse the chunk.
+    """
+
+    data = data.strip()
+    if not data.startswith(b"{"):
+        return None
+    end = data.find(_CHOICES_KEY)
+    if end == -1 or not data[end + len(_CHOICES_KEY) :].lstrip().startswith(b":"):
+        return None
+    prefix = data[1:end]
+    if b"{" in prefix or b"[" in prefix:
+        return None
+
+    present = set(_HEADER_MEMBER.findall(prefix))
+    missing = [member for key, member in members if key not in present]
+    if not missing:
+        return data
+    return b"{" + b",".join(missing) + b"," + data[1:]
+
+
+async def prime_events(events: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """Pull the first event before the response starts.
+
+    Backend errors raised while opening the stream (unavailable replicas,
+    upstream 5xx) then propagate as a regular HTTP error instead of a
+    truncated ``200`` event stream.
+    """
+
+    iterator = events.__aiter__()
+    try:
+        first = await iterator.__anext__()
+    except StopAsyncIteration:
+        first = None
+
+    async def _replay() -> AsyncIterator[bytes]:
+        try:
+            if first is None:
+                return
+            yield first
+            async for event in iterator:
+                yield event
+        finally:
+            aclose = getattr(iterator, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+    return _replay()
+
+
+class _Batch:
+    """Events read by :func:`coalesce_events` but not yet written."""
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self.events: list[bytes] = []
+        self.size = 0
+        self.done = False
+        self.expired = False
+        self.error: BaseException | None = None
+        self.ready = asyncio.Event()
+        self.drained = asyncio.Event()
+
+    async def fill(self, iterator: AsyncIterator[bytes]) -> None:
+        try:
+            async for event in iterator:
+                while self.size >= self.max_bytes:
+                    self.drained.clear()
+                    await self.drained.wait()
+                self.events.append(event)
+                self.size += len(event)
+                self.ready.set()
+        except Exception as exc:
+            self.error = exc
+        finally:
+            self.done = True
+            self.ready.set()
+            aclose = getattr(iterator, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+    def expire(self) -> None:
+        self.expired = True
+        self.ready.set()
+
+    def take(self, count: int | None = None) -> bytes:
+        taken = self.events[:count]
+        del self.events[:count]
+        self.size -= sum(len(event) for event in taken)
+        self.expired = False
+        self.drained.set()
+        return b"".join(taken)
+
+
+async def coalesce_events(
+    events: AsyncIterator[bytes],
+    *,
+    max_delay: float,
+    max_bytes: int,
+) -> AsyncIterator[bytes]:
+    """Batch SSE events into fewer writes without delaying the first token.
+
+    The first event is flushed immediately. Later events are buffered until
+    ``max_delay`` seconds have passed since the batch started or the buffer
+    reaches ``max_bytes``, then written as one concatenated block of complete
+    events. A single reader task per stream drains ``events``; the window is
+    a timer callback, so a stalled backend does not hold back a due batch.
+    """
+
+    loop = asyncio.get_running_loop()
+    batch = _Batch(max_bytes)
+    reader = asyncio.ensure_future(batch.fill(events.__aiter__()))
+    timer: asyncio.TimerHandle | None = None
+    first = True
+    try:
+        while True:
+            if batch.events:
+                if first:
+                    first = False
+                    yield batch.take(1)
+                    continue
+                if batch.expired or batch.done or batch.size >= max_bytes:
+                    if timer is not None:
+                        timer.cancel()
+                        timer = None
+                    yield batch.take()
+                    continue
+                if timer is None:
+                    timer = loop.call_later(max_delay, batch.expire)
+            elif batch.done:
+                break
+            batch.ready.clear()
+            await batch.ready.wait()
+        if batch.error is not None:
+            raise batch.error
+    finally:
+        if timer is not None:
+            timer.cancel()
+        if not reader.done():
+            reader.cancel()
+            try:
+                await reader
+            except asyncio.CancelledError:
+                pass  # The abandoned read is discarded with the stream.
+
+
+class StreamBufferBudget:
+    """Byte budget shared by every buffered stream in the process."""
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self.used = 0
+        self.overflows = 0
+        self.aborted = 0
+
+    def try_acquire(self, size: int) -> bool:
+        if self.used + size > self.max_bytes:
+            self.overflows += 1
+            return False
+        self.used += size
+        return True
+
+    def release(self, size: int) -> None:
+        self.used = max(self.used - size, 0)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "buffered_bytes": self.used,
+            "max_bytes": self.max_bytes,
+            "overflows": self.overflows,
+            "aborted": self.aborted,
+        }
+
+
+class _ReadAhead:
+    """Bounded buffer filled by a pump task and drained by the response."""
+
+    def __init__(
+        self,
+        iterator: AsyncIterator[bytes],
+        max_bytes: int,
+        budget: StreamBufferBudget,
+        overflow: str,
+    ) -> None:
+        self.iterator = iterator
+        self.max_bytes = max_bytes
+        self.budget = budget
+        self.overflow = overflow
+        self.chunks: Deque[Tuple[bytes, bool]] = deque()
+        self.size = 0
+        self.done = False
+        self.aborted = False
+        self.error: BaseException | None = None
+        self.ready = asyncio.Event()
+        self.drained = asyncio.Event()
+
+    async def pump(self) -> None:
+        try:
+            async for chunk in self.iterator:
+                charged = await self._reserve(len(chunk))
+                if charged is None:
+                    self.budget.aborted += 1
+                    self.aborted = True
+                    return
+                self.chunks.append((chunk, charged))
+                self.size += len(chunk)
+                self.ready.set()
+        except Exception as exc:
+            self.error = exc
+        finally:
+            self.done = True
+            self.ready.set()
+            aclose = getattr(self.iterator, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+    def take(self) -> bytes:
+        chunk, charged = self.chunks.popleft()
+        self.size -= len(chunk)
+        if charged:
+            self.budget.release(len(chunk))
+        self.drained.set()
+        return chunk
+
+    def discard(self) -> None:
+        while self.chunks:
+            self.take()
+
+    async def _reserve(self, size: int) -> bool | None:
+        """Wait for room for ``size`` bytes; return whether the budget was charged.
+
+        ``None`` means the budget is exhausted under the ``abort`` policy.
+        """
+
+        while True:
+            if self.size and self.size + size > self.max_bytes:
+                await self._wait_drained()
+            elif self.budget.try_acquire(size):
+                return True
+            elif not self.chunks:
+                # Nothing buffered: hand the chunk over directly.
+                return False
+            elif self.overflow == "abort":
+                return None
+            else:
+                await self._wait_drained()
+
+    async def _wait_drained(self) -> None:
+        self.drained.clear()
+        await self.drained.wait()
+
+
+async def buffer_events(
+    events: AsyncIterator[bytes],
+    *,
+    max_bytes: int,
+    budget: StreamBufferBudget,
+    overflow: str = "backpressure",
+) -> AsyncIterator[bytes]:
+    """Drain ``events`` at full speed into a bounded buffer for a slow reader.
+
+    A background task reads ahead by up to ``max_bytes`` per stream, so the
+    backend stream (and the admission slot tied to it) is released as soon
+    as generation ends rather than when the client has read everything.
+    Buffered bytes are also charged to the process-wide ``budget``. Once the
+    budget is used up, ``overflow="backpressure"`` reads the backend only as
+    fast as the client (one chunk at a time), while ``"abort"`` ends the
+    stream with an error event.
+    """
+
+    read_ahead = _ReadAhead(events.__aiter__(), max_bytes, budget, overflow)
+    pump = asyncio.ensure_future(read_ahead.pump())
+    try:
+        while True:
+            if read_ahead.chunks:
+                yield read_ahead.take()
+            elif read_ahead.done:
+                break
+            else:
+                read_ahead.ready.clear()
+                await read_ahead.ready.wait()
+        if read_ahead.aborted:
+            yield format_sse(
+                {
+                    "error": {
+                        "message": "Stream buffer budget exhausted",
+                        "type": "server_error",
+                    }
+                }
+            )
+        elif read_ahead.error is not None:
+            raise read_ahead.error
+    finally:
+        if not pump.done():
+            pump.cancel()
+            try:
+                await pump
+            except asyncio.CancelledError:
+                pass
+        read_ahead.discard()
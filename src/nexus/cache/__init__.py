@@ -0,0 +1,24 @@
+"""Response caching for chat completions."""
+
+from .disk import SQLiteResponseCache
+from .idempotency import IdempotencyConflictError, IdempotencyStore
+from .keys import completion_cache_key
+from .memory import MemoryResponseCache
+from .multicast import StreamMulticast, SubscriberLaggedError
+from .replay import StreamExpiredError, StreamReplayStore
+from .single_flight import SingleFlight
+from .tiered import TieredResponseCache
+
+__all__ = [
+    "IdempotencyConflictError",
+    "IdempotencyStore",
+    "MemoryResponseCache",
+    "SQLiteResponseCache",
+    "SingleFlight",
+    "StreamExpiredError",
+    "StreamMulticast",
+    "StreamReplayStore",
+    "SubscriberLaggedError",
+    "TieredResponseCache",
+    "completion_cache_key",
+]
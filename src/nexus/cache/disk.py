@@ -0,0 +1,179 @@
+"""SQLite-backed response cache shared by every worker process on a host."""
+
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Callable
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    expires_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_accessed_at ON entries (accessed_at);
+CREATE INDEX IF NOT EXISTS entries_expires_at ON entries (expires_at);
+CREATE TABLE IF NOT EXISTS totals (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    size INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO totals
+    SELECT 0, COALESCE(SUM(size), 0) FROM entries;
+CREATE TRIGGER IF NOT EXISTS entries_inserted AFTER INSERT ON entries BEGIN
+    UPDATE totals SET size = size + NEW.size WHERE id = 0;
+END;
+CREATE TRIGGER IF NOT EXISTS entries_updated AFTER UPDATE OF size ON entries BEGIN
+    UPDATE totals SET size = size - OLD.size + NEW.size WHERE id = 0;
+END;
+CREATE TRIGGER IF NOT EXISTS entries_deleted AFTER DELETE ON entries BEGIN
+    UPDATE totals SET size = size - OLD.size WHERE id = 0;
+END;
+"""
+
+# An upsert rather than INSERT OR REPLACE, whose implicit delete would
+# bypass the size triggers.
+_UPSERT = """
+INSERT INTO entries VALUES (?, ?, ?, ?, ?)
+ON CONFLICT (key) DO UPDATE SET
+    value = excluded.value,
+    size = excluded.size,
+    expires_at = excluded.expires_at,
+    accessed_at = excluded.accessed_at
+"""
+
+# Recency is tracked to this fraction of the TTL: hits on an entry touched
+# more recently skip the write.
+_TOUCH_FRACTION = 0.1
+
+
+class SQLiteResponseCache:
+    """Persistent LRU cache of byte payloads stored in a SQLite database.
+
+    The database runs in WAL mode so several processes can read while one
+    writes; writers wait up to ``busy_timeout`` seconds for the lock.
+    Entries survive restarts until they expire (wall-clock ``ttl``) or are
+    evicted once the stored values exceed ``max_bytes``. The stored size is
+    kept as a running total, so a write only scans for expired and least
+    recently used entries when it pushes the total over the budget. Blocking
+    SQLite calls run in a worker thread so the event loop is never stalled.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        max_bytes: int,
+        ttl: float,
+        busy_timeout: float = 5.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._path = Path(path)
+        self._max_bytes = max_bytes
+        self._ttl = ttl
+        self._busy_timeout = busy_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._connection: sqlite3.Connection | None = None
+
+    async def get(self, key: str) -> bytes | None:
+        entry = await self.lookup(key)
+        return None if entry is None else entry[0]
+
+    async def lookup(self, key: str) -> tuple[bytes, float] | None:
+        """Return ``(value, remaining_ttl)`` for ``key`` or ``None`` on a miss."""
+
+        return await asyncio.to_thread(self._lookup, key)
+
+    async def set(self, key: str, value: bytes) -> None:
+        await asyncio.to_thread(self._store, key, value)
+
+    async def aclose(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(
+                self._path,
+                timeout=self._busy_timeout,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(_SCHEMA)
+            self._connection = connection
+        return self._connection
+
+    def _lookup(self, key: str) -> tuple[bytes, float] | None:
+        now = self._clock()
+        with self._lock:
+            connection = self._connect()
+            row = connection.execute(
+                "SELECT value, expires_at, accessed_at FROM entries WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            value, expires_at, accessed_at = row
+            if expires_at <= now:
+                connection.execute(
+                    "DELETE FROM entries WHERE key = ? AND expires_at <= ?",
+                    (key, now),
+                )
+                return None
+            if now - accessed_at >= self._ttl * _TOUCH_FRACTION:
+                connection.execute(
+                    "UPDATE entries SET accessed_at = ? WHERE key = ?", (now, key)
+                )
+        return bytes(value), expires_at - now
+
+    def _store(self, key: str, value: bytes) -> None:
+        size = len(key) + len(value)
+        if size > self._max_bytes:
+            return
+        now = self._clock()
+        with self._lock:
+            connection = self._connect()
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                connection.execute(_UPSERT, (key, value, size, now + self._ttl, now))
+                if self._total(connection) > self._max_bytes:
+                    self._evict(connection, now)
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+
+    def _evict(self, connection: sqlite3.Connection, now: float) -> None:
+        """Drop expired entries, then the least recently used over budget."""
+
+        connection.execute("DELETE FROM entries WHERE expires_at <= ?", (now,))
+        excess = self._total(connection) - self._max_bytes
+        if excess <= 0:
+            return
+        victims = []
+        # Walks the accessed_at index from the oldest entry.
+        cursor = connection.execute(
+            "SELECT key, size FROM entries ORDER BY accessed_at"
+        )
+        for key, size in cursor:
+            victims.append((key,))
+            excess -= size
+            if excess <= 0:
+                break
+        cursor.close()
+        connection.executemany("DELETE FROM entries WHERE key = ?", victims)
+
+    @staticmethod
+    def _total(connection: sqlite3.Connection) -> int:
+        return connection.execute("SELECT size FROM totals WHERE id = 0").fetchone()[0]
@@ -0,0 +1,140 @@
+"""Deduplicate client retries that carry the same idempotency key."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Awaitable, Callable
+
+from .memory import MemoryResponseCache
+
+
+class IdempotencyConflictError(ValueError):
+    """Raised when an idempotency key is reused for a different request."""
+
+    status_code = 422
+
+    def __init__(self) -> None:
+        super().__init__("Idempotency-Key was already used for a different request")
+
+
+class IdempotencyStore:
+    """Run each idempotent request once and hand its result to every retry.
+
+    The first request with a key starts the call in a background task.
+    Concurrent duplicates await that task, and later duplicates get the
+    stored result for ``ttl`` seconds. Callers that go away (e.g. a gateway
+    timed out) leave the task running, so their retry can still pick up its
+    result. Failed calls are not stored: the next retry runs again.
+
+    Each key is bound to the ``fingerprint`` of the request that first used
+    it; reusing the key for a different request raises
+    :class:`IdempotencyConflictError`. Stored results are bounded by
+    ``max_bytes`` and evicted least recently used first.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: float,
+        max_bytes: int,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._ttl = ttl
+        self._results = MemoryResponseCache(max_bytes=max_bytes, ttl=ttl, clock=clock)
+        self._running: dict[str, tuple[str, asyncio.Future[bytes]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._results) + len(self._running)
+
+    async def complete(
+        self, key: str, fingerprint: str, call: Callable[[], Awaitable[bytes]]
+    ) -> tuple[bytes, bool]:
+        """Return ``call()``'s result for ``key`` and whether it was replayed.
+
+        Raises:
+            IdempotencyConflictError: If ``key`` belongs to another request.
+        """
+
+        stored = await self._lookup(key, fingerprint)
+        if stored is not None:
+            return stored, True
+        running = self._running.get(key)
+        replayed = running is not None
+        if running is None:
+            running = (fingerprint, asyncio.ensure_future(call()))
+            self._running[key] = running
+            running[1].add_done_callback(lambda task: self._finish(key, running, task))
+        elif running[0] != fingerprint:
+            raise IdempotencyConflictError()
+        return await asyncio.shield(running[1]), replayed
+
+    async def claim(
+        self, key: str, fingerprint: str, value: bytes, *, ttl: float | None = None
+    ) -> bytes | None:
+        """Bind ``value`` to ``key``, or return the value bound earlier.
+
+        Used for streams, whose generation is shared through its response id
+        rather than its result. ``ttl`` shortens the binding to the lifetime
+        of what ``value`` refers to.
+
+        Raises:
+            IdempotencyConflictError: If ``key`` belongs to another request.
+        """
+
+        stored = await self._lookup(key, fingerprint)
+        if stored is not None:
+            return stored
+        running = self._running.get(key)
+        if running is not None:
+            raise IdempotencyConflictError()
+        self._store(key, fingerprint, value, ttl=ttl)
+        return None
+
+    async def release(self, key: str, value: bytes) -> None:
+        """Drop the claim on ``key`` if it is still bound to ``value``.
+
+        Called when the claimed work failed, so the next retry runs again.
+        """
+
+        stored = await self._results.get(key)
+        if stored is not None and stored.partition(b"\n")[2] == value:
+            self._results.discard(key)
+
+    async def aclose(self) -> None:
+        """Cancel running calls and drop every stored result."""
+
+        running = [task for _, task in self._running.values()]
+        self._running.clear()
+        for task in running:
+            task.cancel()
+        if running:
+            await asyncio.wait(running)
+        await self._results.aclose()
+
+    async def _lookup(self, key: str, fingerprint: str) -> bytes | None:
+        stored = await self._results.get(key)
+        if stored is None:
+            return None
+        owner, _, value = stored.partition(b"\n")
+        if owner.decode() != fingerprint:
+            raise IdempotencyConflictError()
+        return value
+
+    def _store(
+        self, key: str, fingerprint: str, value: bytes, *, ttl: float | None = None
+    ) -> None:
+        ttl = self._ttl if ttl is None else min(ttl, self._ttl)
+        self._results.put(key, fingerprint.encode() + b"\n" + value, ttl=ttl)
+
+    def _finish(
+        self,
+        key: str,
+        running: tuple[str, asyncio.Future[bytes]],
+        task: asyncio.Future[bytes],
+    ) -> None:
+        if self._running.get(key) is running:
+            del self._running[key]
+        if task.cancelled() or task.exception() is not None:
+            return
+        self._store(key, running[0], task.result())
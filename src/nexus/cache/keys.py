@@ -0,0 +1,35 @@
+"""Canonical cache keys for chat completion requests."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import Any, Mapping
+
+
+def completion_cache_key(
+    backend: str,
+    model: str,
+    messages: Any,
+    options: Mapping[str, Any],
+) -> str:
+    """Return a stable digest identifying a chat completion request.
+
+    ``options`` carries every remaining request field (sampling parameters,
+    tools, ...). Keys are sorted so semantically identical requests hash the
+    same regardless of field order in the incoming JSON.
+    """
+
+    canonical = json.dumps(
+        {
+            "backend": backend,
+            "model": model,
+            "messages": messages,
+            "options": options,
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(canonical.encode()).hexdigest()
@@ -0,0 +1,79 @@
+"""In-process LRU response cache bounded by size and age."""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import Callable
+
+
+class MemoryResponseCache:
+    """LRU cache of byte payloads with a total size bound and a TTL.
+
+    Sizes are counted as ``len(key) + len(value)``; values larger than the
+    whole budget are never stored. Expired entries are dropped when read or
+    when they reach the LRU end during eviction.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_bytes: int,
+        ttl: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_bytes = max_bytes
+        self._ttl = ttl
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._size = 0
+
+    @property
+    def size(self) -> int:
+        """Total bytes currently held."""
+
+        return self._size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, key: str) -> bytes | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            self._discard(key)
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: bytes) -> None:
+        self.put(key, value, ttl=self._ttl)
+
+    def put(self, key: str, value: bytes, *, ttl: float) -> None:
+        """Store ``value`` for ``ttl`` seconds without awaiting."""
+
+        self._discard(key)
+        cost = len(key) + len(value)
+        if cost > self._max_bytes or ttl <= 0:
+            return
+        self._entries[key] = (self._clock() + ttl, value)
+        self._size += cost
+        while self._size > self._max_bytes:
+            oldest = next(iter(self._entries))
+            self._discard(oldest)
+
+    def discard(self, key: str) -> None:
+        """Drop ``key`` if it is cached."""
+
+        self._discard(key)
+
+    async def aclose(self) -> None:
+        self._entries.clear()
+        self._size = 0
+
+    def _discard(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= len(key) + len(entry[1])
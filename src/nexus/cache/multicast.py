@@ -0,0 +1,162 @@
+"""Fan one upstream stream out to concurrent identical stream requests."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, AsyncIterator, Awaitable, Callable, Hashable
+
+StreamOpener = Callable[[], Awaitable[AsyncIterator[Any]]]
+
+
+class SubscriberLaggedError(RuntimeError):
+    """Raised to a subscriber that fell too far behind its shared stream."""
+
+    def __init__(self) -> None:
+        super().__init__("Stream subscriber fell too far behind the backend")
+
+
+class _Broadcast:
+    """Replay buffer of one upstream generation plus its subscriber cursors."""
+
+    def __init__(self) -> None:
+        self.items: list[Any] = []
+        self.base = 0  # absolute index of items[0] once trimmed
+        self.cursors: dict[object, int] = {}
+        self.joinable = True
+        self.done = False
+        self.error: Exception | None = None
+        self.task: asyncio.Future[None] | None = None
+        self._wakeup = asyncio.Event()
+
+    @property
+    def end(self) -> int:
+        return self.base + len(self.items)
+
+    def notify(self) -> None:
+        wakeup, self._wakeup = self._wakeup, asyncio.Event()
+        wakeup.set()
+
+    async def wait(self) -> None:
+        await self._wakeup.wait()
+
+    def trim(self) -> None:
+        """Drop chunks every subscriber has read once nobody can join anymore."""
+
+        if self.joinable or not self.cursors:
+            return
+        consumed = min(self.cursors.values()) - self.base
+        if consumed > 0:
+            del self.items[:consumed]
+            self.base += consumed
+
+    def detach_laggards(self, limit: int) -> None:
+        """Drop subscribers more than ``limit`` chunks behind the newest one."""
+
+        oldest = self.end - limit
+        for token, position in list(self.cursors.items()):
+            if position < oldest:
+                del self.cursors[token]
+        if self.cursors:
+            self.trim()
+        else:
+            self.base, self.items = self.end, []
+
+
+class StreamMulticast:
+    """Share one upstream stream among concurrent subscribers with the same key.
+
+    The first subscriber opens the upstream stream; a background task drains
+    it into a replay buffer as fast as the backend produces chunks. Later
+    subscribers replay the buffered chunks and then follow live. Each
+    subscriber reads at its own pace, so a slow client only delays itself.
+
+    A generation accepts new subscribers until it finishes or has buffered
+    ``max_replay`` chunks; after that chunks read by every subscriber are
+    released. A subscriber that falls more than ``max_replay`` chunks behind
+    is detached and ends with :class:`SubscriberLaggedError`, which bounds
+    the buffer without holding back the others. The upstream stream is
+    closed when the last subscriber leaves or is detached.
+    """
+
+    def __init__(self, *, max_replay: int = 1024) -> None:
+        self._max_replay = max_replay
+        self._broadcasts: dict[Hashable, _Broadcast] = {}
+
+    def __len__(self) -> int:
+        return len(self._broadcasts)
+
+    async def subscribe(
+        self, key: Hashable, open_stream: StreamOpener
+    ) -> AsyncIterator[Any]:
+        """Return an iterator over the shared stream for ``key``."""
+
+        broadcast = self._broadcasts.get(key)
+        if broadcast is None:
+            broadcast = _Broadcast()
+            self._broadcasts[key] = broadcast
+            broadcast.task = asyncio.ensure_future(
+                self._pump(key, broadcast, open_stream)
+            )
+        token = object()
+        broadcast.cursors[token] = broadcast.base
+        return self._follow(key, broadcast, token)
+
+    async def _follow(
+        self, key: Hashable, broadcast: _Broadcast, token: object
+    ) -> AsyncIterator[Any]:
+        try:
+            while True:
+                position = broadcast.cursors.get(token)
+                if position is None:
+                    raise SubscriberLaggedError()
+                if position < broadcast.end:
+                    item = broadcast.items[position - broadcast.base]
+                    broadcast.cursors[token] = position + 1
+                    broadcast.trim()
+                    yield item
+                elif broadcast.done:
+                    if broadcast.error is not None:
+                        raise broadcast.error
+                    return
+                else:
+                    await broadcast.wait()
+        finally:
+            broadcast.cursors.pop(token, None)
+            if broadcast.cursors:
+                broadcast.trim()
+            elif not broadcast.done and broadcast.task is not None:
+                # Last subscriber gone: stop generating for nobody.
+                self._close_to_joiners(key, broadcast)
+                broadcast.task.cancel()
+
+    async def _pump(
+        self, key: Hashable, broadcast: _Broadcast, open_stream: StreamOpener
+    ) -> None:
+        iterator: AsyncIterator[Any] | None = None
+        try:
+            iterator = await open_stream()
+            async for item in iterator:
+                broadcast.items.append(item)
+                if broadcast.joinable and len(broadcast.items) >= self._max_replay:
+                    self._close_to_joiners(key, broadcast)
+                if not broadcast.joinable:
+                    broadcast.detach_laggards(self._max_replay)
+                broadcast.notify()
+                if not broadcast.cursors:
+                    # Every subscriber was detached: stop generating for nobody.
+                    return
+        except Exception as exc:
+            broadcast.error = exc
+        finally:
+            broadcast.done = True
+            self._close_to_joiners(key, broadcast)
+            broadcast.notify()
+            aclose = getattr(iterator, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+    def _close_to_joiners(self, key: Hashable, broadcast: _Broadcast) -> None:
+        broadcast.joinable = False
+        if self._broadcasts.get(key) is broadcast:
+            del self._broadcasts[key]
+        broadcast.trim()
@@ -0,0 +1,216 @@
+"""Short-lived replay buffers that let dropped SSE streams resume."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict, deque
+from typing import AsyncIterator, Callable
+
+
+class StreamExpiredError(LookupError):
+    """Raised when a stream cannot be resumed from the requested event.
+
+    ``status_code`` is 404 for unknown (or evicted) streams and 410 when the
+    requested position has already been dropped from the replay buffer.
+    """
+
+    def __init__(self, message: str, *, status_code: int) -> None:
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class _Replay:
+    """Buffered events of one generation plus its attached readers."""
+
+    def __init__(self) -> None:
+        self.events: deque[bytes] = deque()
+        self.base = 0  # sequence number of events[0] once trimmed
+        self.size = 0
+        self.cursors: dict[object, int] = {}
+        self.done = False
+        self.error: Exception | None = None
+        self.finished_at: float | None = None
+        self.task: asyncio.Future[None] | None = None
+        self.abandon: asyncio.TimerHandle | None = None
+        self._wakeup = asyncio.Event()
+
+    @property
+    def end(self) -> int:
+        return self.base + len(self.events)
+
+    def notify(self) -> None:
+        wakeup, self._wakeup = self._wakeup, asyncio.Event()
+        wakeup.set()
+
+    async def wait(self) -> None:
+        await self._wakeup.wait()
+
+
+class StreamReplayStore:
+    """Keep recent SSE events of each stream so a dropped client can resume.
+
+    :meth:`start` drains a formatted event stream in a background task and
+    returns a reader that tags every event with an SSE ``id:`` of
+    ``<key>:<sequence>``. A reconnecting client sends the last id it saw as
+    ``Last-Event-ID`` and :meth:`resume` continues from the next event,
+    following the live generation or replaying the finished one.
+
+    A generation keeps running while its client is away, for at most
+    ``ttl`` seconds without a reader; finished streams are kept for
+    ``ttl`` seconds. Each stream buffers up to ``max_bytes`` of events: older
+    events every attached reader has seen are dropped to make room, and the
+    generation waits for readers that are behind. At most ``max_streams``
+    streams are kept, evicting the oldest finished ones first.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: float,
+        max_bytes: int = 1024 * 1024,
+        max_streams: int = 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._ttl = ttl
+        self._max_bytes = max_bytes
+        self._max_streams = max_streams
+        self._clock = clock
+        self._replays: OrderedDict[str, _Replay] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._replays)
+
+    @property
+    def ttl(self) -> float:
+        """Seconds a stream stays resumable without a reader."""
+
+        return self._ttl
+
+    def start(self, key: str, events: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+        """Buffer ``events`` under ``key`` and return a reader from the start."""
+
+        self._evict()
+        replay = _Replay()
+        self._replays[key] = replay
+        replay.task = asyncio.ensure_future(self._pump(replay, events))
+        return self._attach(key, replay, 0)
+
+    def resume(self, last_event_id: str) -> AsyncIterator[bytes]:
+        """Return a reader continuing after ``last_event_id``.
+
+        Raises:
+            StreamExpiredError: If the stream or position is no longer buffered.
+        """
+
+        key, _, sequence = last_event_id.strip().rpartition(":")
+        try:
+            position = int(sequence) + 1
+        except ValueError:
+            position = -1
+        self._evict()
+        replay = self._replays.get(key)
+        if replay is None or position < 0:
+            raise StreamExpiredError(
+                "Stream is unknown or has expired", status_code=404
+            )
+        if position < replay.base or position > replay.end:
+            raise StreamExpiredError(
+                "Stream position is no longer buffered", status_code=410
+            )
+        return self._attach(key, replay, position)
+
+    async def aclose(self) -> None:
+        """Stop every generation and drop all buffered streams."""
+
+        replays = list(self._replays.values())
+        self._replays.clear()
+        for replay in replays:
+            if replay.task is not None and not replay.task.done():
+                replay.task.cancel()
+                await asyncio.wait({replay.task})
+
+    def _attach(self, key: str, replay: _Replay, position: int) -> AsyncIterator[bytes]:
+        # Register the reader before it first iterates so the pump keeps
+        # every event from ``position`` on.
+        token = object()
+        replay.cursors[token] = position
+        if replay.abandon is not None:
+            replay.abandon.cancel()
+            replay.abandon = None
+        return self._follow(key, replay, token)
+
+    async def _follow(
+        self, key: str, replay: _Replay, token: object
+    ) -> AsyncIterator[bytes]:
+        position = replay.cursors[token]
+        prefix = b"id: " + key.encode() + b":"
+        try:
+            while True:
+                if position < replay.end:
+                    event = replay.events[position - replay.base]
+                    sequence = position
+                    position += 1
+                    replay.cursors[token] = position
+                    replay.notify()
+                    yield prefix + str(sequence).encode() + b"\n" + event
+                elif replay.done:
+                    if replay.error is not None:
+                        raise replay.error
+                    return
+                else:
+                    await replay.wait()
+        finally:
+            del replay.cursors[token]
+            replay.notify()
+            if not replay.cursors and not replay.done:
+                # Keep generating for a reconnect, but not indefinitely.
+                replay.abandon = asyncio.get_running_loop().call_later(
+                    self._ttl, self._abandon, key, replay
+                )
+
+    async def _pump(self, replay: _Replay, events: AsyncIterator[bytes]) -> None:
+        try:
+            async for event in events:
+                while replay.events and replay.size + len(event) > self._max_bytes:
+                    if any(cursor <= replay.base for cursor in replay.cursors.values()):
+                        # A reader still needs the oldest event: wait for it.
+                        await replay.wait()
+                        continue
+                    replay.size -= len(replay.events.popleft())
+                    replay.base += 1
+                replay.events.append(event)
+                replay.size += len(event)
+                replay.notify()
+        except Exception as exc:
+            replay.error = exc
+        finally:
+            replay.done = True
+            replay.finished_at = self._clock()
+            replay.notify()
+            aclose = getattr(events, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+    def _abandon(self, key: str, replay: _Replay) -> None:
+        replay.abandon = None
+        if replay.cursors:
+            return
+        if replay.task is not None:
+            replay.task.cancel()
+        if self._replays.get(key) is replay:
+            del self._replays[key]
+
+    def _evict(self) -> None:
+        now = self._clock()
+        for key, replay in list(self._replays.items()):
+            finished = replay.finished_at
+            if finished is not None and now - finished >= self._ttl:
+                del self._replays[key]
+        if len(self._replays) < self._max_streams:
+            return
+        for key, replay in list(self._replays.items()):
+            if len(self._replays) < self._max_streams:
+                break
+            if replay.done:
+                del self._replays[key]
@@ -0,0 +1,53 @@
+"""Share one in-flight call among concurrent identical requests."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Hashable
+
+
+@dataclass(eq=False)
+class _Call:
+    task: asyncio.Future[Any]
+    waiters: int = 0
+
+
+class SingleFlight:
+    """Run at most one call per key; concurrent callers await its result.
+
+    Each caller awaits the shared task through :func:`asyncio.shield`, so a
+    caller that is cancelled (e.g. its client disconnected) leaves the call
+    running for the others. The upstream call is cancelled only once every
+    caller has gone away. Finished calls are forgotten immediately: results
+    are shared between concurrent callers only, never cached.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[Hashable, _Call] = {}
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Return the result of ``fn()``, sharing it with concurrent callers."""
+
+        call = self._calls.get(key)
+        if call is None:
+            call = _Call(asyncio.ensure_future(fn()))
+            self._calls[key] = call
+            call.task.add_done_callback(lambda _task: self._forget(key, call))
+        call.waiters += 1
+        try:
+            return await asyncio.shield(call.task)
+        finally:
+            call.waiters -= 1
+            if call.waiters == 0 and not call.task.done():
+                # Nobody is left to receive the result: stop the upstream work
+                # and let new callers start a fresh call.
+                self._forget(key, call)
+                call.task.cancel()
+
+    def _forget(self, key: Hashable, call: _Call) -> None:
+        if self._calls.get(key) is call:
+            del self._calls[key]
@@ -0,0 +1,37 @@
+"""Two-level response cache: process memory in front of a shared disk store."""
+
+from __future__ import annotations
+
+from .disk import SQLiteResponseCache
+from .memory import MemoryResponseCache
+
+
+class TieredResponseCache:
+    """Read through an in-memory L1 to a persistent L2, writing to both.
+
+    L2 hits are promoted into L1 for the entry's remaining lifetime, so a
+    promoted copy never outlives the shared one.
+    """
+
+    def __init__(self, l1: MemoryResponseCache, l2: SQLiteResponseCache) -> None:
+        self.l1 = l1
+        self.l2 = l2
+
+    async def get(self, key: str) -> bytes | None:
+        value = await self.l1.get(key)
+        if value is not None:
+            return value
+        entry = await self.l2.lookup(key)
+        if entry is None:
+            return None
+        value, remaining = entry
+        self.l1.put(key, value, ttl=remaining)
+        return value
+
+    async def set(self, key: str, value: bytes) -> None:
+        await self.l1.set(key, value)
+        await self.l2.set(key, value)
+
+    async def aclose(self) -> None:
+        await self.l1.aclose()
+        await self.l2.aclose()
@@ -0,0 +1,57 @@
+"""Process-wide pool of keep-alive HTTP clients keyed by backend host."""
+
+from __future__ import annotations
+
+import httpx
+
+from ..config.mlx_settings import MLXSettings
+
+
+class HTTPClientPool:
+    """Hand out one long-lived :class:`httpx.AsyncClient` per backend host.
+
+    Every client shares the same connection limits and timeouts so that
+    completions reuse established TCP/TLS connections instead of paying the
+    handshake on each call. A ``partition`` (e.g. the model name) gives a
+    host several independent clients, each with its own connection limit,
+    so traffic in one partition cannot exhaust the others' connections.
+    """
+
+    def __init__(self, *, limits: httpx.Limits, timeout: httpx.Timeout) -> None:
+        self._limits = limits
+        self._timeout = timeout
+        self._clients: dict[tuple[str, str | None], httpx.AsyncClient] = {}
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    @classmethod
+    def from_settings(cls, settings: MLXSettings) -> "HTTPClientPool":
+        """Build a pool sized according to the MLX connection settings."""
+
+        return cls(
+            limits=settings.to_httpx_limits(),
+            timeout=settings.to_httpx_timeout(),
+        )
+
+    def get(self, base_url: str, partition: str | None = None) -> httpx.AsyncClient:
+        """Return the pooled client for ``base_url``, creating it on first use."""
+
+        key = (base_url.rstrip("/"), partition)
+        client = self._clients.get(key)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                base_url=key[0],
+                limits=self._limits,
+                timeout=self._timeout,
+            )
+            self._clients[key] = client
+        return client
+
+    async def aclose(self) -> None:
+        """Close every pooled client and drop their idle connections."""
+
+        clients = list(self._clients.values())
+        self._clients.clear()
+        for client in clients:
+            await client.aclose()
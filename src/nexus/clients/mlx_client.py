@@ -3,38 +3,78 @@
 from __future__ import annotations
 
 import json
-from typing import Any, AsyncIterator, Iterable
+import time
+from typing import AbstractSet, Any, AsyncIterator, Collection, Iterable, Mapping
 
 import httpx
 
+from ..config.dispatch_settings import DispatchSettings
 from ..config.mlx_settings import MLXSettings
+from ..dispatch.deadline import Deadline, StreamTimer, wait_within
+from ..dispatch.replica_pool import (
+    LatencyObserver,
+    Replica,
+    ReplicaPool,
+    is_replica_failure,
+)
 from ..protocols.llm_client_protocol import LLMClientProtocol
+from .http_pool import HTTPClientPool
+
+_COMPLETIONS_PATH = "/v1/chat/completions"
+_JSON_HEADERS = {"Content-Type": "application/json"}
 
 
 class MLXClient(LLMClientProtocol):
     """HTTP client for remote MLX servers supporting OpenAI or JSON formats."""
 
-    def __init__(self, settings: MLXSettings | None = None) -> None:
+    def __init__(
+        self,
+        settings: MLXSettings | None = None,
+        http_pool: HTTPClientPool | None = None,
+        dispatch: DispatchSettings | None = None,
+        latency_observer: LatencyObserver | None = None,
+        partitions: Collection[str] = (),
+    ) -> None:
         self._settings = settings or MLXSettings()
+        # Models given their own connection pool when pools are per model.
+        self._partitions = frozenset(partitions)
+        self._owns_pool = http_pool is None
+        self._http_pool = (
+            http_pool
+            if http_pool is not None
+            else HTTPClientPool.from_settings(self._settings)
+        )
+        dispatch = dispatch or DispatchSettings()
+        self._replicas = ReplicaPool.from_endpoints(
+            self._settings.replica_endpoints(), dispatch, observer=latency_observer
+        )
+        self._replicas.enable_health_checks(
+            self._probe,
+            interval=dispatch.health_check_interval,
+            timeout=dispatch.health_check_timeout,
+        )
         self._tools: list[Any] = []
 
     async def invoke(self, messages: Any, **kwargs: Any) -> Any:
         model_name = kwargs.pop("model", self._settings.model)
+        deadline = kwargs.pop("deadline", None)
         generation_kwargs = {**self._settings.to_model_kwargs(), **kwargs}
         if self._tools:
             generation_kwargs["tools"] = self._tools
 
-        return await self._call_openai(messages, model_name, generation_kwargs)
+        return await self._call_openai(
+            messages, model_name, generation_kwargs, deadline
+        )
 
     async def stream(
         self, messages: Any, **kwargs: Any
-    ) -> AsyncIterator[dict[str, Any]]:
+    ) -> AsyncIterator[dict[str, Any] | bytes]:
         model_name = kwargs.pop("model", self._settings.model)
+        deadline = kwargs.pop("deadline", None)
         generation_kwargs = {**self._settings.to_model_kwargs(), **kwargs}
         if self._tools:
             generation_kwargs["tools"] = self._tools
 
-        base_url = self._settings.require_host()
         payload: dict[str, Any] = {
             "model": model_name,
             "messages": messages,
@@ -42,37 +82,95 @@ class MLXClient(LLMClientProtocol):
         }
         payload.update(generation_kwargs)
 
-        headers = {"Content-Type": "application/json"}
+        relay = self._settings.stream_relay
+        affinity_key = self._replicas.affinity_key(messages)
 
-        async with httpx.AsyncClient(timeout=self._settings.timeout) as client:
-            async with client.stream(
-                "POST",
-                f"{base_url}/v1/chat/completions",
-                json=payload,
-                headers=headers,
-            ) as response:
-                response.raise_for_status()
+        # The request is issued lazily and the response is owned by the
+        # generator, so the upstream connection stays open exactly as long as
+        # the consumer keeps iterating (or until it calls ``aclose``).
+        async def _generator() -> AsyncIterator[dict[str, Any] | bytes]:
+            raw = self._stream_bytes(affinity_key, model_name, deadline, json=payload)
+            try:
+                async for data in _iter_sse_data(raw):
+                    # In relay mode the raw JSON bytes are handed to the router,
+                    # which only parses them when it has to rewrite the header.
+                    yield data if relay else json.loads(data)
+            finally:
+                await raw.aclose()
+
+        return _generator()
+
+    @property
+    def passthrough_enabled(self) -> bool:
+        """Whether raw OpenAI-compatible requests may be forwarded unparsed."""
 
-                async def _generator() -> AsyncIterator[dict[str, Any]]:
-                    async for line in response.aiter_lines():
-                        if not line:
-                            continue
-                        if line.startswith("data:"):
-                            data_text = line[len("data:") :].strip()
-                            if data_text == "[DONE]":
-                                break
-                            yield json.loads(data_text)
+        return self._settings.passthrough
 
-                return _generator()
+    async def passthrough(
+        self,
+        body: bytes,
+        provided: AbstractSet[str],
+        defaults: Mapping[str, Any],
+        *,
+        messages: Any = None,
+        model: str | None = None,
+        deadline: Deadline | None = None,
+    ) -> bytes:
+        """Forward a raw chat completion request and return the raw response body.
+
+        ``provided`` names the top-level keys present in ``body``. Missing
+        options are filled from ``defaults`` and the configured generation
+        defaults by splicing them into the raw bytes. The upstream response
+        is returned byte-for-byte so usage, tool calls and finish reasons
+        survive without being re-modelled. ``messages`` (the already parsed
+        request messages) only feeds prefix-affinity routing, ``model``
+        selects the connection pool and ``deadline`` bounds the call.
+        """
+
+        response = await self._post(
+            self._replicas.affinity_key(messages),
+            model,
+            deadline,
+            content=self._patch_raw_request(body, provided, defaults),
+        )
+        return response.content
+
+    async def passthrough_stream(
+        self,
+        body: bytes,
+        provided: AbstractSet[str],
+        defaults: Mapping[str, Any],
+        *,
+        messages: Any = None,
+        model: str | None = None,
+        deadline: Deadline | None = None,
+    ) -> AsyncIterator[bytes]:
+        """Forward a raw streaming request and relay the upstream SSE bytes."""
+
+        content = self._patch_raw_request(body, provided, defaults)
+        return self._stream_bytes(
+            self._replicas.affinity_key(messages), model, deadline, content=content
+        )
 
     def bind_tools(self, tools: list[Any]) -> "MLXClient":
         self._tools = tools
         return self
 
+    async def aclose(self) -> None:
+        """Stop health checks and release pooled connections owned by this client."""
+
+        await self._replicas.aclose()
+        if self._owns_pool:
+            await self._http_pool.aclose()
+
     async def _call_openai(
-        self, messages: Any, model_name: str, kwargs: dict[str, Any]
-    ) -> str:
-        base_url = self._settings.require_host()
+        self,
+        messages: Any,
+        model_name: str,
+        kwargs: dict[str, Any],
+        deadline: Deadline | None = None,
+    ) -> dict[str, Any]:
+        """Return the upstream completion, including its ``usage``."""
 
         payload: dict[str, Any] = {
             "model": model_name,
@@ -81,24 +179,129 @@ class MLXClient(LLMClientProtocol):
         }
         payload.update(kwargs)
 
-        headers = {"Content-Type": "application/json"}
-
-        async with httpx.AsyncClient(timeout=self._settings.timeout) as client:
-            response = await client.post(
-                f"{base_url}/v1/chat/completions",
-                json=payload,
-                headers=headers,
-            )
-            response.raise_for_status()
-            data = response.json()
+        response = await self._post(
+            self._replicas.affinity_key(messages), model_name, deadline, json=payload
+        )
+        data = response.json()
 
         try:
-            choice = data["choices"][0]
-            return str(choice["message"]["content"])
+            data["choices"][0]["message"]
         except (KeyError, IndexError, TypeError) as exc:
             raise RuntimeError(
                 "Malformed response from OpenAI-compatible MLX backend"
             ) from exc
+        return data
+
+    async def _post(
+        self,
+        affinity_key: int | None = None,
+        model: str | None = None,
+        deadline: Deadline | None = None,
+        **request_kwargs: Any,
+    ) -> httpx.Response:
+        """POST to the chosen replica and return the checked response."""
+
+        async with self._replicas.lease(affinity_key) as replica:
+            response = await wait_within(
+                self._http(replica, model).post(
+                    _COMPLETIONS_PATH, headers=_JSON_HEADERS, **request_kwargs
+                ),
+                deadline=deadline,
+            )
+            response.raise_for_status()
+            return response
+
+    async def _stream_bytes(
+        self,
+        affinity_key: int | None = None,
+        model: str | None = None,
+        deadline: Deadline | None = None,
+        **request_kwargs: Any,
+    ) -> AsyncIterator[bytes]:
+        """Stream a POST on the chosen replica, yielding raw response bytes.
+
+        The request is issued lazily and the response is owned by the
+        generator, so the upstream connection stays open exactly as long as
+        the consumer keeps iterating (or until it calls ``aclose``). The
+        replica counts the stream as outstanding until then; its latency
+        sample is the time to the first body chunk. The first-token and
+        inter-token timeouts, and ``deadline``, bound every wait.
+        """
+
+        first_token, inter_token = self._settings.token_timeouts()
+        timer = StreamTimer(
+            first_token=first_token, inter_token=inter_token, deadline=deadline
+        )
+        replica = self._replicas.acquire(affinity_key)
+        started = time.perf_counter()
+        ttft: float | None = None
+        total: float | None = None
+        failed = False
+        try:
+            client = self._http(replica, model)
+            request = client.build_request(
+                "POST",
+                _COMPLETIONS_PATH,
+                headers=_JSON_HEADERS,
+                timeout=self._settings.to_httpx_timeout(streaming=True),
+                **request_kwargs,
+            )
+            response = await timer.wait(client.send(request, stream=True))
+            try:
+                response.raise_for_status()
+                async for raw in timer.chunks(response.aiter_bytes()):
+                    if ttft is None:
+                        ttft = time.perf_counter() - started
+                    yield raw
+            finally:
+                await response.aclose()
+            total = time.perf_counter() - started
+        except BaseException as exc:
+            failed = is_replica_failure(exc)
+            raise
+        finally:
+            self._replicas.release(replica, ttft, failed=failed)
+            if ttft is not None or failed:
+                self._replicas.report(replica, ttft=ttft, total=total, failed=failed)
+
+    def _http(self, replica: Replica, model: str | None) -> httpx.AsyncClient:
+        """Return the pooled client for ``replica``, partitioned by model if set.
+
+        Only models in ``partitions`` get a pool of their own, so request
+        model names cannot create unbounded connection pools.
+        """
+
+        partitioned = self._settings.pool_per_model and model in self._partitions
+        partition = model if partitioned else None
+        return self._http_pool.get(replica.url, partition)
+
+    async def _probe(self, replica: Replica) -> None:
+        """Cheap liveness probe used by background health checks."""
+
+        response = await self._http_pool.get(replica.url).get("/v1/models")
+        response.raise_for_status()
+
+    def _patch_raw_request(
+        self,
+        body: bytes,
+        provided: AbstractSet[str],
+        defaults: Mapping[str, Any],
+    ) -> bytes:
+        candidates: dict[str, Any] = {**self._settings.to_model_kwargs(), **defaults}
+        if self._tools:
+            candidates["tools"] = self._tools
+        missing = {
+            key: value for key, value in candidates.items() if key not in provided
+        }
+        if not missing:
+            return body
+
+        start = body.find(b"{")
+        if start == -1:
+            raise ValueError("Chat completion request body must be a JSON object")
+        patch = json.dumps(missing, separators=(",", ":")).encode()
+        # Splice the missing members in front of the caller's own members.
+        return body[: start + 1] + patch[1:-1] + b"," + body[start + 1 :]
 
     def _format_messages(self, messages: Any) -> str:
         if isinstance(messages, str):
@@ -115,3 +318,33 @@ class MLXClient(LLMClientProtocol):
                 parts.append(str(message))
             return "\n".join(parts)
         return str(messages)
+
+
+async def _iter_sse_data(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """Yield the raw payload of each SSE ``data:`` line until ``[DONE]``.
+
+    The rest of the body (normally just end-of-stream) is still read so the
+    upstream request completes instead of being cut off.
+    """
+
+    pending = b""
+    done = False
+    async for raw in chunks:
+        if done:
+            continue
+        pending += raw
+        *lines, pending = pending.split(b"\n")
+        for line in lines:
+            line = line.strip()
+            if not line.startswith(b"data:"):
+                continue
+            data = line[len(b"data:") :].strip()
+            if data == b"[DONE]":
+                done = True
+                break
+            yield data
+    line = pending.strip()
+    if not done and line.startswith(b"data:"):
+        data = line[len(b"data:") :].strip()
+        if data and data != b"[DONE]":
+            yield data
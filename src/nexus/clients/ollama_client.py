@@ -2,16 +2,44 @@
 
 from __future__ import annotations
 
-from typing import Any, AsyncIterator
+import json
+import time
+from typing import Any, AsyncIterator, Collection
 
+from ..config.dispatch_settings import DispatchSettings
 from ..config.ollama_settings import OllamaSettings
+from ..dispatch.deadline import StreamTimer, wait_within
+from ..dispatch.replica_pool import (
+    LatencyObserver,
+    Replica,
+    ReplicaPool,
+    is_replica_failure,
+)
 from ..protocols.llm_client_protocol import LLMClientProtocol
 
+# OpenAI sampling parameters and the Ollama ``options`` they map to; other
+# keyword arguments are passed to ``AsyncClient.chat`` unchanged.
+_OPTION_NAMES = {
+    "temperature": "temperature",
+    "top_p": "top_p",
+    "max_tokens": "num_predict",
+    "stop": "stop",
+    "seed": "seed",
+    "presence_penalty": "presence_penalty",
+    "frequency_penalty": "frequency_penalty",
+}
+
 
 class OllamaClient(LLMClientProtocol):
     """Client that communicates with an Ollama runtime."""
 
-    def __init__(self, settings: OllamaSettings) -> None:
+    def __init__(
+        self,
+        settings: OllamaSettings,
+        dispatch: DispatchSettings | None = None,
+        latency_observer: LatencyObserver | None = None,
+        partitions: Collection[str] = (),
+    ) -> None:
         try:
             from ollama import AsyncClient
         except (
@@ -22,24 +50,46 @@ class OllamaClient(LLMClientProtocol):
             ) from exc
 
         self._settings = settings
-        self._client = AsyncClient(host=settings.host)
+        dispatch = dispatch or DispatchSettings()
+        self._replicas = ReplicaPool.from_endpoints(
+            settings.replica_endpoints(), dispatch, observer=latency_observer
+        )
+        self._replicas.enable_health_checks(
+            self._probe,
+            interval=dispatch.health_check_interval,
+            timeout=dispatch.health_check_timeout,
+        )
+        self._client_class = AsyncClient
+        # One keep-alive HTTP client per replica endpoint (and per model in
+        # ``partitions`` when pools are partitioned), created on first use.
+        self._partitions = frozenset(partitions)
+        self._clients: dict[tuple[str, str | None], Any] = {}
         self._tools: list[Any] = []
 
     async def invoke(self, messages: Any, **kwargs: Any) -> Any:
         model_name = kwargs.pop("model", self._settings.model)
+        deadline = kwargs.pop("deadline", None)
         payload: dict[str, Any] = {
             "model": model_name,
             "messages": messages,
         }
         if self._tools:
             payload["tools"] = self._tools
-        payload.update(kwargs)
-        return await self._client.chat(**payload)
+        payload.update(_chat_options(kwargs))
+        affinity_key = self._replicas.affinity_key(messages)
+        async with self._replicas.lease(affinity_key) as replica:
+            response = await wait_within(
+                self._client(replica, model_name).chat(**payload),
+                timeout=self._settings.timeout,
+                deadline=deadline,
+            )
+        return _openai_completion(response)
 
     async def stream(
         self, messages: Any, **kwargs: Any
     ) -> AsyncIterator[dict[str, Any]]:
         model_name = kwargs.pop("model", self._settings.model)
+        deadline = kwargs.pop("deadline", None)
         payload: dict[str, Any] = {
             "model": model_name,
             "messages": messages,
@@ -47,15 +97,172 @@ class OllamaClient(LLMClientProtocol):
         }
         if self._tools:
             payload["tools"] = self._tools
-        payload.update(kwargs)
-        stream = await self._client.chat(**payload)
+        payload.update(_chat_options(kwargs))
+        affinity_key = self._replicas.affinity_key(messages)
 
+        # The replica is chosen lazily so an unconsumed iterator holds nothing.
         async def _generator() -> AsyncIterator[dict[str, Any]]:
-            async for chunk in stream:
-                yield chunk
+            timer = StreamTimer(
+                first_token=self._settings.first_token_timeout,
+                inter_token=self._settings.inter_token_timeout,
+                deadline=deadline,
+            )
+            replica = self._replicas.acquire(affinity_key)
+            started = time.perf_counter()
+            latency: float | None = None
+            total: float | None = None
+            failed = False
+            stream = None
+            try:
+                stream = await timer.wait(
+                    self._client(replica, model_name).chat(**payload)
+                )
+                async for chunk in timer.chunks(stream):
+                    if latency is None:
+                        latency = time.perf_counter() - started
+                    yield _openai_chunk(chunk)
+                total = time.perf_counter() - started
+            except BaseException as exc:
+                failed = is_replica_failure(exc)
+                raise
+            finally:
+                # Release the upstream HTTP response as soon as the consumer
+                # stops iterating instead of waiting for garbage collection.
+                if stream is not None:
+                    await stream.aclose()
+                self._replicas.release(replica, latency, failed=failed)
+                if latency is not None or failed:
+                    self._replicas.report(
+                        replica, ttft=latency, total=total, failed=failed
+                    )
 
         return _generator()
 
     def bind_tools(self, tools: list[Any]) -> "OllamaClient":
         self._tools = tools
         return self
+
+    async def aclose(self) -> None:
+        """Stop health checks and close the underlying Ollama HTTP clients."""
+
+        await self._replicas.aclose()
+        clients = list(self._clients.values())
+        self._clients.clear()
+        for client in clients:
+            await client.close()
+
+    def _client(self, replica: Replica, model: str | None = None) -> Any:
+        """Return the HTTP client for ``replica``, partitioned by model if set."""
+
+        partitioned = self._settings.pool_per_model and model in self._partitions
+        key = (replica.url, model if partitioned else None)
+        client = self._clients.get(key)
+        if client is None:
+            client = self._client_class(
+                host=replica.url, timeout=self._settings.to_httpx_timeout()
+            )
+            self._clients[key] = client
+        return client
+
+    async def _probe(self, replica: Replica) -> None:
+        """Cheap liveness probe (``/api/tags``) used by background health checks."""
+
+        await self._client(replica).list()
+
+
+def _chat_options(kwargs: dict[str, Any]) -> dict[str, Any]:
+    """Move OpenAI sampling parameters in ``kwargs`` under Ollama ``options``."""
+
+    arguments = dict(kwargs)
+    options = dict(arguments.pop("options", None) or {})
+    for name, option in _OPTION_NAMES.items():
+        value = arguments.pop(name, None)
+        if value is not None:
+            options.setdefault(option, value)
+    if options:
+        arguments["options"] = options
+    return arguments
+
+
+def _openai_completion(response: Any) -> dict[str, Any]:
+    """Translate an Ollama chat response into an OpenAI chat completion."""
+
+    message = response["message"]
+    tool_calls = _tool_calls(message)
+    return {
+        "choices": [
+            {
+                "index": 0,
+                "message": {
+                    "role": message.get("role") or "assistant",
+                    "content": message.get("content"),
+                    "tool_calls": tool_calls or None,
+                },
+                "finish_reason": _finish_reason(response, tool_calls) or "stop",
+            }
+        ],
+        "usage": _usage(response),
+    }
+
+
+def _openai_chunk(chunk: Any) -> dict[str, Any]:
+    """Translate an Ollama stream chunk into an OpenAI completion chunk.
+
+    The final chunk carries the stream's ``usage``.
+    """
+
+    message = chunk.get("message") or {}
+    delta: dict[str, Any] = {"content": message.get("content") or ""}
+    if message.get("role"):
+        delta["role"] = message["role"]
+    tool_calls = _tool_calls(message)
+    if tool_calls:
+        delta["tool_calls"] = [
+            {"index": index, **call} for index, call in enumerate(tool_calls)
+        ]
+    translated: dict[str, Any] = {
+        "choices": [
+            {
+                "index": 0,
+                "delta": delta,
+                "finish_reason": _finish_reason(chunk, tool_calls),
+            }
+        ]
+    }
+    if chunk.get("done"):
+        translated["usage"] = _usage(chunk)
+    return translated
+
+
+def _tool_calls(message: Any) -> list[dict[str, Any]]:
+    return [
+        {
+            "id": f"call_{index}",
+            "type": "function",
+            "function": {
+                "name": call["function"]["name"],
+                "arguments": json.dumps(call["function"]["arguments"]),
+            },
+        }
+        for index, call in enumerate(message.get("tool_calls") or ())
+    ]
+
+
+def _finish_reason(response: Any, tool_calls: list[Any]) -> str | None:
+    if tool_calls:
+        return "tool_calls"
+    if not response.get("done"):
+        return None
+    return response.get("done_reason") or "stop"
+
+
+def _usage(response: Any) -> dict[str, int]:
+    """Map Ollama's prompt and generation counts to OpenAI ``usage``."""
+
+    prompt = response.get("prompt_eval_count") or 0
+    completion = response.get("eval_count") or 0
+    return {
+        "prompt_tokens": prompt,
+        "completion_tokens": completion,
+        "total_tokens": prompt + completion,
+    }
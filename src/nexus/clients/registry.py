@@ -0,0 +1,114 @@
+"""Registry that keeps constructed LLM clients alive across requests."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import threading
+from typing import Callable, Hashable
+
+from pydantic import BaseModel
+
+from ..protocols.llm_client_protocol import LLMClientProtocol
+
+LOGGER = logging.getLogger(__name__)
+
+
+def settings_fingerprint(*settings: BaseModel) -> str:
+    """Return a stable digest identifying the given settings values."""
+
+    digest = hashlib.sha256()
+    for item in settings:
+        digest.update(type(item).__name__.encode())
+        digest.update(item.model_dump_json().encode())
+    return digest.hexdigest()
+
+
+class LLMClientRegistry:
+    """Create each LLM client once per key and share it between requests.
+
+    Keys are typically ``(backend, use_mock, settings_fingerprint)`` so that a
+    configuration change yields a fresh client while unchanged settings keep
+    reusing the same instance (and its connection pool).
+    """
+
+    def __init__(self) -> None:
+        self._clients: dict[Hashable, LLMClientProtocol] = {}
+        self._retired: list[LLMClientProtocol] = []
+        self._closing: set[asyncio.Task[None]] = set()
+        # Sync FastAPI dependencies run in a threadpool, so guard creation.
+        self._lock = threading.Lock()
+
+    def get_or_create(
+        self,
+        key: Hashable,
+        factory: Callable[[], LLMClientProtocol],
+    ) -> LLMClientProtocol:
+        """Return the client registered under ``key``, building it if needed."""
+
+        client = self._clients.get(key)
+        if client is not None:
+            return client
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                client = factory()
+                self._clients[key] = client
+        return client
+
+    def retire(
+        self, predicate: Callable[[Hashable], bool], *, grace: float = 0.0
+    ) -> int:
+        """Stop handing out clients whose key matches ``predicate``.
+
+        Retired clients may still serve in-flight requests, so they are
+        closed ``grace`` seconds later (or with the registry when no event
+        loop is running).
+        """
+
+        with self._lock:
+            stale = [key for key in self._clients if predicate(key)]
+            retired = [self._clients.pop(key) for key in stale]
+            self._retired.extend(retired)
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return len(stale)
+        for client in retired:
+            loop.call_later(grace, self._close_retired, client)
+        return len(stale)
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    async def aclose(self) -> None:
+        """Close every registered client that exposes an ``aclose`` coroutine."""
+
+        with self._lock:
+            clients = [*self._clients.values(), *self._retired]
+            self._clients.clear()
+            self._retired.clear()
+        for client in clients:
+            await _close(client)
+        if self._closing:
+            await asyncio.wait(self._closing)
+
+    def _close_retired(self, client: LLMClientProtocol) -> None:
+        with self._lock:
+            if client not in self._retired:
+                return  # Already closed with the registry.
+            self._retired.remove(client)
+        task = asyncio.ensure_future(_close(client))
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+
+async def _close(client: LLMClientProtocol) -> None:
+    close = getattr(client, "aclose", None)
+    if close is None:
+        return
+    try:
+        await close()
+    except Exception:  # pragma: no cover - best-effort shutdown
+        LOGGER.exception("Failed to close LLM client %r", client)
@@ -1,10 +1,16 @@
 """Configuration module exposed by the template."""
 
+from .admission_settings import AdmissionSettings
+from .cache_settings import CacheSettings
+from .dispatch_settings import DispatchSettings
 from .mlx_settings import MLXSettings
 from .nexus_settings import NexusSettings, settings
 from .ollama_settings import OllamaSettings
 
 __all__ = [
+    "AdmissionSettings",
+    "CacheSettings",
+    "DispatchSettings",
     "NexusSettings",
     "MLXSettings",
     "OllamaSettings",
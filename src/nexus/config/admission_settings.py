@@ -0,0 +1,208 @@
+"""Settings for admission control in front of the LLM backends."""
+
+from __future__ import annotations
+
+from typing import Callable, TypeVar
+
+from pydantic import Field, model_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+N = TypeVar("N", int, float)
+
+
+class AdmissionSettings(BaseSettings):
+    """Per-backend concurrency limit and wait queue configuration."""
+
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        extra="ignore",
+        populate_by_name=True,
+    )
+
+    max_concurrency: int = Field(
+        default=0,
+        ge=0,
+        title="Max Backend Concurrency",
+        description=(
+            "Generations allowed to run concurrently per backend (the upper "
+            "bound when adaptive); further requests queue. 0 disables "
+            "admission control."
+        ),
+        alias="NEXUS_ADMISSION_MAX_CONCURRENCY",
+    )
+    adaptive: bool = Field(
+        default=False,
+        title="Adaptive Concurrency",
+        description=(
+            "Adjust the concurrency limit from observed time-to-first-token "
+            "and total latency."
+        ),
+        alias="NEXUS_ADMISSION_ADAPTIVE",
+    )
+    min_concurrency: int = Field(
+        default=1,
+        ge=1,
+        title="Min Backend Concurrency",
+        description="Lower bound of the adaptive concurrency limit.",
+        alias="NEXUS_ADMISSION_MIN_CONCURRENCY",
+    )
+    latency_tolerance: float = Field(
+        default=1.5,
+        ge=1,
+        title="Latency Tolerance",
+        description=(
+            "How far recent latency may exceed its long-term baseline before "
+            "the adaptive limit shrinks."
+        ),
+        alias="NEXUS_ADMISSION_LATENCY_TOLERANCE",
+    )
+    max_queue: int = Field(
+        default=64,
+        ge=0,
+        title="Admission Queue Size",
+        description="Requests allowed to wait for a slot before new ones get 429.",
+        alias="NEXUS_ADMISSION_MAX_QUEUE",
+    )
+    max_queue_wait: float = Field(
+        default=30.0,
+        gt=0,
+        title="Admission Queue Wait",
+        description="Seconds a request may wait for a slot before it gets 503.",
+        alias="NEXUS_ADMISSION_MAX_QUEUE_WAIT",
+    )
+    priority_classes: str = Field(
+        default="interactive,default,batch",
+        title="Priority Classes",
+        description=(
+            "Comma-separated priority class names, most urgent first. Queued "
+            "requests of a class are served only once every more urgent "
+            "class is empty."
+        ),
+        alias="NEXUS_ADMISSION_PRIORITY_CLASSES",
+    )
+    default_priority: str = Field(
+        default="default",
+        title="Default Priority",
+        description="Class used for requests without (or with an unknown) priority.",
+        alias="NEXUS_ADMISSION_DEFAULT_PRIORITY",
+    )
+    tenant_weights: str = Field(
+        default="",
+        title="Tenant Weights",
+        description=(
+            "Comma-separated tenant=weight pairs giving tenants a larger share "
+            "of their priority class; unlisted tenants weigh 1."
+        ),
+        alias="NEXUS_ADMISSION_TENANT_WEIGHTS",
+    )
+    model_concurrency: str = Field(
+        default="",
+        title="Per-Model Concurrency",
+        description=(
+            "Comma-separated model=limit pairs isolating each listed model in "
+            "its own bulkhead, so a slow model cannot hold every backend slot."
+        ),
+        alias="NEXUS_ADMISSION_MODEL_CONCURRENCY",
+    )
+    default_model_concurrency: int = Field(
+        default=0,
+        ge=0,
+        title="Default Per-Model Concurrency",
+        description=(
+            "Size of the bulkhead shared by all models not listed in the "
+            "per-model limits; 0 leaves them limited only by the backend."
+        ),
+        alias="NEXUS_ADMISSION_DEFAULT_MODEL_CONCURRENCY",
+    )
+    tokens_per_minute: int = Field(
+        default=0,
+        ge=0,
+        title="Tenant Token Rate",
+        description=(
+            "LLM tokens each tenant may consume per minute, metered by "
+            "estimated prompt tokens and reconciled with reported usage. "
+            "0 disables token rate limiting."
+        ),
+        alias="NEXUS_ADMISSION_TOKENS_PER_MINUTE",
+    )
+    token_burst: int = Field(
+        default=0,
+        ge=0,
+        title="Tenant Token Burst",
+        description="Token bucket capacity; 0 means one minute's worth of tokens.",
+        alias="NEXUS_ADMISSION_TOKEN_BURST",
+    )
+    token_max_wait: float = Field(
+        default=0.0,
+        ge=0,
+        title="Token Budget Wait",
+        description=(
+            "Seconds a request may wait for its tenant's budget to refill "
+            "before it gets 429."
+        ),
+        alias="NEXUS_ADMISSION_TOKEN_MAX_WAIT",
+    )
+    token_store_path: str | None = Field(
+        default=None,
+        title="Token Bucket Store",
+        description=(
+            "SQLite file holding token buckets so every worker on the host "
+            "shares one budget per tenant; unset keeps them in process."
+        ),
+        alias="NEXUS_ADMISSION_TOKEN_STORE_PATH",
+    )
+
+    @model_validator(mode="after")
+    def _check_priorities(self) -> "AdmissionSettings":
+        if not self.priorities():
+            raise ValueError("At least one priority class is required")
+        if self.default_priority not in self.priorities():
+            raise ValueError(
+                f"Default priority {self.default_priority!r} is not one of "
+                f"{self.priorities()}"
+            )
+        self.weights()
+        self.model_limits()
+        return self
+
+    def priorities(self) -> list[str]:
+        """Return the configured priority classes, most urgent first."""
+
+        return [
+            name.strip() for name in self.priority_classes.split(",") if name.strip()
+        ]
+
+    def weights(self) -> dict[str, float]:
+        """Parse ``tenant_weights`` into a ``{tenant: weight}`` mapping."""
+
+        return _parse_pairs(self.tenant_weights, float, "tenant weight")
+
+    def model_limits(self) -> dict[str, int]:
+        """Parse ``model_concurrency`` into a ``{model: limit}`` mapping."""
+
+        return _parse_pairs(self.model_concurrency, int, "model concurrency")
+
+    def model_limit(self, model: str) -> int:
+        """Return the bulkhead size for ``model``; 0 means no bulkhead."""
+
+        return self.model_limits().get(model, self.default_model_concurrency)
+
+
+def _parse_pairs(raw: str, cast: Callable[[str], N], what: str) -> dict[str, N]:
+    """Parse ``"name=value,name=value"`` with positive values."""
+
+    pairs: dict[str, N] = {}
+    for entry in raw.split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+        name, sep, value = entry.rpartition("=")
+        try:
+            parsed = cast(value)
+        except ValueError:
+            parsed = cast("0")
+        if not sep or not name.strip() or parsed <= 0:
+            raise ValueError(f"Invalid {what}: {entry!r}")
+        pairs[name.strip()] = parsed
+    return pairs
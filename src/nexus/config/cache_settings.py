@@ -0,0 +1,83 @@
+"""Settings for the chat completion response cache."""
+
+from __future__ import annotations
+
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class CacheSettings(BaseSettings):
+    """Configuration for caching deterministic chat completion results."""
+
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        extra="ignore",
+        populate_by_name=True,
+    )
+
+    enabled: bool = Field(
+        default=False,
+        title="Response Cache Enabled",
+        description="Serve repeated temperature=0 chat completions from a cache.",
+        alias="NEXUS_CACHE_ENABLED",
+    )
+    max_bytes: int = Field(
+        default=64 * 1024 * 1024,
+        gt=0,
+        title="Response Cache Size",
+        description="Maximum total size (bytes) of cached completions.",
+        alias="NEXUS_CACHE_MAX_BYTES",
+    )
+    ttl: float = Field(
+        default=300.0,
+        gt=0,
+        title="Response Cache TTL",
+        description="Seconds a cached completion stays valid.",
+        alias="NEXUS_CACHE_TTL",
+    )
+    single_flight: bool = Field(
+        default=False,
+        title="Single-Flight Requests",
+        description=(
+            "Let concurrent identical temperature=0 completions share one "
+            "backend call."
+        ),
+        alias="NEXUS_CACHE_SINGLE_FLIGHT",
+    )
+    stream_multicast: bool = Field(
+        default=False,
+        title="Stream Multicast",
+        description=(
+            "Let concurrent identical temperature=0 streaming completions "
+            "share one backend stream."
+        ),
+        alias="NEXUS_CACHE_STREAM_MULTICAST",
+    )
+    multicast_max_replay: int = Field(
+        default=1024,
+        ge=1,
+        title="Multicast Replay Chunks",
+        description=(
+            "Chunks a shared stream buffers for late joiners; once exceeded, "
+            "new identical requests start their own stream. A subscriber "
+            "further behind than this is detached with an error event."
+        ),
+        alias="NEXUS_CACHE_MULTICAST_MAX_REPLAY",
+    )
+    path: str | None = Field(
+        default=None,
+        title="Disk Cache Path",
+        description=(
+            "SQLite file backing a persistent cache tier shared by every worker "
+            "on the host. Unset keeps the cache in memory only."
+        ),
+        alias="NEXUS_CACHE_PATH",
+    )
+    disk_max_bytes: int = Field(
+        default=1024 * 1024 * 1024,
+        gt=0,
+        title="Disk Cache Size",
+        description="Maximum total size (bytes) of completions kept on disk.",
+        alias="NEXUS_CACHE_DISK_MAX_BYTES",
+    )
@@ -0,0 +1,121 @@
+"""Settings controlling how requests are spread across backend replicas."""
+
+from __future__ import annotations
+
+import math
+from typing import Literal
+
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class DispatchSettings(BaseSettings):
+    """Load-balancing configuration shared by every backend client."""
+
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        extra="ignore",
+        populate_by_name=True,
+    )
+
+    strategy: Literal["least_outstanding", "p2c", "prefix_affinity"] = Field(
+        default="least_outstanding",
+        title="Balancing Strategy",
+        description=(
+            "Replica selection strategy: least_outstanding scans every replica, "
+            "p2c compares two weighted random choices, prefix_affinity pins "
+            "conversations to a replica by hashing their leading messages."
+        ),
+        alias="NEXUS_DISPATCH_STRATEGY",
+    )
+    ewma_alpha: float = Field(
+        default=0.3,
+        gt=0,
+        le=1,
+        title="EWMA Smoothing",
+        description="Weight of the newest latency sample in the per-replica EWMA.",
+        alias="NEXUS_DISPATCH_EWMA_ALPHA",
+    )
+    affinity_turns: int = Field(
+        default=1,
+        ge=0,
+        title="Affinity Prefix Turns",
+        description=(
+            "Non-system messages hashed together with the leading system "
+            "messages when routing by prefix affinity."
+        ),
+        alias="NEXUS_DISPATCH_AFFINITY_TURNS",
+    )
+    affinity_load_factor: float = Field(
+        default=1.25,
+        ge=1,
+        title="Affinity Load Factor",
+        description=(
+            "Multiple of its weighted share of outstanding requests a replica "
+            "may hold before prefix-affine requests spill to the next replica."
+        ),
+        alias="NEXUS_DISPATCH_AFFINITY_LOAD_FACTOR",
+    )
+    failure_threshold: int = Field(
+        default=5,
+        ge=1,
+        title="Circuit Failure Threshold",
+        description="Consecutive failures that open a replica's circuit breaker.",
+        alias="NEXUS_DISPATCH_FAILURE_THRESHOLD",
+    )
+    open_duration: float = Field(
+        default=10.0,
+        ge=0,
+        title="Circuit Open Duration",
+        description="Seconds an open circuit waits before a half-open trial request.",
+        alias="NEXUS_DISPATCH_OPEN_DURATION",
+    )
+    slow_call_threshold: float = Field(
+        default=0.0,
+        ge=0,
+        title="Slow Call Threshold",
+        description=(
+            "Latency (seconds) above which a call counts as a failure; "
+            "0 disables latency-based ejection."
+        ),
+        alias="NEXUS_DISPATCH_SLOW_CALL_THRESHOLD",
+    )
+    health_check_interval: float = Field(
+        default=0.0,
+        ge=0,
+        title="Health Check Interval",
+        description="Seconds between background replica probes; 0 disables them.",
+        alias="NEXUS_DISPATCH_HEALTH_CHECK_INTERVAL",
+    )
+    health_check_timeout: float = Field(
+        default=2.0,
+        gt=0,
+        title="Health Check Timeout",
+        description="Seconds a health probe may take before it counts as failed.",
+        alias="NEXUS_DISPATCH_HEALTH_CHECK_TIMEOUT",
+    )
+
+
+def parse_replicas(raw: str, default: str) -> list[tuple[str, float]]:
+    """Parse ``"url[=weight],url[=weight]"`` into ``(url, weight)`` pairs.
+
+    Falls back to ``[(default, 1.0)]`` when ``raw`` is empty.
+    """
+
+    replicas: list[tuple[str, float]] = []
+    for entry in raw.split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+        url, weight = entry, 1.0
+        head, sep, tail = entry.rpartition("=")
+        if sep:
+            try:
+                url, weight = head, float(tail)
+            except ValueError:
+                url, weight = entry, 1.0
+        if not (math.isfinite(weight) and weight > 0):
+            raise ValueError(f"Replica weight must be a positive number: {entry!r}")
+        replicas.append((url.strip().rstrip("/"), weight))
+    return replicas or [(default.rstrip("/"), 1.0)]
@@ -4,9 +4,12 @@ from __future__ import annotations
 
 from typing import Any
 
-from pydantic import AnyHttpUrl, Field
+import httpx
+from pydantic import AnyHttpUrl, Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from .dispatch_settings import parse_replicas
+
 
 class MLXSettings(BaseSettings):
     """Configuration values for MLX execution and routing."""
@@ -23,6 +26,14 @@ class MLXSettings(BaseSettings):
         alias="NEXUS_MLX_HOST",
         description="Remote MLX server base URL.",
     )
+    replicas: str = Field(
+        default="",
+        alias="NEXUS_MLX_REPLICAS",
+        description=(
+            "Comma-separated MLX replica URLs with optional weights "
+            "(url=weight). Defaults to the single host."
+        ),
+    )
     model: str = Field(
         default="mlx-community/TinyLlama-1.1B-Chat-v1.0-4bit",
         alias="NEXUS_MLX_MODEL",
@@ -48,12 +59,128 @@ class MLXSettings(BaseSettings):
         alias="NEXUS_MLX_TIMEOUT",
         description="Timeout applied to HTTP requests (seconds).",
     )
+    pool_max_connections: int = Field(
+        default=100,
+        alias="NEXUS_MLX_POOL_MAX_CONNECTIONS",
+        description="Maximum number of concurrent connections per MLX host.",
+    )
+    pool_max_keepalive: int = Field(
+        default=20,
+        alias="NEXUS_MLX_POOL_MAX_KEEPALIVE",
+        description="Maximum number of idle keep-alive connections per MLX host.",
+    )
+    pool_per_model: bool = Field(
+        default=False,
+        alias="NEXUS_MLX_POOL_PER_MODEL",
+        description=(
+            "Give every model with its own admission bulkhead its own "
+            "connection pool per MLX host so a slow model cannot use up the "
+            "connections of the others; other models share the host's pool."
+        ),
+    )
+    keepalive_expiry: float = Field(
+        default=30.0,
+        alias="NEXUS_MLX_KEEPALIVE_EXPIRY",
+        description="Seconds an idle keep-alive connection is retained.",
+    )
+    connect_timeout: float = Field(
+        default=5.0,
+        alias="NEXUS_MLX_CONNECT_TIMEOUT",
+        description="Timeout for establishing a connection (seconds).",
+    )
+    read_timeout: float | None = Field(
+        default=None,
+        alias="NEXUS_MLX_READ_TIMEOUT",
+        description="Timeout between received bytes (seconds); defaults to timeout.",
+    )
+    first_token_timeout: float | None = Field(
+        default=None,
+        gt=0,
+        alias="NEXUS_MLX_FIRST_TOKEN_TIMEOUT",
+        description=(
+            "Time a stream may take to deliver its first chunk (seconds); "
+            "defaults to the read timeout."
+        ),
+    )
+    inter_token_timeout: float | None = Field(
+        default=None,
+        gt=0,
+        alias="NEXUS_MLX_INTER_TOKEN_TIMEOUT",
+        description=(
+            "Longest gap between two streamed chunks (seconds); defaults to "
+            "the read timeout."
+        ),
+    )
+    passthrough: bool = Field(
+        default=False,
+        alias="NEXUS_MLX_PASSTHROUGH",
+        description="Forward raw request/response bytes to OpenAI-compatible backends.",
+    )
+    stream_relay: bool = Field(
+        default=True,
+        alias="NEXUS_MLX_STREAM_RELAY",
+        description="Relay streamed chunks as raw bytes instead of parsing each one.",
+    )
+
+    @field_validator("replicas")
+    @classmethod
+    def _validate_replicas(cls, value: str) -> str:
+        parse_replicas(value, default="")
+        return value
 
     def require_host(self) -> str:
         """Return the configured host."""
 
         return str(self.host).rstrip("/")
 
+    def replica_endpoints(self) -> list[tuple[str, float]]:
+        """Return ``(url, weight)`` pairs for every configured MLX replica."""
+
+        return parse_replicas(self.replicas, default=self.require_host())
+
+    def to_httpx_limits(self) -> httpx.Limits:
+        """Return connection pool limits for pooled HTTP clients."""
+
+        return httpx.Limits(
+            max_connections=self.pool_max_connections,
+            max_keepalive_connections=self.pool_max_keepalive,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+    def to_httpx_timeout(self, *, streaming: bool = False) -> httpx.Timeout:
+        """Return per-phase timeouts for pooled HTTP clients.
+
+        Streams timed by :meth:`token_timeouts` have no read timeout of their
+        own.
+        """
+
+        read_timeout: float | None = self._read_timeout()
+        if streaming and self.token_timeouts() != (None, None):
+            read_timeout = None
+        return httpx.Timeout(
+            self.timeout,
+            connect=self.connect_timeout,
+            read=read_timeout,
+        )
+
+    def token_timeouts(self) -> tuple[float | None, float | None]:
+        """Return the ``(first token, inter-token)`` timeouts for streams.
+
+        Both are ``None`` (streams only use the read timeout) unless one is
+        configured; the other then falls back to the read timeout.
+        """
+
+        if self.first_token_timeout is None and self.inter_token_timeout is None:
+            return None, None
+        read_timeout = self._read_timeout()
+        return (
+            self.first_token_timeout or read_timeout,
+            self.inter_token_timeout or read_timeout,
+        )
+
+    def _read_timeout(self) -> float:
+        return self.read_timeout if self.read_timeout is not None else self.timeout
+
     def to_model_kwargs(self) -> dict[str, Any]:
         """Return keyword arguments common to MLX generation calls."""
 
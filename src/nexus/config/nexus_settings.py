@@ -1,5 +1,9 @@
 """Application-level settings for the FastAPI template."""
 
+from __future__ import annotations
+
+from typing import Literal
+
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -44,6 +48,25 @@ class NexusSettings(BaseSettings):
         description="Enable debug mode.",
         alias="NEXUS_DEBUG",
     )
+    admin_token: str | None = Field(
+        default=None,
+        title="Admin Token",
+        description=(
+            "Bearer token required by the /admin endpoints. Without one they "
+            "are disabled."
+        ),
+        alias="NEXUS_ADMIN_TOKEN",
+    )
+    reload_grace_period: float = Field(
+        default=300.0,
+        ge=0,
+        title="Reload Grace Period",
+        description=(
+            "Seconds clients built from a previous configuration keep serving "
+            "in-flight requests after a reload before they are closed."
+        ),
+        alias="NEXUS_RELOAD_GRACE_PERIOD",
+    )
     llm_backend: str = Field(
         default="ollama",
         title="LLM Backend",
@@ -62,6 +85,100 @@ class NexusSettings(BaseSettings):
         description="Toggle mock MLX client for tests.",
         alias="NEXUS_USE_MOCK_MLX",
     )
+    sse_coalesce_delay_ms: float = Field(
+        default=0.0,
+        title="SSE Coalesce Delay",
+        description=(
+            "Maximum time (ms) streamed events are buffered before being "
+            "flushed together. 0 disables coalescing."
+        ),
+        alias="NEXUS_SSE_COALESCE_DELAY_MS",
+    )
+    sse_coalesce_max_bytes: int = Field(
+        default=16384,
+        title="SSE Coalesce Max Bytes",
+        description="Flush buffered streamed events once they reach this size.",
+        alias="NEXUS_SSE_COALESCE_MAX_BYTES",
+    )
+    sse_buffer_max_bytes: int = Field(
+        default=0,
+        ge=0,
+        title="SSE Buffer Size",
+        description=(
+            "Per-stream buffer that drains the backend at full speed while a "
+            "slow client catches up. 0 disables buffering."
+        ),
+        alias="NEXUS_SSE_BUFFER_MAX_BYTES",
+    )
+    sse_buffer_budget_bytes: int = Field(
+        default=64 * 1024 * 1024,
+        gt=0,
+        title="SSE Buffer Budget",
+        description="Total bytes all buffered streams may hold at once.",
+        alias="NEXUS_SSE_BUFFER_BUDGET_BYTES",
+    )
+    sse_buffer_overflow: Literal["backpressure", "abort"] = Field(
+        default="backpressure",
+        title="SSE Buffer Overflow Policy",
+        description=(
+            "What a stream does once the buffer budget is used up: "
+            "backpressure reads the backend only as fast as the client, "
+            "abort ends the stream with an error event."
+        ),
+        alias="NEXUS_SSE_BUFFER_OVERFLOW",
+    )
+    sse_resume_ttl: float = Field(
+        default=0.0,
+        ge=0,
+        title="SSE Resume Window",
+        description=(
+            "Seconds a stream stays resumable with Last-Event-ID after its "
+            "client disconnects or it finishes. 0 disables resumable streams."
+        ),
+        alias="NEXUS_SSE_RESUME_TTL",
+    )
+    sse_resume_max_bytes: int = Field(
+        default=1024 * 1024,
+        gt=0,
+        title="SSE Resume Buffer Size",
+        description="Bytes of recent events kept per stream for resuming.",
+        alias="NEXUS_SSE_RESUME_MAX_BYTES",
+    )
+    sse_resume_max_streams: int = Field(
+        default=1024,
+        gt=0,
+        title="SSE Resumable Streams",
+        description="Maximum number of streams kept resumable at once.",
+        alias="NEXUS_SSE_RESUME_MAX_STREAMS",
+    )
+    request_timeout: float = Field(
+        default=0.0,
+        ge=0,
+        title="Request Deadline",
+        description=(
+            "Seconds a chat completion may take end to end, including "
+            "admission queueing. Callers may ask for less with the "
+            "X-Nexus-Timeout header. 0 sets no default deadline."
+        ),
+        alias="NEXUS_REQUEST_TIMEOUT",
+    )
+    idempotency_ttl: float = Field(
+        default=0.0,
+        ge=0,
+        title="Idempotency Window",
+        description=(
+            "Seconds a chat completion sent with an Idempotency-Key is replayed "
+            "to retries instead of generated again. 0 ignores the header."
+        ),
+        alias="NEXUS_IDEMPOTENCY_TTL",
+    )
+    idempotency_max_bytes: int = Field(
+        default=64 * 1024 * 1024,
+        gt=0,
+        title="Idempotency Store Size",
+        description="Maximum total size (bytes) of responses kept for retries.",
+        alias="NEXUS_IDEMPOTENCY_MAX_BYTES",
+    )
 
 
 settings = NexusSettings()
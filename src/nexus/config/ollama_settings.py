@@ -1,8 +1,13 @@
 """Settings for configuring the Ollama client."""
 
-from pydantic import AnyHttpUrl, Field
+from __future__ import annotations
+
+import httpx
+from pydantic import AnyHttpUrl, Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from .dispatch_settings import parse_replicas
+
 
 class OllamaSettings(BaseSettings):
     """Configuration for interacting with an Ollama deployment."""
@@ -20,9 +25,85 @@ class OllamaSettings(BaseSettings):
         description="The base URL for the Ollama service.",
         alias="NEXUS_OLLAMA_HOST",
     )
+    replicas: str = Field(
+        default="",
+        title="Ollama Replicas",
+        description=(
+            "Comma-separated Ollama replica URLs with optional weights "
+            "(url=weight). Defaults to the single host."
+        ),
+        alias="NEXUS_OLLAMA_REPLICAS",
+    )
     model: str = Field(
         default="tinyllama:1.1b",
         title="Ollama Model",
         description="The model to use for Ollama.",
         alias="NEXUS_OLLAMA_MODEL",
     )
+    pool_per_model: bool = Field(
+        default=False,
+        title="Connection Pool Per Model",
+        description=(
+            "Give every model with its own admission bulkhead its own HTTP "
+            "client per Ollama replica so a slow model cannot use up the "
+            "connections of the others; other models share the replica's client."
+        ),
+        alias="NEXUS_OLLAMA_POOL_PER_MODEL",
+    )
+    connect_timeout: float = Field(
+        default=5.0,
+        gt=0,
+        title="Connect Timeout",
+        description="Timeout for establishing a connection (seconds).",
+        alias="NEXUS_OLLAMA_CONNECT_TIMEOUT",
+    )
+    timeout: float | None = Field(
+        default=None,
+        gt=0,
+        title="Response Timeout",
+        description=(
+            "Time a non-streaming chat call may take in total (seconds). "
+            "Unset waits indefinitely."
+        ),
+        alias="NEXUS_OLLAMA_TIMEOUT",
+    )
+    first_token_timeout: float | None = Field(
+        default=None,
+        gt=0,
+        title="First Token Timeout",
+        description=(
+            "Time a stream may take to deliver its first chunk (seconds). "
+            "Unset waits indefinitely."
+        ),
+        alias="NEXUS_OLLAMA_FIRST_TOKEN_TIMEOUT",
+    )
+    inter_token_timeout: float | None = Field(
+        default=None,
+        gt=0,
+        title="Inter-Token Timeout",
+        description=(
+            "Longest gap between two streamed chunks (seconds). Unset waits "
+            "indefinitely."
+        ),
+        alias="NEXUS_OLLAMA_INTER_TOKEN_TIMEOUT",
+    )
+
+    @field_validator("replicas")
+    @classmethod
+    def _validate_replicas(cls, value: str) -> str:
+        parse_replicas(value, default="")
+        return value
+
+    def replica_endpoints(self) -> list[tuple[str, float]]:
+        """Return ``(url, weight)`` pairs for every configured Ollama replica."""
+
+        return parse_replicas(self.replicas, default=str(self.host))
+
+    def to_httpx_timeout(self) -> httpx.Timeout:
+        """Return the transport timeouts for Ollama HTTP clients.
+
+        Only connecting is bounded here; responses are timed per phase by
+        the client.
+        """
+
+        return httpx.Timeout(None, connect=self.connect_timeout)
@@ -4,15 +4,45 @@ from __future__ import annotations
 
 import importlib
 import logging
-from functools import lru_cache
+import threading
+from dataclasses import dataclass, field
+from functools import lru_cache, partial
 from typing import Callable, Type
 
 from fastapi import Depends
 
+from .admission import (
+    AdmissionController,
+    ConcurrencyLimiter,
+    MemoryTokenBucketStore,
+    SQLiteTokenBucketStore,
+    TokenRateLimiter,
+)
+from .api.disconnect import DisconnectCounter
+from .api.sse import StreamBufferBudget
+from .cache import (
+    IdempotencyStore,
+    MemoryResponseCache,
+    SingleFlight,
+    SQLiteResponseCache,
+    StreamMulticast,
+    StreamReplayStore,
+    TieredResponseCache,
+)
+from .clients.http_pool import HTTPClientPool
 from .clients.mlx_client import MLXClient
 from .clients.ollama_client import OllamaClient
-from .config import MLXSettings, NexusSettings, OllamaSettings
+from .clients.registry import LLMClientRegistry, settings_fingerprint
+from .config import (
+    AdmissionSettings,
+    CacheSettings,
+    DispatchSettings,
+    MLXSettings,
+    NexusSettings,
+    OllamaSettings,
+)
 from .protocols.llm_client_protocol import LLMClientProtocol
+from .protocols.response_cache_protocol import ResponseCacheProtocol
 
 LOGGER = logging.getLogger(__name__)
 
@@ -23,24 +53,35 @@ MockFactory = Callable[[NexusSettings], LLMClientProtocol]
 
 def _create_ollama_client(_settings: NexusSettings) -> OllamaClient:
     """Create an Ollama client instance."""
-    return OllamaClient(OllamaSettings())
+    return OllamaClient(
+        get_ollama_settings(),
+        dispatch=get_dispatch_settings(),
+        latency_observer=get_admission_controller().observer("ollama"),
+        partitions=get_admission_settings().model_limits(),
+    )
 
 
 def _create_mlx_client(_settings: NexusSettings) -> LLMClientProtocol:
-    """Create an MLX client instance."""
-    return MLXClient(MLXSettings())
+    """Create an MLX client instance backed by the shared connection pool."""
+    return MLXClient(
+        get_mlx_settings(),
+        http_pool=get_mlx_http_pool(),
+        dispatch=get_dispatch_settings(),
+        latency_observer=get_admission_controller().observer("mlx"),
+        partitions=get_admission_settings().model_limits(),
+    )
 
 
 def _create_mock_ollama_client(_settings: NexusSettings) -> LLMClientProtocol:
     """Create a mock Ollama client instance."""
     mock_class = _import_mock_class("dev.mocks.mock_ollama_client.MockOllamaClient")
-    return mock_class(OllamaSettings())
+    return mock_class(get_ollama_settings())
 
 
 def _create_mock_mlx_client(_settings: NexusSettings) -> LLMClientProtocol:
     """Create a mock MLX client instance."""
     mock_class = _import_mock_class("dev.mocks.mock_mlx_client.MockMLXClient")
-    return mock_class(MLXSettings())
+    return mock_class(get_mlx_settings())
 
 
 def _import_mock_class(dotted_path: str) -> Type[LLMClientProtocol]:
@@ -63,13 +104,325 @@ MOCK_FACTORIES: dict[str, MockFactory] = {
 }
 
 
-@lru_cache()
+@dataclass(frozen=True)
+class SettingsSnapshot:
+    """Immutable set of settings loaded together from the environment."""
+
+    app: NexusSettings
+    ollama: OllamaSettings
+    mlx: MLXSettings
+    dispatch: DispatchSettings
+    cache: CacheSettings
+    admission: AdmissionSettings
+    fingerprint: str = field(init=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self,
+            "fingerprint",
+            settings_fingerprint(
+                self.app,
+                self.ollama,
+                self.mlx,
+                self.dispatch,
+                self.cache,
+                self.admission,
+            ),
+        )
+
+
+_snapshot: SettingsSnapshot | None = None
+_snapshot_lock = threading.Lock()
+
+
+def _load_settings_snapshot() -> SettingsSnapshot:
+    return SettingsSnapshot(
+        app=NexusSettings(),
+        ollama=OllamaSettings(),
+        mlx=MLXSettings(),
+        dispatch=DispatchSettings(),
+        cache=CacheSettings(),
+        admission=AdmissionSettings(),
+    )
+
+
+def get_settings_snapshot() -> SettingsSnapshot:
+    """Return the settings snapshot, loading it on first access.
+
+    The environment and ``.env`` file are read once; subsequent requests only
+    dereference the cached snapshot.
+    """
+    snapshot = _snapshot
+    if snapshot is None:
+        with _snapshot_lock:
+            snapshot = _snapshot
+            if snapshot is None:
+                snapshot = _set_snapshot(_load_settings_snapshot())
+    return snapshot
+
+
+def _set_snapshot(snapshot: SettingsSnapshot) -> SettingsSnapshot:
+    global _snapshot
+    _snapshot = snapshot
+    return snapshot
+
+
+def reload_settings() -> SettingsSnapshot:
+    """Re-read configuration and swap it in atomically.
+
+    The new settings are fully validated before they replace the current
+    snapshot, so a broken ``.env`` leaves the running configuration untouched.
+    Clients built from the previous configuration are retired from the
+    registry; in-flight requests keep using them until they are closed
+    after the configured grace period.
+
+    Raises:
+        pydantic.ValidationError: If the new configuration is invalid.
+    """
+    snapshot = _load_settings_snapshot()
+    with _snapshot_lock:
+        _set_snapshot(snapshot)
+    get_client_registry().retire(
+        lambda key: key[-1] != snapshot.fingerprint,
+        grace=snapshot.app.reload_grace_period,
+    )
+    LOGGER.info("Reloaded settings (fingerprint %s)", snapshot.fingerprint[:12])
+    return snapshot
+
+
 def get_app_settings() -> NexusSettings:
     """Return singleton NexusSettings instance.
 
-    Cached to ensure settings are loaded only once per application lifecycle.
+    Loaded once per application lifecycle (or per explicit reload).
     """
-    return NexusSettings()
+    return get_settings_snapshot().app
+
+
+def get_ollama_settings() -> OllamaSettings:
+    """Return the Ollama settings from the current snapshot."""
+    return get_settings_snapshot().ollama
+
+
+def get_mlx_settings() -> MLXSettings:
+    """Return the MLX settings from the current snapshot."""
+    return get_settings_snapshot().mlx
+
+
+def get_dispatch_settings() -> DispatchSettings:
+    """Return the replica dispatch settings from the current snapshot."""
+    return get_settings_snapshot().dispatch
+
+
+def get_cache_settings() -> CacheSettings:
+    """Return the response cache settings from the current snapshot."""
+    return get_settings_snapshot().cache
+
+
+def get_admission_settings() -> AdmissionSettings:
+    """Return the admission control settings from the current snapshot."""
+    return get_settings_snapshot().admission
+
+
+@lru_cache()
+def get_mlx_http_pool() -> HTTPClientPool:
+    """Return the process-wide HTTP connection pool used for MLX backends.
+
+    Opened and closed by the application lifespan so keep-alive connections
+    are shared across every request. Pool limits are fixed at creation; they
+    are not affected by :func:`reload_settings`.
+    """
+    return HTTPClientPool.from_settings(get_mlx_settings())
+
+
+@lru_cache()
+def get_client_registry() -> LLMClientRegistry:
+    """Return the process-wide registry of constructed LLM clients.
+
+    Clients are shared across requests and closed by the application lifespan.
+    """
+    return LLMClientRegistry()
+
+
+@lru_cache()
+def get_response_cache_store() -> ResponseCacheProtocol:
+    """Return the process-wide response cache.
+
+    An in-memory LRU, backed by a SQLite tier when ``NEXUS_CACHE_PATH`` is
+    set. Its layout, sizes and TTL are fixed at creation;
+    :func:`reload_settings` only toggles whether :func:`get_response_cache`
+    hands it out.
+    """
+    settings = get_cache_settings()
+    memory = MemoryResponseCache(max_bytes=settings.max_bytes, ttl=settings.ttl)
+    if not settings.path:
+        return memory
+    disk = SQLiteResponseCache(
+        settings.path, max_bytes=settings.disk_max_bytes, ttl=settings.ttl
+    )
+    return TieredResponseCache(memory, disk)
+
+
+def get_response_cache(
+    settings: CacheSettings = Depends(get_cache_settings),
+) -> ResponseCacheProtocol | None:
+    """Provide the response cache, or ``None`` when caching is disabled."""
+    if not settings.enabled:
+        return None
+    return get_response_cache_store()
+
+
+@lru_cache()
+def get_single_flight_group() -> SingleFlight:
+    """Return the process-wide group of in-flight completion calls."""
+    return SingleFlight()
+
+
+def get_single_flight(
+    settings: CacheSettings = Depends(get_cache_settings),
+) -> SingleFlight | None:
+    """Provide request coalescing, or ``None`` when it is disabled."""
+    if not settings.single_flight:
+        return None
+    return get_single_flight_group()
+
+
+@lru_cache()
+def get_stream_multicast_group() -> StreamMulticast:
+    """Return the process-wide registry of shared backend streams.
+
+    The replay limit is fixed at creation.
+    """
+    return StreamMulticast(max_replay=get_cache_settings().multicast_max_replay)
+
+
+def get_stream_multicast(
+    settings: CacheSettings = Depends(get_cache_settings),
+) -> StreamMulticast | None:
+    """Provide stream sharing, or ``None`` when it is disabled."""
+    if not settings.stream_multicast:
+        return None
+    return get_stream_multicast_group()
+
+
+@lru_cache()
+def get_admission_controller() -> AdmissionController:
+    """Return the process-wide admission controller.
+
+    Concurrency limits and queue bounds are fixed at creation; they are not
+    affected by :func:`reload_settings`.
+    """
+    return AdmissionController(get_admission_settings())
+
+
+def get_backend_limiter(
+    settings: NexusSettings = Depends(get_app_settings),
+) -> ConcurrencyLimiter | None:
+    """Provide the active backend's admission limiter, if one is configured."""
+    backend = (settings.llm_backend or "ollama").lower()
+    return get_admission_controller().limiter(backend)
+
+
+@lru_cache()
+def get_token_budgets() -> TokenRateLimiter:
+    """Return the process-wide per-tenant token buckets.
+
+    Rates and the backing store are fixed at creation; with a store path the
+    buckets are shared by every worker on the host.
+    """
+    settings = get_admission_settings()
+    store: MemoryTokenBucketStore | SQLiteTokenBucketStore
+    if settings.token_store_path:
+        store = SQLiteTokenBucketStore(settings.token_store_path)
+    else:
+        store = MemoryTokenBucketStore()
+    return TokenRateLimiter(
+        store,
+        tokens_per_minute=settings.tokens_per_minute,
+        burst=settings.token_burst or None,
+        max_wait=settings.token_max_wait,
+    )
+
+
+def get_token_rate_limiter(
+    settings: AdmissionSettings = Depends(get_admission_settings),
+) -> TokenRateLimiter | None:
+    """Provide per-tenant token rate limiting, or ``None`` when it is disabled."""
+    if settings.tokens_per_minute <= 0:
+        return None
+    return get_token_budgets()
+
+
+@lru_cache()
+def get_disconnect_counter() -> DisconnectCounter:
+    """Return the process-wide count of requests cancelled by client disconnects."""
+    return DisconnectCounter()
+
+
+@lru_cache()
+def get_stream_buffer_budget() -> StreamBufferBudget:
+    """Return the process-wide byte budget for buffered streams.
+
+    The budget is fixed at creation; it is not affected by
+    :func:`reload_settings`.
+    """
+    return StreamBufferBudget(get_app_settings().sse_buffer_budget_bytes)
+
+
+@lru_cache()
+def get_stream_replay_store() -> StreamReplayStore:
+    """Return the process-wide buffer of resumable streams.
+
+    Its limits are fixed at creation; they are not affected by
+    :func:`reload_settings`.
+    """
+    settings = get_app_settings()
+    return StreamReplayStore(
+        ttl=settings.sse_resume_ttl,
+        max_bytes=settings.sse_resume_max_bytes,
+        max_streams=settings.sse_resume_max_streams,
+    )
+
+
+def get_stream_replay(
+    settings: NexusSettings = Depends(get_app_settings),
+) -> StreamReplayStore | None:
+    """Provide resumable streams, or ``None`` when they are disabled."""
+    if settings.sse_resume_ttl <= 0:
+        return None
+    return get_stream_replay_store()
+
+
+@lru_cache()
+def get_idempotency_store() -> IdempotencyStore:
+    """Return the process-wide store of idempotent request results.
+
+    Its size and TTL are fixed at creation; they are not affected by
+    :func:`reload_settings`.
+    """
+    settings = get_app_settings()
+    return IdempotencyStore(
+        ttl=settings.idempotency_ttl, max_bytes=settings.idempotency_max_bytes
+    )
+
+
+def get_idempotency(
+    settings: NexusSettings = Depends(get_app_settings),
+) -> IdempotencyStore | None:
+    """Provide retry deduplication, or ``None`` when it is disabled."""
+    if settings.idempotency_ttl <= 0:
+        return None
+    return get_idempotency_store()
+
+
+ModelLimiterLookup = Callable[[str], "ConcurrencyLimiter | None"]
+
+
+def get_model_limiter(
+    settings: NexusSettings = Depends(get_app_settings),
+) -> ModelLimiterLookup:
+    """Provide a lookup of the active backend's per-model bulkhead limiters."""
+    backend = (settings.llm_backend or "ollama").lower()
+    return partial(get_admission_controller().model_limiter, backend)
 
 
 def get_llm_client(
@@ -77,15 +430,16 @@ def get_llm_client(
 ) -> LLMClientProtocol:
     """Provide the appropriate LLM client based on application settings.
 
-    This function serves as a FastAPI dependency provider. It selects and
-    instantiates the correct LLM client (real or mock) based on the configured
-    backend and mock settings.
+    This function serves as a FastAPI dependency provider. It selects the
+    correct LLM client (real or mock) based on the configured backend and mock
+    settings. Clients are built once per (backend, mock flag, settings
+    fingerprint) and reused by subsequent requests.
 
     Args:
         settings: Application settings, injected by FastAPI.
 
     Returns:
-        An instance of the configured LLM client.
+        The shared instance of the configured LLM client.
 
     Raises:
         ValueError: If an unknown backend is configured and fallback fails.
@@ -106,13 +460,26 @@ def get_llm_client(
     if factory is None:
         LOGGER.warning("Unknown LLM backend '%s'. Falling back to Ollama.", backend)
         # Fallback to Ollama
-        fallback_registry = (
-            MOCK_FACTORIES if settings.use_mock_ollama else CLIENT_FACTORIES
-        )
-        factory = fallback_registry.get("ollama")
+        backend = "ollama"
+        use_mock = settings.use_mock_ollama
+        fallback_registry = MOCK_FACTORIES if use_mock else CLIENT_FACTORIES
+        factory = fallback_registry.get(backend)
 
     if factory is None:
         msg = "Failed to create LLM client: no factory available"
         raise ValueError(msg)
 
-    return factory(settings)
+    snapshot = get_settings_snapshot()
+    if settings is snapshot.app:
+        fingerprint = snapshot.fingerprint
+    else:
+        fingerprint = settings_fingerprint(
+            settings,
+            snapshot.ollama,
+            snapshot.mlx,
+            snapshot.dispatch,
+            snapshot.cache,
+            snapshot.admission,
+        )
+    key = (backend, use_mock, fingerprint)
+    return get_client_registry().get_or_create(key, lambda: factory(settings))
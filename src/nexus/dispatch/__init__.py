@@ -0,0 +1,37 @@
+"""Request dispatch across backend replicas."""
+
+from .affinity import HashRing, prefix_hash
+from .circuit_breaker import CircuitBreaker, CircuitState
+from .deadline import (
+    BackendTimeoutError,
+    Deadline,
+    DeadlineExceededError,
+    StreamTimer,
+    wait_within,
+)
+from .health import HealthChecker
+from .replica_pool import (
+    LatencyObserver,
+    LatencySample,
+    NoHealthyReplicaError,
+    Replica,
+    ReplicaPool,
+)
+
+__all__ = [
+    "BackendTimeoutError",
+    "CircuitBreaker",
+    "CircuitState",
+    "Deadline",
+    "DeadlineExceededError",
+    "HashRing",
+    "HealthChecker",
+    "LatencyObserver",
+    "LatencySample",
+    "NoHealthyReplicaError",
+    "Replica",
+    "ReplicaPool",
+    "StreamTimer",
+    "prefix_hash",
+    "wait_within",
+]
@@ -0,0 +1,76 @@
+"""Prefix hashing and a consistent hash ring for cache-affine routing."""
+
+from __future__ import annotations
+
+import bisect
+import hashlib
+import json
+from typing import Any, Iterator, Sequence
+
+# Virtual nodes per unit of replica weight. Enough points keep the key space
+# evenly split while the ring stays small for a handful of replicas.
+_POINTS_PER_WEIGHT = 64
+
+
+def _hash(data: bytes) -> int:
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "big")
+
+
+def prefix_hash(messages: Any, turns: int) -> int | None:
+    """Hash the leading system messages plus the first ``turns`` other messages.
+
+    Only ``role`` and ``content`` take part, so requests sharing a system
+    prompt and conversation opening map to the same key however the history
+    grows afterwards. Returns ``None`` when ``messages`` is not a non-empty
+    list of messages.
+    """
+
+    if not isinstance(messages, Sequence) or isinstance(messages, (str, bytes)):
+        return None
+    prefix: list[Any] = []
+    remaining = turns
+    for message in messages:
+        if not isinstance(message, dict):
+            return None
+        if message.get("role") != "system":
+            if remaining <= 0:
+                break
+            remaining -= 1
+        prefix.append([message.get("role"), message.get("content")])
+    if not prefix:
+        return None
+    canonical = json.dumps(
+        prefix, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str
+    )
+    return _hash(canonical.encode())
+
+
+class HashRing:
+    """Consistent hash ring over replica indexes, weighted by virtual nodes."""
+
+    def __init__(self, members: Sequence[tuple[str, float]]) -> None:
+        points: list[tuple[int, int]] = []
+        for index, (name, weight) in enumerate(members):
+            count = max(round(weight * _POINTS_PER_WEIGHT), 1)
+            points.extend(
+                (_hash(f"{name}#{point}".encode()), index) for point in range(count)
+            )
+        points.sort()
+        self._hashes = [point for point, _ in points]
+        self._owners = [owner for _, owner in points]
+        self._size = len(members)
+
+    def walk(self, key: int) -> Iterator[int]:
+        """Yield each member index once, in ring order starting at ``key``."""
+
+        if not self._hashes:
+            return
+        start = bisect.bisect(self._hashes, key)
+        seen: set[int] = set()
+        for offset in range(len(self._owners)):
+            owner = self._owners[(start + offset) % len(self._owners)]
+            if owner not in seen:
+                seen.add(owner)
+                yield owner
+                if len(seen) == self._size:
+                    return
@@ -0,0 +1,114 @@
+"""Per-replica circuit breaker with consecutive-failure and slow-call tripping."""
+
+from __future__ import annotations
+
+import time
+from enum import Enum
+from typing import Callable
+
+
+class CircuitState(str, Enum):
+    """States of a :class:`CircuitBreaker`."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Stop sending traffic to a replica after repeated failures.
+
+    ``failure_threshold`` consecutive failures (or calls slower than
+    ``slow_call_threshold`` seconds, when set) open the circuit. After
+    ``open_duration`` seconds a single trial request is let through
+    (half-open); its outcome closes the circuit again or re-opens it.
+    """
+
+    def __init__(
+        self,
+        *,
+        failure_threshold: int = 5,
+        open_duration: float = 10.0,
+        slow_call_threshold: float = 0.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._failure_threshold = max(failure_threshold, 1)
+        self._open_duration = open_duration
+        self._slow_call_threshold = slow_call_threshold
+        self._clock = clock
+        self._state = CircuitState.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> CircuitState:
+        """Return the current state, promoting an expired open circuit."""
+
+        if (
+            self._state is CircuitState.OPEN
+            and self._clock() - self._opened_at >= self._open_duration
+        ):
+            self._state = CircuitState.HALF_OPEN
+            self._trial_in_flight = False
+        return self._state
+
+    def allows_request(self) -> bool:
+        """Return whether a new request may be sent without consuming a trial."""
+
+        state = self.state
+        if state is CircuitState.CLOSED:
+            return True
+        return state is CircuitState.HALF_OPEN and not self._trial_in_flight
+
+    def on_request(self) -> None:
+        """Note that a request was dispatched; claims the half-open trial slot."""
+
+        if self.state is CircuitState.HALF_OPEN:
+            self._trial_in_flight = True
+
+    def on_abandoned(self) -> None:
+        """Note that a dispatched request ended without a verdict (e.g. cancelled)."""
+
+        self._trial_in_flight = False
+
+    def retry_after(self) -> float:
+        """Seconds until an open circuit lets a trial request through."""
+
+        if self.state is not CircuitState.OPEN:
+            return 0.0
+        return max(self._open_duration - (self._clock() - self._opened_at), 0.0)
+
+    def record_success(self, latency: float | None = None) -> None:
+        """Record a successful call, counting slow calls as failures."""
+
+        if (
+            latency is not None
+            and self._slow_call_threshold > 0
+            and latency > self._slow_call_threshold
+        ):
+            self.record_failure()
+            return
+        self.reset()
+
+    def record_failure(self) -> None:
+        """Record a failed call and open the circuit when warranted."""
+
+        self._consecutive_failures += 1
+        if (
+            self.state is CircuitState.HALF_OPEN
+            or self._consecutive_failures >= self._failure_threshold
+        ):
+            self._trip()
+
+    def reset(self) -> None:
+        """Close the circuit and forget previous failures."""
+
+        self._state = CircuitState.CLOSED
+        self._consecutive_failures = 0
+        self._trial_in_flight = False
+
+    def _trip(self) -> None:
+        self._state = CircuitState.OPEN
+        self._opened_at = self._clock()
+        self._trial_in_flight = False
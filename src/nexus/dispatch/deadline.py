@@ -0,0 +1,150 @@
+"""Request deadlines and per-phase timeouts for backend calls."""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import time
+from dataclasses import dataclass
+from typing import AsyncIterator, Awaitable, TypeVar
+
+T = TypeVar("T")
+
+
+class DeadlineExceededError(TimeoutError):
+    """Raised when the caller's deadline passes before its response is ready.
+
+    The caller has given up, so this never counts against a replica.
+    """
+
+    status_code = 504
+
+    def __init__(self) -> None:
+        super().__init__("Request deadline exceeded")
+
+
+class BackendTimeoutError(TimeoutError):
+    """Raised when a backend stalls longer than a configured phase timeout."""
+
+    status_code = 504
+
+
+@dataclass(frozen=True)
+class Deadline:
+    """Monotonic point in time by which the caller needs its response."""
+
+    expires_at: float
+
+    @classmethod
+    def after(cls, seconds: float) -> "Deadline":
+        """Return the deadline ``seconds`` from now."""
+
+        return cls(time.monotonic() + seconds)
+
+    def remaining(self) -> float:
+        """Seconds left until the deadline (negative once it has passed)."""
+
+        return self.expires_at - time.monotonic()
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    def check(self) -> None:
+        """Raise :class:`DeadlineExceededError` if the deadline has passed."""
+
+        if self.expired:
+            raise DeadlineExceededError()
+
+
+async def wait_within(
+    awaitable: Awaitable[T],
+    *,
+    timeout: float | None = None,
+    deadline: Deadline | None = None,
+    phase: str = "response",
+) -> T:
+    """Await ``awaitable`` for at most ``timeout`` seconds and before ``deadline``.
+
+    Raises:
+        DeadlineExceededError: If the deadline passes first.
+        BackendTimeoutError: If ``timeout`` expires first.
+    """
+
+    left = deadline.remaining() if deadline is not None else None
+    if left is not None and (timeout is None or left <= timeout):
+        budget, by_deadline = left, True
+    elif timeout is not None:
+        budget, by_deadline = timeout, False
+    else:
+        return await awaitable
+    try:
+        if budget <= 0:
+            if inspect.iscoroutine(awaitable):
+                awaitable.close()
+            raise asyncio.TimeoutError()
+        return await asyncio.wait_for(awaitable, budget)
+    except (DeadlineExceededError, BackendTimeoutError):
+        raise
+    except asyncio.TimeoutError:
+        if by_deadline:
+            raise DeadlineExceededError() from None
+        raise BackendTimeoutError(
+            f"Backend timed out waiting for the {phase}"
+        ) from None
+
+
+class StreamTimer:
+    """Time-to-first-token and inter-token timeouts for one backend stream.
+
+    The first-token window starts when the timer is created and covers
+    opening the stream as well as its first chunk; later chunks must each
+    arrive within ``inter_token`` seconds. Every wait also ends at
+    ``deadline``. Unset timeouts are not enforced.
+    """
+
+    def __init__(
+        self,
+        *,
+        first_token: float | None = None,
+        inter_token: float | None = None,
+        deadline: Deadline | None = None,
+    ) -> None:
+        self._first_by = None if first_token is None else time.monotonic() + first_token
+        self._inter_token = inter_token
+        self._deadline = deadline
+        self._started = False
+
+    async def wait(self, awaitable: Awaitable[T]) -> T:
+        """Await ``awaitable`` within the current phase's timeout."""
+
+        if self._started:
+            return await wait_within(
+                awaitable,
+                timeout=self._inter_token,
+                deadline=self._deadline,
+                phase="next token",
+            )
+        timeout = None if self._first_by is None else self._first_by - time.monotonic()
+        return await wait_within(
+            awaitable, timeout=timeout, deadline=self._deadline, phase="first token"
+        )
+
+    async def chunks(self, iterator: AsyncIterator[T]) -> AsyncIterator[T]:
+        """Yield the chunks of ``iterator``, each within its phase's timeout.
+
+        ``iterator`` is closed when the timer's iteration ends.
+        """
+
+        try:
+            while True:
+                try:
+                    chunk = await self.wait(iterator.__anext__())
+                except StopAsyncIteration:
+                    return
+                self._started = True
+                yield chunk
+        finally:
+            aclose = getattr(iterator, "aclose", None)
+            if aclose is not None:
+                await aclose()
@@ -0,0 +1,85 @@
+"""Background health probing for backend replicas."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Awaitable, Callable, Sequence
+
+from .circuit_breaker import CircuitState
+
+if TYPE_CHECKING:
+    from .replica_pool import Replica
+
+LOGGER = logging.getLogger(__name__)
+
+HealthProbe = Callable[["Replica"], Awaitable[None]]
+
+
+class HealthChecker:
+    """Periodically probe every replica and feed the result to its breaker.
+
+    A probe raising (or exceeding ``timeout``) counts as a failure towards the
+    replica's circuit breaker; a successful probe closes an open circuit so a
+    recovered replica rejoins rotation without waiting for real traffic.
+    Probes never reset the failure count of a closed circuit.
+    """
+
+    def __init__(
+        self,
+        replicas: Sequence["Replica"],
+        probe: HealthProbe,
+        *,
+        interval: float,
+        timeout: float,
+    ) -> None:
+        self._replicas = replicas
+        self._probe = probe
+        self._interval = interval
+        self._timeout = timeout
+        self._task: asyncio.Task[None] | None = None
+
+    def ensure_started(self) -> None:
+        """Start the probing loop on the running event loop if not yet running."""
+
+        if self._task is not None and not self._task.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._task = loop.create_task(self._run(), name="nexus-health-checker")
+
+    async def check_once(self) -> None:
+        """Probe all replicas concurrently and update their breakers."""
+
+        await asyncio.gather(*(self._check(replica) for replica in self._replicas))
+
+    async def aclose(self) -> None:
+        """Stop the probing loop."""
+
+        task, self._task = self._task, None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._interval)
+            await self.check_once()
+
+    async def _check(self, replica: "Replica") -> None:
+        try:
+            await asyncio.wait_for(self._probe(replica), timeout=self._timeout)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            LOGGER.warning("Health probe failed for %s: %s", replica.url, exc)
+            replica.breaker.record_failure()
+        else:
+            if replica.breaker.state is not CircuitState.CLOSED:
+                replica.breaker.reset()
@@ -0,0 +1,322 @@
+"""Load balancing across the replicas of a single backend."""
+
+from __future__ import annotations
+
+import math
+import random
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Callable, Iterable, Sequence
+
+import httpx
+
+from ..config.dispatch_settings import DispatchSettings
+from .affinity import HashRing, prefix_hash
+from .circuit_breaker import CircuitBreaker
+from .deadline import DeadlineExceededError
+from .health import HealthChecker, HealthProbe
+
+# Latency assumed when no replica has completed a request yet. It only needs
+# to be comparable across replicas.
+_DEFAULT_LATENCY = 1.0
+
+
+class NoHealthyReplicaError(RuntimeError):
+    """Raised when every replica of a backend has an open circuit."""
+
+    def __init__(self, retry_after: float) -> None:
+        super().__init__("No healthy backend replica is available")
+        self.retry_after = retry_after
+
+
+def is_replica_failure(exc: BaseException) -> bool:
+    """Return whether ``exc`` indicates a replica fault rather than a caller one.
+
+    Cancellation, expired caller deadlines and 4xx responses do not count
+    against a replica.
+    """
+
+    if not isinstance(exc, Exception) or isinstance(exc, DeadlineExceededError):
+        return False
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code >= 500
+    status_code = getattr(exc, "status_code", None)
+    if isinstance(status_code, int):
+        return status_code >= 500
+    return True
+
+
+@dataclass(frozen=True)
+class LatencySample:
+    """Timing of one finished backend request.
+
+    ``ttft`` is the time to the first streamed token (``None`` for
+    non-streaming calls) and ``total`` the time until the response was
+    complete (``None`` when the consumer stopped reading early).
+    """
+
+    replica: str
+    ttft: float | None = None
+    total: float | None = None
+    failed: bool = False
+
+
+LatencyObserver = Callable[[LatencySample], None]
+
+
+@dataclass(eq=False)
+class Replica:
+    """A single backend endpoint together with its live load statistics."""
+
+    url: str
+    weight: float = 1.0
+    in_flight: int = 0
+    ewma_latency: float | None = None
+    breaker: CircuitBreaker = field(default_factory=CircuitBreaker)
+
+    def score(self, default_latency: float = _DEFAULT_LATENCY) -> float:
+        """Return the expected cost of sending one more request here.
+
+        Outstanding requests are multiplied by the smoothed latency and
+        divided by the weight, so faster or larger replicas absorb
+        proportionally more traffic. Replicas without samples are assumed to
+        be average (``default_latency``) so they still get explored.
+        """
+
+        latency = self.ewma_latency
+        if latency is None:
+            latency = default_latency
+        return (self.in_flight + 1) * latency / self.weight
+
+
+class ReplicaPool:
+    """Pick replicas by least outstanding requests or power of two choices.
+
+    The ``prefix_affinity`` strategy routes requests carrying an affinity key
+    with consistent hashing with bounded loads: a key sticks to its ring owner
+    (keeping that replica's prompt cache warm) until the owner holds more than
+    ``affinity_load_factor`` times its weighted share of outstanding requests,
+    at which point the request spills to the next replica on the ring.
+    Requests without a key fall back to least outstanding.
+    """
+
+    def __init__(
+        self,
+        replicas: Sequence[Replica],
+        *,
+        strategy: str = "least_outstanding",
+        ewma_alpha: float = 0.3,
+        affinity_turns: int = 1,
+        affinity_load_factor: float = 1.25,
+        rng: random.Random | None = None,
+        observer: LatencyObserver | None = None,
+    ) -> None:
+        if not replicas:
+            raise ValueError("ReplicaPool requires at least one replica")
+        self.replicas = list(replicas)
+        self._strategy = strategy
+        self._alpha = ewma_alpha
+        self._affinity_turns = affinity_turns
+        self._load_factor = affinity_load_factor
+        self._ring = HashRing([(replica.url, replica.weight) for replica in replicas])
+        self._rng = rng or random.Random()
+        self._observer = observer
+        self._health: HealthChecker | None = None
+
+    @classmethod
+    def from_endpoints(
+        cls,
+        endpoints: Iterable[tuple[str, float]],
+        settings: DispatchSettings | None = None,
+        observer: LatencyObserver | None = None,
+    ) -> "ReplicaPool":
+        """Build a pool from ``(url, weight)`` pairs and dispatch settings."""
+
+        settings = settings or DispatchSettings()
+        replicas = [
+            Replica(
+                url=url,
+                weight=weight,
+                breaker=CircuitBreaker(
+                    failure_threshold=settings.failure_threshold,
+                    open_duration=settings.open_duration,
+                    slow_call_threshold=settings.slow_call_threshold,
+                ),
+            )
+            for url, weight in endpoints
+        ]
+        return cls(
+            replicas,
+            strategy=settings.strategy,
+            ewma_alpha=settings.ewma_alpha,
+            affinity_turns=settings.affinity_turns,
+            affinity_load_factor=settings.affinity_load_factor,
+            observer=observer,
+        )
+
+    def enable_health_checks(
+        self, probe: HealthProbe, *, interval: float, timeout: float
+    ) -> None:
+        """Probe replicas in the background once the pool is first used."""
+
+        if interval > 0:
+            self._health = HealthChecker(
+                self.replicas, probe, interval=interval, timeout=timeout
+            )
+
+    async def aclose(self) -> None:
+        """Stop background health checks."""
+
+        if self._health is not None:
+            await self._health.aclose()
+
+    def affinity_key(self, messages: Any) -> int | None:
+        """Return the routing key for ``messages`` under prefix affinity.
+
+        ``None`` (no affinity) is returned for every other strategy.
+        """
+
+        if self._strategy != "prefix_affinity":
+            return None
+        return prefix_hash(messages, self._affinity_turns)
+
+    def choose(self, affinity_key: int | None = None) -> Replica:
+        """Return the replica that should serve the next request.
+
+        Raises:
+            NoHealthyReplicaError: If every replica's circuit is open.
+        """
+
+        candidates = [
+            replica for replica in self.replicas if replica.breaker.allows_request()
+        ]
+        if not candidates:
+            raise NoHealthyReplicaError(
+                min(replica.breaker.retry_after() for replica in self.replicas)
+            )
+        if len(candidates) == 1:
+            return candidates[0]
+        if affinity_key is not None:
+            replica = self._bounded_ring_choice(candidates, affinity_key)
+            if replica is not None:
+                return replica
+        default_latency = self._mean_latency()
+        if self._strategy == "p2c":
+            first, second = self._weighted_pair(candidates)
+            if first.score(default_latency) <= second.score(default_latency):
+                return first
+            return second
+        # Random tie-breaking keeps idle replicas evenly used.
+        return min(
+            candidates,
+            key=lambda replica: (replica.score(default_latency), self._rng.random()),
+        )
+
+    def acquire(self, affinity_key: int | None = None) -> Replica:
+        """Choose a replica and count the request as outstanding on it."""
+
+        if self._health is not None:
+            self._health.ensure_started()
+        replica = self.choose(affinity_key)
+        replica.in_flight += 1
+        replica.breaker.on_request()
+        return replica
+
+    def release(
+        self,
+        replica: Replica,
+        latency: float | None = None,
+        *,
+        failed: bool = False,
+    ) -> None:
+        """Finish a request started with :meth:`acquire`.
+
+        ``latency`` (seconds) marks a success and feeds the replica's EWMA.
+        ``failed`` counts towards the replica's circuit breaker. Passing
+        neither (e.g. on cancellation) leaves the replica's health untouched.
+        """
+
+        replica.in_flight = max(replica.in_flight - 1, 0)
+        if failed:
+            replica.breaker.record_failure()
+            return
+        if latency is None:
+            replica.breaker.on_abandoned()
+            return
+        replica.breaker.record_success(latency)
+        if replica.ewma_latency is None:
+            replica.ewma_latency = latency
+        else:
+            replica.ewma_latency += self._alpha * (latency - replica.ewma_latency)
+
+    def report(
+        self,
+        replica: Replica,
+        *,
+        ttft: float | None = None,
+        total: float | None = None,
+        failed: bool = False,
+    ) -> None:
+        """Pass the timing of a finished request to the latency observer."""
+
+        if self._observer is not None:
+            self._observer(
+                LatencySample(replica.url, ttft=ttft, total=total, failed=failed)
+            )
+
+    @asynccontextmanager
+    async def lease(self, affinity_key: int | None = None) -> AsyncIterator[Replica]:
+        """Hold a replica for the duration of one request/response exchange."""
+
+        replica = self.acquire(affinity_key)
+        started = time.perf_counter()
+        latency: float | None = None
+        failed = False
+        try:
+            yield replica
+            latency = time.perf_counter() - started
+        except BaseException as exc:
+            failed = is_replica_failure(exc)
+            raise
+        finally:
+            self.release(replica, latency, failed=failed)
+            if latency is not None or failed:
+                self.report(replica, total=latency, failed=failed)
+
+    def _bounded_ring_choice(
+        self, candidates: Sequence[Replica], key: int
+    ) -> Replica | None:
+        """Return the first replica along the ring that is under its load bound."""
+
+        allowed = set(map(id, candidates))
+        total_weight = sum(replica.weight for replica in candidates)
+        # Count the request being placed so an idle pool still admits it.
+        load = sum(replica.in_flight for replica in candidates) + 1
+        for index in self._ring.walk(key):
+            replica = self.replicas[index]
+            if id(replica) not in allowed:
+                continue
+            bound = math.ceil(self._load_factor * load * replica.weight / total_weight)
+            if replica.in_flight < bound:
+                return replica
+        return None
+
+    def _mean_latency(self) -> float:
+        samples = [
+            replica.ewma_latency
+            for replica in self.replicas
+            if replica.ewma_latency is not None
+        ]
+        return sum(samples) / len(samples) if samples else _DEFAULT_LATENCY
+
+    def _weighted_pair(self, candidates: Sequence[Replica]) -> tuple[Replica, Replica]:
+        first = self._weighted_choice(candidates)
+        second = self._weighted_choice(
+            [replica for replica in candidates if replica is not first]
+        )
+        return first, second
+
+    def _weighted_choice(self, candidates: Sequence[Replica]) -> Replica:
+        weights = [replica.weight for replica in candidates]
+        return self._rng.choices(candidates, weights=weights)[0]
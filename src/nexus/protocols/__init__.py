@@ -1,5 +1,11 @@
 """Protocol definitions for nexus."""
 
 from .llm_client_protocol import LLMClientProtocol
+from .response_cache_protocol import ResponseCacheProtocol
+from .token_bucket_store_protocol import TokenBucketStoreProtocol
 
-__all__ = ["LLMClientProtocol"]
+__all__ = [
+    "LLMClientProtocol",
+    "ResponseCacheProtocol",
+    "TokenBucketStoreProtocol",
+]
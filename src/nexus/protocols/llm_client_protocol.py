@@ -8,7 +8,10 @@ from typing import Any, AsyncIterator, Protocol
 class LLMClientProtocol(Protocol):
     """Protocol defining the interface for any LLM client implementation.
 
-    This allows for dependency injection and easier testing.
+    This allows for dependency injection and easier testing. Besides
+    ``model`` and generation options, ``invoke`` and ``stream`` may receive a
+    ``deadline`` (:class:`~nexus.dispatch.Deadline`) that the backend call
+    must not outlive.
     """
 
     async def invoke(self, messages: Any, **kwargs: Any) -> Any:
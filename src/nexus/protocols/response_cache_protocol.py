@@ -0,0 +1,18 @@
+"""Protocol definition for chat completion response caches."""
+
+from __future__ import annotations
+
+from typing import Protocol
+
+
+class ResponseCacheProtocol(Protocol):
+    """Byte-oriented key/value store for cached completion payloads."""
+
+    async def get(self, key: str) -> bytes | None:
+        """Return the cached value for ``key`` or ``None`` on a miss."""
+
+    async def set(self, key: str, value: bytes) -> None:
+        """Store ``value`` under ``key``, evicting older entries as needed."""
+
+    async def aclose(self) -> None:
+        """Release resources held by the cache."""
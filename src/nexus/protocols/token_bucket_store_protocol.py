@@ -0,0 +1,22 @@
+"""Protocol definition for token bucket state stores."""
+
+from __future__ import annotations
+
+from typing import Protocol
+
+
+class TokenBucketStoreProtocol(Protocol):
+    """Atomic storage for per-key token bucket levels."""
+
+    async def take(
+        self, key: str, cost: float, *, required: float, rate: float, burst: float
+    ) -> float:
+        """Refill ``key``'s bucket and debit ``cost`` if ``required`` is available.
+
+        Returns ``0`` when the tokens were debited, otherwise the seconds
+        until the bucket holds ``required`` tokens. A negative ``cost``
+        credits tokens back, up to ``burst``.
+        """
+
+    async def aclose(self) -> None:
+        """Release resources held by the store."""
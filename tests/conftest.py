@@ -5,6 +5,8 @@ from fastapi import FastAPI
 from httpx import ASGITransport, AsyncClient
 
 from nexus.api.main import app as fastapi_app
+from nexus.config import NexusSettings
+from nexus.dependencies import get_app_settings
 
 
 @pytest.fixture()
@@ -19,3 +21,12 @@ async def async_client(app: FastAPI) -> AsyncClient:
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://testserver") as client:
         yield client
+
+
+@pytest.fixture()
+def admin_headers(app: FastAPI) -> dict[str, str]:
+    """Enable the admin endpoints and return headers authorising a request."""
+    settings = NexusSettings(NEXUS_ADMIN_TOKEN="admin-secret")
+    app.dependency_overrides[get_app_settings] = lambda: settings
+    yield {"Authorization": "Bearer admin-secret"}
+    app.dependency_overrides.pop(get_app_settings, None)
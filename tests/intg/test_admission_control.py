@@ -0,0 +1,438 @@
+"""Integration tests for load shedding when the backend is saturated."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+import respx
+from fastapi import FastAPI
+
+from dev.mocks.mock_ollama_client import MockOllamaClient
+from nexus.admission import (
+    ConcurrencyLimiter,
+    FairQueue,
+    MemoryTokenBucketStore,
+    TokenRateLimiter,
+)
+from nexus.clients.mlx_client import MLXClient
+from nexus.clients.ollama_client import OllamaClient
+from nexus.config import MLXSettings, OllamaSettings
+from nexus.dependencies import (
+    get_backend_limiter,
+    get_llm_client,
+    get_model_limiter,
+    get_token_rate_limiter,
+)
+
+PAYLOAD = {"model": "m", "messages": [{"role": "user", "content": "hi"}]}
+
+
+@pytest.mark.asyncio
+async def test_saturated_backend_sheds_load_with_retry_after(
+    app: FastAPI, async_client
+):
+    release = asyncio.Event()
+
+    class BlockingClient(MockOllamaClient):
+        async def invoke(self, messages, **kwargs):
+            await release.wait()
+            return await super().invoke(messages, **kwargs)
+
+    limiter = ConcurrencyLimiter(1, max_queue=0, max_wait=1)
+    app.dependency_overrides[get_llm_client] = BlockingClient
+    app.dependency_overrides[get_backend_limiter] = lambda: limiter
+
+    try:
+        running = asyncio.create_task(
+            async_client.post("/v1/chat/completions", json=PAYLOAD)
+        )
+        while limiter.in_flight == 0:
+            await asyncio.sleep(0)
+        rejected = await async_client.post("/v1/chat/completions", json=PAYLOAD)
+        streamed = await async_client.post(
+            "/v1/chat/completions", json={**PAYLOAD, "stream": True}
+        )
+        release.set()
+        completed = await running
+    finally:
+        app.dependency_overrides.clear()
+
+    assert rejected.status_code == 429
+    assert int(rejected.headers["Retry-After"]) >= 1
+    assert streamed.status_code == 429
+    assert completed.status_code == 200
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint_reports_admission_stats(async_client, admin_headers):
+    response = await async_client.get("/admin/metrics", headers=admin_headers)
+
+    assert response.status_code == 200
+    assert "admission" in response.json()
+
+
+@pytest.mark.asyncio
+async def test_priority_header_jumps_queued_batch_requests(app: FastAPI, async_client):
+    release = asyncio.Event()
+    served: list[str] = []
+
+    class BlockingClient(MockOllamaClient):
+        async def invoke(self, messages, **kwargs):
+            assert "priority" not in kwargs and "tenant" not in kwargs
+            served.append(messages[0]["content"])
+            await release.wait()
+            return await super().invoke(messages, **kwargs)
+
+    queue = FairQueue(("interactive", "default", "batch"))
+    limiter = ConcurrencyLimiter(1, max_queue=10, max_wait=5, queue=queue)
+    app.dependency_overrides[get_llm_client] = BlockingClient
+    app.dependency_overrides[get_backend_limiter] = lambda: limiter
+
+    def post(content: str, **extra):
+        body = {**PAYLOAD, "messages": [{"role": "user", "content": content}]}
+        headers = extra.pop("headers", None)
+        return asyncio.create_task(
+            async_client.post(
+                "/v1/chat/completions", json={**body, **extra}, headers=headers
+            )
+        )
+
+    try:
+        requests = [post("running")]
+        while limiter.in_flight == 0:
+            await asyncio.sleep(0)
+        requests.append(post("batch", priority="batch", tenant="bulk"))
+        while limiter.queued < 1:
+            await asyncio.sleep(0)
+        requests.append(post("chat", headers={"X-Nexus-Priority": "interactive"}))
+        while limiter.queued < 2:
+            await asyncio.sleep(0)
+        release.set()
+        responses = await asyncio.gather(*requests)
+    finally:
+        app.dependency_overrides.clear()
+
+    assert [response.status_code for response in responses] == [200, 200, 200]
+    assert served == ["running", "chat", "batch"]
+
+
+@pytest.mark.asyncio
+async def test_saturated_model_does_not_block_other_models(app: FastAPI, async_client):
+    release = asyncio.Event()
+
+    class SlowBigModelClient(MockOllamaClient):
+        async def invoke(self, messages, **kwargs):
+            if kwargs.get("model") == "big":
+                await release.wait()
+            return await super().invoke(messages, **kwargs)
+
+    backend = ConcurrencyLimiter(2, max_queue=10, max_wait=5)
+    bulkheads = {"big": ConcurrencyLimiter(1, max_queue=10, max_wait=5)}
+    app.dependency_overrides[get_llm_client] = SlowBigModelClient
+    app.dependency_overrides[get_backend_limiter] = lambda: backend
+    app.dependency_overrides[get_model_limiter] = lambda: bulkheads.get
+
+    try:
+        big = [
+            asyncio.create_task(
+                async_client.post(
+                    "/v1/chat/completions", json={**PAYLOAD, "model": "big"}
+                )
+            )
+            for _ in range(3)
+        ]
+        while bulkheads["big"].queued < 2:
+            await asyncio.sleep(0)
+        small = await async_client.post(
+            "/v1/chat/completions", json={**PAYLOAD, "model": "small"}
+        )
+        assert small.status_code == 200
+        assert backend.in_flight == 1
+        release.set()
+        responses = await asyncio.gather(*big)
+    finally:
+        app.dependency_overrides.clear()
+
+    assert [response.status_code for response in responses] == [200, 200, 200]
+
+
+@pytest.mark.asyncio
+async def test_token_budget_is_charged_by_reported_usage(app: FastAPI, async_client):
+    class MeteredClient(MockOllamaClient):
+        async def invoke(self, messages, **kwargs):
+            await super().invoke(messages, **kwargs)
+            return {
+                "choices": [{"message": {"content": "ok"}}],
+                "usage": {"prompt_tokens": 20, "total_tokens": 1000},
+            }
+
+    budgets = TokenRateLimiter(MemoryTokenBucketStore(), tokens_per_minute=1000)
+    app.dependency_overrides[get_llm_client] = MeteredClient
+    app.dependency_overrides[get_token_rate_limiter] = lambda: budgets
+
+    try:
+        first = await async_client.post(
+            "/v1/chat/completions", json=PAYLOAD, headers={"X-Nexus-Tenant": "a"}
+        )
+        second = await async_client.post(
+            "/v1/chat/completions", json=PAYLOAD, headers={"X-Nexus-Tenant": "a"}
+        )
+        other = await async_client.post(
+            "/v1/chat/completions",
+            json=PAYLOAD,
+            headers={"Authorization": "Bearer other-key"},
+        )
+    finally:
+        app.dependency_overrides.clear()
+
+    assert first.status_code == 200 and other.status_code == 200
+    assert second.status_code == 429
+    assert int(second.headers["Retry-After"]) >= 1
+
+
+@pytest.mark.asyncio
+async def test_requests_rejected_after_debiting_tokens_are_refunded(
+    app: FastAPI, async_client
+):
+    release = asyncio.Event()
+
+    class BlockingClient(MockOllamaClient):
+        async def invoke(self, messages, **kwargs):
+            await release.wait()
+            return await super().invoke(messages, **kwargs)
+
+    limiter = ConcurrencyLimiter(1, max_queue=0, max_wait=1)
+    # Room for a single request of PAYLOAD's estimate per tenant.
+    budgets = TokenRateLimiter(MemoryTokenBucketStore(), tokens_per_minute=6)
+    app.dependency_overrides[get_llm_client] = BlockingClient
+    app.dependency_overrides[get_backend_limiter] = lambda: limiter
+    app.dependency_overrides[get_token_rate_limiter] = lambda: budgets
+    tenant = {"X-Nexus-Tenant": "a"}
+
+    try:
+        running = asyncio.create_task(
+            async_client.post("/v1/chat/completions", json=PAYLOAD)
+        )
+        while limiter.in_flight == 0:
+            await asyncio.sleep(0)
+        shed = [
+            await async_client.post(
+                "/v1/chat/completions",
+                json={**PAYLOAD, "stream": stream},
+                headers=tenant,
+            )
+            for stream in (False, True)
+        ]
+        release.set()
+        await running
+        retried = await async_client.post(
+            "/v1/chat/completions", json=PAYLOAD, headers=tenant
+        )
+    finally:
+        app.dependency_overrides.clear()
+
+    assert [response.status_code for response in shed] == [429, 429]
+    assert retried.status_code == 200
+
+
+def _mlx_backend() -> MLXClient:
+    respx.post("http://mlx:8080/v1/chat/completions").mock(
+        return_value=httpx.Response(
+            200,
+            json={
+                "choices": [{"message": {"role": "assistant", "content": "ok"}}],
+                "usage": {"prompt_tokens": 20, "total_tokens": 1000},
+            },
+        )
+    )
+    return MLXClient(MLXSettings(NEXUS_MLX_HOST="http://mlx:8080"))
+
+
+def _ollama_backend() -> OllamaClient:
+    respx.post("http://ollama:11434/api/chat").mock(
+        return_value=httpx.Response(
+            200,
+            json={
+                "model": "m",
+                "message": {"role": "assistant", "content": "ok"},
+                "done": True,
+                "prompt_eval_count": 20,
+                "eval_count": 980,
+            },
+        )
+    )
+    return OllamaClient(OllamaSettings(NEXUS_OLLAMA_HOST="http://ollama:11434"))
+
+
+@respx.mock
+@pytest.mark.asyncio
+@pytest.mark.parametrize("backend", [_mlx_backend, _ollama_backend])
+async def test_token_budget_settles_usage_reported_by_real_clients(
+    app: FastAPI, async_client, backend
+):
+    client = backend()
+    budgets = TokenRateLimiter(MemoryTokenBucketStore(), tokens_per_minute=1000)
+    app.dependency_overrides[get_llm_client] = lambda: client
+    app.dependency_overrides[get_token_rate_limiter] = lambda: budgets
+
+    try:
+        first = await async_client.post("/v1/chat/completions", json=PAYLOAD)
+        second = await async_client.post("/v1/chat/completions", json=PAYLOAD)
+    finally:
+        app.dependency_overrides.clear()
+        await client.aclose()
+
+    assert first.status_code == 200
+    assert first.json()["choices"][0]["message"]["content"] == "ok"
+    assert first.json()["usage"]["total_tokens"] == 1000
+    assert second.status_code == 429
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_streamed_completions_are_charged_for_reported_usage(
+    app: FastAPI, async_client
+):
+    lines = [
+        {"model": "m", "message": {"role": "assistant", "content": "o"}, "done": False},
+        {
+            "model": "m",
+            "message": {"role": "assistant", "content": "k"},
+            "done": True,
+            "done_reason": "stop",
+            "prompt_eval_count": 20,
+            "eval_count": 980,
+        },
+    ]
+    respx.post("http://ollama:11434/api/chat").mock(
+        return_value=httpx.Response(
+            200, content="".join(json.dumps(line) + "\n" for line in lines)
+        )
+    )
+    client = OllamaClient(OllamaSettings(NEXUS_OLLAMA_HOST="http://ollama:11434"))
+    budgets = TokenRateLimiter(MemoryTokenBucketStore(), tokens_per_minute=1000)
+    app.dependency_overrides[get_llm_client] = lambda: client
+    app.dependency_overrides[get_token_rate_limiter] = lambda: budgets
+    payload = {**PAYLOAD, "stream": True}
+
+    try:
+        first = await async_client.post("/v1/chat/completions", json=payload)
+        second = await async_client.post("/v1/chat/completions", json=payload)
+    finally:
+        app.dependency_overrides.clear()
+        await client.aclose()
+
+    assert first.status_code == 200
+    events = [
+        json.loads(line[len("data: ") :])
+        for line in first.text.splitlines()
+        if line.startswith("data: {")
+    ]
+    assert "".join(e["choices"][0]["delta"]["content"] for e in events) == "ok"
+    assert events[-1]["usage"]["total_tokens"] == 1000
+    assert second.status_code == 429
+
+
+@pytest.mark.asyncio
+async def test_streamed_chunks_are_charged_without_reported_usage(
+    app: FastAPI, async_client
+):
+    class LongStreamClient(MockOllamaClient):
+        async def stream(self, messages, **kwargs):
+            async def _generator():
+                for _ in range(200):
+                    yield "token"
+
+            return _generator()
+
+    budgets = TokenRateLimiter(MemoryTokenBucketStore(), tokens_per_minute=100)
+    app.dependency_overrides[get_llm_client] = LongStreamClient
+    app.dependency_overrides[get_token_rate_limiter] = lambda: budgets
+    payload = {**PAYLOAD, "stream": True}
+
+    try:
+        first = await async_client.post("/v1/chat/completions", json=payload)
+        second = await async_client.post("/v1/chat/completions", json=payload)
+    finally:
+        app.dependency_overrides.clear()
+
+    assert first.status_code == 200 and first.text.count("token") == 200
+    assert second.status_code == 429
+
+
+@pytest.mark.asyncio
+async def test_request_deadline_bounds_queueing_and_backend_calls(
+    app: FastAPI, async_client
+):
+    release = asyncio.Event()
+    deadlines = []
+
+    class HangingClient(MockOllamaClient):
+        async def invoke(self, messages, **kwargs):
+            deadlines.append(kwargs.get("deadline"))
+            await release.wait()
+            return await super().invoke(messages, **kwargs)
+
+    limiter = ConcurrencyLimiter(1, max_queue=5, max_wait=5)
+    app.dependency_overrides[get_llm_client] = HangingClient
+    app.dependency_overrides[get_backend_limiter] = lambda: limiter
+
+    try:
+        running = await async_client.post(
+            "/v1/chat/completions", json=PAYLOAD, headers={"X-Nexus-Timeout": "0.05"}
+        )
+        held = await limiter.acquire()
+        queued = await async_client.post(
+            "/v1/chat/completions", json=PAYLOAD, headers={"X-Nexus-Timeout": "0.05"}
+        )
+        held.release()
+        expired = await async_client.post(
+            "/v1/chat/completions", json=PAYLOAD, headers={"X-Nexus-Timeout": "0"}
+        )
+        invalid = await async_client.post(
+            "/v1/chat/completions", json=PAYLOAD, headers={"X-Nexus-Timeout": "soon"}
+        )
+    finally:
+        release.set()
+        app.dependency_overrides.clear()
+
+    assert running.status_code == queued.status_code == expired.status_code == 504
+    assert invalid.status_code == 400
+    assert len(deadlines) == 1 and deadlines[0] is not None
+    assert limiter.in_flight == 0 and limiter.queued == 0
+
+
+@pytest.mark.asyncio
+async def test_deadline_mid_stream_ends_with_an_error_event(app: FastAPI, async_client):
+    closed = []
+
+    class StallingClient(MockOllamaClient):
+        async def stream(self, messages, **kwargs):
+            async def _generator():
+                try:
+                    yield "first"
+                    await asyncio.sleep(10)
+                    yield "never"
+                finally:
+                    closed.append(True)
+
+            return _generator()
+
+    app.dependency_overrides[get_llm_client] = StallingClient
+    try:
+        response = await async_client.post(
+            "/v1/chat/completions",
+            json={**PAYLOAD, "stream": True},
+            headers={"X-Nexus-Timeout": "0.1"},
+        )
+    finally:
+        app.dependency_overrides.clear()
+
+    events = [line[6:] for line in response.text.splitlines() if line]
+    assert response.status_code == 200
+    assert "first" in events[0]
+    assert json.loads(events[1])["error"]["type"] == "timeout_error"
+    assert events[2:] == ["[DONE]"]
+    assert closed == [True]
@@ -2,6 +2,9 @@
 
 import pytest
 
+from nexus import dependencies
+from nexus.config import NexusSettings
+
 
 @pytest.mark.asyncio
 async def test_health_endpoint_returns_ok(async_client):
@@ -9,3 +12,36 @@ async def test_health_endpoint_returns_ok(async_client):
 
     assert response.status_code == 200
     assert response.json() == {"status": "ok"}
+
+
+@pytest.mark.asyncio
+async def test_admin_reload_endpoint_rereads_settings(
+    monkeypatch, async_client, admin_headers
+):
+    monkeypatch.setattr(dependencies, "_snapshot", dependencies.get_settings_snapshot())
+
+    response = await async_client.post("/admin/reload", headers=admin_headers)
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["status"] == "reloaded"
+    assert body["fingerprint"] == dependencies.get_settings_snapshot().fingerprint
+
+
+@pytest.mark.asyncio
+async def test_admin_endpoints_require_the_configured_token(app, async_client):
+    disabled = await async_client.get("/admin/metrics")
+
+    app.dependency_overrides[dependencies.get_app_settings] = lambda: NexusSettings(
+        NEXUS_ADMIN_TOKEN="admin-secret"
+    )
+    try:
+        missing = await async_client.post("/admin/reload")
+        wrong = await async_client.get(
+            "/admin/metrics", headers={"Authorization": "Bearer guess"}
+        )
+    finally:
+        app.dependency_overrides.clear()
+
+    assert disabled.status_code == 404
+    assert missing.status_code == wrong.status_code == 401
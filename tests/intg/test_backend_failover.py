@@ -0,0 +1,46 @@
+"""Integration tests for fast failure when backend replicas are unhealthy."""
+
+import httpx
+import pytest
+import respx
+from fastapi import FastAPI
+
+from nexus.clients.mlx_client import MLXClient
+from nexus.config import DispatchSettings, MLXSettings
+from nexus.dependencies import get_llm_client
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_open_circuit_returns_503_without_calling_backend(
+    app: FastAPI, async_client
+):
+    route = respx.post("http://mlx:8080/v1/chat/completions").mock(
+        return_value=httpx.Response(502)
+    )
+    client = MLXClient(
+        MLXSettings(NEXUS_MLX_HOST="http://mlx:8080"),
+        dispatch=DispatchSettings(
+            NEXUS_DISPATCH_FAILURE_THRESHOLD=2, NEXUS_DISPATCH_OPEN_DURATION=30
+        ),
+    )
+    app.dependency_overrides[get_llm_client] = lambda: client
+    payload = {"model": "m", "messages": [{"role": "user", "content": "hi"}]}
+
+    try:
+        for _ in range(2):
+            with pytest.raises(httpx.HTTPStatusError):
+                await async_client.post("/v1/chat/completions", json=payload)
+
+        response = await async_client.post("/v1/chat/completions", json=payload)
+        streamed = await async_client.post(
+            "/v1/chat/completions", json={**payload, "stream": True}
+        )
+    finally:
+        app.dependency_overrides.clear()
+        await client.aclose()
+
+    assert response.status_code == 503
+    assert int(response.headers["Retry-After"]) >= 1
+    assert streamed.status_code == 503
+    assert route.call_count == 2
@@ -0,0 +1,161 @@
+"""Integration tests for sharing chat completion results between requests."""
+
+import asyncio
+import json
+
+import pytest
+from fastapi import FastAPI
+
+from dev.mocks.mock_ollama_client import MockOllamaClient
+from nexus.cache import MemoryResponseCache, SingleFlight, StreamMulticast
+from nexus.dependencies import (
+    get_llm_client,
+    get_response_cache,
+    get_single_flight,
+    get_stream_multicast,
+)
+
+PAYLOAD = {
+    "model": "mock-model",
+    "messages": [{"role": "user", "content": "Classify this"}],
+    "temperature": 0,
+}
+
+
+@pytest.fixture()
+def mock_client(app: FastAPI):
+    client = MockOllamaClient()
+    cache = MemoryResponseCache(max_bytes=1 << 20, ttl=60)
+    app.dependency_overrides[get_llm_client] = lambda: client
+    app.dependency_overrides[get_response_cache] = lambda: cache
+    yield client
+    app.dependency_overrides.clear()
+
+
+@pytest.mark.asyncio
+async def test_repeated_deterministic_request_is_served_from_cache(
+    async_client, mock_client
+):
+    first = await async_client.post("/v1/chat/completions", json=PAYLOAD)
+    second = await async_client.post("/v1/chat/completions", json=PAYLOAD)
+
+    assert first.headers["X-Nexus-Cache"] == "miss"
+    assert second.headers["X-Nexus-Cache"] == "hit"
+    assert len(mock_client.invocations) == 1
+    assert second.json()["choices"] == first.json()["choices"]
+    assert second.json()["usage"] == first.json()["usage"]
+    assert second.json()["id"] != first.json()["id"]
+    assert second.json()["model"] == "mock-model"
+
+
+@pytest.mark.asyncio
+async def test_cache_is_skipped_for_sampling_and_bypass_requests(
+    async_client, mock_client
+):
+    sampled = {**PAYLOAD, "temperature": 0.5}
+    await async_client.post("/v1/chat/completions", json=sampled)
+    await async_client.post("/v1/chat/completions", json=sampled)
+    await async_client.post("/v1/chat/completions", json=PAYLOAD)
+    bypassed = await async_client.post(
+        "/v1/chat/completions", json=PAYLOAD, headers={"X-Nexus-Cache": "bypass"}
+    )
+    no_cache = await async_client.post(
+        "/v1/chat/completions", json=PAYLOAD, headers={"Cache-Control": "no-cache"}
+    )
+
+    assert len(mock_client.invocations) == 5
+    assert (
+        "X-Nexus-Cache"
+        not in (await async_client.post("/v1/chat/completions", json=sampled)).headers
+    )
+    assert bypassed.headers["X-Nexus-Cache"] == "miss"
+    assert no_cache.headers["X-Nexus-Cache"] == "miss"
+
+
+@pytest.mark.asyncio
+async def test_streaming_hit_replays_cached_completion(async_client, mock_client):
+    first = await async_client.post("/v1/chat/completions", json=PAYLOAD)
+
+    async with async_client.stream(
+        "POST", "/v1/chat/completions", json={**PAYLOAD, "stream": True}
+    ) as response:
+        assert response.headers["X-Nexus-Cache"] == "hit"
+        assert response.headers["content-type"].startswith("text/event-stream")
+        lines = [line async for line in response.aiter_lines() if line]
+
+    assert lines[-1] == "data: [DONE]"
+    chunks = [json.loads(line[len("data: ") :]) for line in lines[:-1]]
+    assert all(chunk["object"] == "chat.completion.chunk" for chunk in chunks)
+    content = "".join(
+        chunk["choices"][0]["delta"].get("content", "") for chunk in chunks
+    )
+    assert content == first.json()["choices"][0]["message"]["content"]
+    assert chunks[-1]["choices"][0]["finish_reason"] == "stop"
+    assert len(mock_client.invocations) == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_requests_share_one_backend_call(
+    app: FastAPI, async_client
+):
+    class SlowClient(MockOllamaClient):
+        async def invoke(self, messages, **kwargs):
+            await asyncio.sleep(0.01)
+            return await super().invoke(messages, **kwargs)
+
+    client = SlowClient()
+    app.dependency_overrides[get_llm_client] = lambda: client
+    group = SingleFlight()
+    app.dependency_overrides[get_single_flight] = lambda: group
+
+    try:
+        responses = await asyncio.gather(
+            *(async_client.post("/v1/chat/completions", json=PAYLOAD) for _ in range(4))
+        )
+    finally:
+        app.dependency_overrides.clear()
+
+    assert [response.status_code for response in responses] == [200] * 4
+    assert len(client.invocations) == 1
+    assert len({response.json()["id"] for response in responses}) == 4
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_streams_share_one_generation(
+    app: FastAPI, async_client
+):
+    class SlowStreamClient(MockOllamaClient):
+        async def stream(self, messages, **kwargs):
+            inner = await super().stream(messages, **kwargs)
+
+            async def _generator():
+                async for chunk in inner:
+                    await asyncio.sleep(0.01)
+                    yield chunk
+
+            return _generator()
+
+    client = SlowStreamClient()
+    group = StreamMulticast()
+    app.dependency_overrides[get_llm_client] = lambda: client
+    app.dependency_overrides[get_stream_multicast] = lambda: group
+
+    async def consume() -> list[dict]:
+        async with async_client.stream(
+            "POST", "/v1/chat/completions", json={**PAYLOAD, "stream": True}
+        ) as response:
+            lines = [line async for line in response.aiter_lines() if line]
+        assert lines[-1] == "data: [DONE]"
+        return [json.loads(line[len("data: ") :]) for line in lines[:-1]]
+
+    try:
+        first, second = await asyncio.gather(consume(), consume())
+    finally:
+        app.dependency_overrides.clear()
+
+    assert len(client.invocations) == 1
+    assert [chunk["choices"] for chunk in first] == [
+        chunk["choices"] for chunk in second
+    ]
+    assert {chunk["id"] for chunk in first}.isdisjoint(chunk["id"] for chunk in second)
+    assert len({chunk["id"] for chunk in first}) == 1
@@ -1,12 +1,20 @@
 """Integration tests for the OpenAI-compatible chat completions endpoint."""
 
+import asyncio
 import json
 
 import pytest
 from fastapi import FastAPI
 
 from dev.mocks.mock_ollama_client import MockOllamaClient
-from nexus.dependencies import get_llm_client
+from nexus.admission import ConcurrencyLimiter
+from nexus.cache import IdempotencyStore, StreamReplayStore
+from nexus.dependencies import (
+    get_backend_limiter,
+    get_idempotency,
+    get_llm_client,
+    get_stream_replay,
+)
 
 
 @pytest.mark.asyncio
@@ -142,3 +150,182 @@ async def test_create_chat_completion_forwards_backend_options(
         }
     finally:
         app.dependency_overrides.clear()
+
+
+@pytest.mark.asyncio
+async def test_streaming_resumes_from_last_event_id(app: FastAPI, async_client):
+    """A reconnect with Last-Event-ID continues the same generation."""
+
+    mock_client = MockOllamaClient()
+    replay = StreamReplayStore(ttl=60)
+    app.dependency_overrides[get_llm_client] = lambda: mock_client
+    app.dependency_overrides[get_stream_replay] = lambda: replay
+    payload = {"model": "mock-model", "messages": "Stream this", "stream": True}
+
+    try:
+        response = await async_client.post("/v1/chat/completions", json=payload)
+        events = response.text.strip().split("\n\n")
+        ids = [event.split("\n", 1)[0] for event in events]
+        assert all(line.startswith("id: chatcmpl-") for line in ids)
+        assert events[-1].endswith("data: [DONE]")
+
+        resumed = await async_client.post(
+            "/v1/chat/completions",
+            json=payload,
+            headers={"Last-Event-ID": ids[0].removeprefix("id: ")},
+        )
+        assert resumed.status_code == 200
+        assert resumed.text.strip().split("\n\n") == events[1:]
+        assert len(mock_client.invocations) == 1
+
+        expired = await async_client.post(
+            "/v1/chat/completions",
+            json=payload,
+            headers={"Last-Event-ID": "chatcmpl-unknown:0"},
+        )
+        assert expired.status_code == 404
+    finally:
+        app.dependency_overrides.clear()
+        await replay.aclose()
+
+
+@pytest.mark.asyncio
+async def test_idempotency_key_replays_the_first_completion(app: FastAPI, async_client):
+    """Retries with the same Idempotency-Key never trigger a second generation."""
+
+    mock_client = MockOllamaClient()
+    idempotency = IdempotencyStore(ttl=60, max_bytes=1024 * 1024)
+    app.dependency_overrides[get_llm_client] = lambda: mock_client
+    app.dependency_overrides[get_idempotency] = lambda: idempotency
+    payload = {"model": "mock-model", "messages": "Hi", "temperature": 0.8}
+    headers = {"Idempotency-Key": "retry-1"}
+
+    try:
+        first = await async_client.post(
+            "/v1/chat/completions", json=payload, headers=headers
+        )
+        retry = await async_client.post(
+            "/v1/chat/completions", json=payload, headers=headers
+        )
+        assert first.status_code == retry.status_code == 200
+        assert retry.json() == first.json()
+        assert "Idempotent-Replayed" not in first.headers
+        assert retry.headers["Idempotent-Replayed"] == "true"
+        assert len(mock_client.invocations) == 1
+
+        conflict = await async_client.post(
+            "/v1/chat/completions",
+            json={**payload, "messages": "Other"},
+            headers=headers,
+        )
+        assert conflict.status_code == 422
+
+        other_key = await async_client.post(
+            "/v1/chat/completions", json=payload, headers={"Idempotency-Key": "2"}
+        )
+        assert other_key.json()["id"] != first.json()["id"]
+        assert len(mock_client.invocations) == 2
+    finally:
+        app.dependency_overrides.clear()
+        await idempotency.aclose()
+
+
+@pytest.mark.asyncio
+async def test_idempotency_key_on_a_stream_needs_resumable_streams(
+    app: FastAPI, async_client
+):
+    """Without a replay buffer a retried stream cannot be deduplicated."""
+
+    mock_client = MockOllamaClient()
+    idempotency = IdempotencyStore(ttl=60, max_bytes=1024 * 1024)
+    app.dependency_overrides[get_llm_client] = lambda: mock_client
+    app.dependency_overrides[get_idempotency] = lambda: idempotency
+    payload = {"model": "mock-model", "messages": "Hi", "stream": True}
+
+    try:
+        response = await async_client.post(
+            "/v1/chat/completions", json=payload, headers={"Idempotency-Key": "s"}
+        )
+        assert response.status_code == 400
+        assert "Idempotency-Key" in response.json()["detail"]
+        assert mock_client.invocations == []
+    finally:
+        app.dependency_overrides.clear()
+        await idempotency.aclose()
+
+
+@pytest.mark.asyncio
+async def test_idempotency_key_shares_a_resumable_stream(app: FastAPI, async_client):
+    """A retried stream follows the first request's generation from the start."""
+
+    mock_client = MockOllamaClient()
+    replay = StreamReplayStore(ttl=60)
+    idempotency = IdempotencyStore(ttl=60, max_bytes=1024 * 1024)
+    app.dependency_overrides[get_llm_client] = lambda: mock_client
+    app.dependency_overrides[get_stream_replay] = lambda: replay
+    app.dependency_overrides[get_idempotency] = lambda: idempotency
+    payload = {"model": "mock-model", "messages": "Hi", "stream": True}
+    headers = {"Idempotency-Key": "stream-1"}
+
+    try:
+        first = await async_client.post(
+            "/v1/chat/completions", json=payload, headers=headers
+        )
+        retry = await async_client.post(
+            "/v1/chat/completions", json=payload, headers=headers
+        )
+        assert retry.text == first.text
+        assert retry.headers["Idempotent-Replayed"] == "true"
+        assert len(mock_client.invocations) == 1
+    finally:
+        app.dependency_overrides.clear()
+        await replay.aclose()
+        await idempotency.aclose()
+
+
+@pytest.mark.asyncio
+async def test_idempotent_stream_that_failed_to_start_runs_again(
+    app: FastAPI, async_client
+):
+    """A retry after a rejected stream generates instead of replaying the error."""
+
+    release = asyncio.Event()
+
+    class BlockingClient(MockOllamaClient):
+        async def invoke(self, messages, **kwargs):
+            await release.wait()
+            return await super().invoke(messages, **kwargs)
+
+    mock_client = BlockingClient()
+    limiter = ConcurrencyLimiter(1, max_queue=0, max_wait=1)
+    replay = StreamReplayStore(ttl=60)
+    idempotency = IdempotencyStore(ttl=60, max_bytes=1024 * 1024)
+    app.dependency_overrides[get_llm_client] = lambda: mock_client
+    app.dependency_overrides[get_backend_limiter] = lambda: limiter
+    app.dependency_overrides[get_stream_replay] = lambda: replay
+    app.dependency_overrides[get_idempotency] = lambda: idempotency
+    payload = {"model": "mock-model", "messages": "Hi", "stream": True}
+    headers = {"Idempotency-Key": "stream-2"}
+
+    try:
+        running = asyncio.create_task(
+            async_client.post("/v1/chat/completions", json={**payload, "stream": False})
+        )
+        while limiter.in_flight == 0:
+            await asyncio.sleep(0)
+        rejected = await async_client.post(
+            "/v1/chat/completions", json=payload, headers=headers
+        )
+        release.set()
+        await running
+        retry = await async_client.post(
+            "/v1/chat/completions", json=payload, headers=headers
+        )
+        assert rejected.status_code == 429
+        assert retry.status_code == 200
+        assert "Idempotent-Replayed" not in retry.headers
+        assert "Mock Ollama response" in retry.text
+    finally:
+        app.dependency_overrides.clear()
+        await replay.aclose()
+        await idempotency.aclose()
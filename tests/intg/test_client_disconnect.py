@@ -0,0 +1,101 @@
+"""Integration tests for cancelling backend work when clients disconnect."""
+
+import asyncio
+import json
+
+import pytest
+from fastapi import FastAPI
+
+from dev.mocks.mock_ollama_client import MockOllamaClient
+from nexus.admission import ConcurrencyLimiter
+from nexus.dependencies import (
+    get_backend_limiter,
+    get_disconnect_counter,
+    get_llm_client,
+)
+
+PAYLOAD = {"model": "m", "messages": [{"role": "user", "content": "hi"}]}
+
+
+async def _call_and_disconnect(app: FastAPI, body: dict, started: asyncio.Event):
+    """Drive the ASGI app directly and hang up once the backend is busy."""
+
+    hang_up = asyncio.Event()
+    sent: list[dict] = []
+    messages = [
+        {"type": "http.request", "body": json.dumps(body).encode(), "more_body": False}
+    ]
+
+    async def receive() -> dict:
+        if messages:
+            return messages.pop(0)
+        await hang_up.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: dict) -> None:
+        sent.append(message)
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0", "spec_version": "2.4"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": "/v1/chat/completions",
+        "raw_path": b"/v1/chat/completions",
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"content-type", b"application/json")],
+        "client": ("test", 1),
+        "server": ("testserver", 80),
+    }
+    call = asyncio.create_task(app(scope, receive, send))
+    await started.wait()
+    hang_up.set()
+    await asyncio.wait_for(call, timeout=5)
+    return sent
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("stream", [False, True])
+async def test_disconnect_cancels_backend_and_frees_the_slot(app: FastAPI, stream):
+    started = asyncio.Event()
+    cancelled = asyncio.Event()
+
+    class HangingClient(MockOllamaClient):
+        async def invoke(self, messages, **kwargs):
+            started.set()
+            try:
+                await asyncio.sleep(30)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        async def stream(self, messages, **kwargs):
+            async def _generator():
+                yield {"choices": [{"index": 0, "delta": {"content": "a"}}]}
+                started.set()
+                try:
+                    await asyncio.sleep(30)
+                except asyncio.CancelledError:
+                    cancelled.set()
+                    raise
+                yield {"choices": [{"index": 0, "delta": {"content": "b"}}]}
+
+            return _generator()
+
+    limiter = ConcurrencyLimiter(1, max_queue=1, max_wait=1)
+    counter = get_disconnect_counter()
+    before = counter.stats()
+    app.dependency_overrides[get_llm_client] = HangingClient
+    app.dependency_overrides[get_backend_limiter] = lambda: limiter
+
+    try:
+        await _call_and_disconnect(app, {**PAYLOAD, "stream": stream}, started)
+    finally:
+        app.dependency_overrides.clear()
+
+    assert cancelled.is_set()
+    assert limiter.in_flight == 0
+    kind = "streams" if stream else "completions"
+    assert counter.stats()[kind] == before[kind] + 1
@@ -0,0 +1,193 @@
+"""Integration tests for the raw MLX passthrough mode."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+import respx
+from fastapi import FastAPI
+
+from nexus.cache import IdempotencyStore, StreamReplayStore
+from nexus.clients.mlx_client import MLXClient
+from nexus.config import MLXSettings
+from nexus.dependencies import get_idempotency, get_llm_client, get_stream_replay
+
+MLX_URL = "http://mlx:8080/v1/chat/completions"
+
+UPSTREAM_COMPLETION = {
+    "id": "chatcmpl-upstream",
+    "object": "chat.completion",
+    "created": 1700000000,
+    "model": "mlx-model",
+    "choices": [
+        {
+            "index": 0,
+            "message": {
+                "role": "assistant",
+                "content": None,
+                "tool_calls": [
+                    {
+                        "id": "call_1",
+                        "type": "function",
+                        "function": {"name": "lookup", "arguments": "{}"},
+                    }
+                ],
+            },
+            "finish_reason": "tool_calls",
+        }
+    ],
+    "usage": {"prompt_tokens": 11, "completion_tokens": 3, "total_tokens": 14},
+}
+
+
+@pytest.fixture()
+def passthrough_client(app: FastAPI):
+    client = MLXClient(
+        MLXSettings(
+            NEXUS_MLX_HOST="http://mlx:8080",
+            NEXUS_MLX_PASSTHROUGH=True,
+            NEXUS_MLX_MAX_TOKENS=64,
+        )
+    )
+    app.dependency_overrides[get_llm_client] = lambda: client
+    try:
+        yield client
+    finally:
+        app.dependency_overrides.clear()
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_passthrough_returns_upstream_bytes(passthrough_client, async_client):
+    """Non-streaming passthrough returns the upstream body untouched."""
+    upstream_body = json.dumps(UPSTREAM_COMPLETION).encode()
+    route = respx.post(MLX_URL).mock(
+        return_value=httpx.Response(200, content=upstream_body)
+    )
+    payload = {
+        "model": "mlx-model",
+        "messages": [{"role": "user", "content": "Call a tool"}],
+        "temperature": 0,
+        "tools": [{"type": "function", "function": {"name": "lookup"}}],
+    }
+
+    response = await async_client.post("/v1/chat/completions", json=payload)
+
+    assert response.status_code == 200
+    assert response.content == upstream_body
+
+    forwarded = json.loads(route.calls.last.request.content)
+    assert forwarded["temperature"] == 0
+    assert forwarded["tools"] == payload["tools"]
+    assert forwarded["top_p"] == 1.0
+    assert forwarded["max_tokens"] == 64
+    assert forwarded["messages"] == payload["messages"]
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_passthrough_streams_upstream_sse(passthrough_client, async_client):
+    """Streaming passthrough relays the upstream event stream as-is."""
+    upstream_events = (
+        b'data: {"id":"chatcmpl-upstream","choices":[{"delta":{"content":"Hi"}}]}\n\n'
+        b"data: [DONE]\n\n"
+    )
+    respx.post(MLX_URL).mock(return_value=httpx.Response(200, content=upstream_events))
+    payload = {
+        "model": "mlx-model",
+        "messages": [{"role": "user", "content": "Stream"}],
+        "stream": True,
+    }
+
+    response = await async_client.post("/v1/chat/completions", json=payload)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert response.content == upstream_events
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_passthrough_strips_admission_fields(passthrough_client, async_client):
+    """Nexus-only scheduling fields are not relayed upstream."""
+    route = respx.post(MLX_URL).mock(
+        return_value=httpx.Response(200, json=UPSTREAM_COMPLETION)
+    )
+    payload = {
+        "model": "mlx-model",
+        "messages": [{"role": "user", "content": "héllo"}],
+        "priority": "batch",
+        "tenant": "acme",
+        "logit_bias": {"42": 1},
+    }
+
+    response = await async_client.post("/v1/chat/completions", json=payload)
+
+    assert response.status_code == 200
+    forwarded = json.loads(route.calls.last.request.content)
+    assert "priority" not in forwarded and "tenant" not in forwarded
+    assert forwarded["messages"] == payload["messages"]
+    assert forwarded["logit_bias"] == {"42": 1}
+    assert forwarded["max_tokens"] == 64
+
+
+class StallingStream(httpx.AsyncByteStream):
+    """Upstream that stops sending partway through an event."""
+
+    async def __aiter__(self):
+        yield b'data: {"id":"chatcmpl-upstream","choices":[{"delta":{"content":"Hi"}}]}\n\n'
+        yield b'data: {"id":"chatcmpl-upstream","choi'
+        await asyncio.sleep(10)
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_passthrough_deadline_mid_event_sends_a_clean_error_event(
+    passthrough_client, async_client
+):
+    respx.post(MLX_URL).mock(return_value=httpx.Response(200, stream=StallingStream()))
+    payload = {
+        "model": "mlx-model",
+        "messages": [{"role": "user", "content": "Stream"}],
+        "stream": True,
+    }
+
+    response = await async_client.post(
+        "/v1/chat/completions", json=payload, headers={"X-Nexus-Timeout": "0.2"}
+    )
+
+    frames = response.text.split("\n\n")
+    assert response.status_code == 200
+    assert frames[1] == 'data: {"id":"chatcmpl-upstream","choi'
+    assert json.loads(frames[2][len("data: ") :])["error"]["type"] == "timeout_error"
+    assert frames[3:] == ["data: [DONE]", ""]
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_passthrough_stream_rejects_idempotency_keys(
+    app: FastAPI, passthrough_client, async_client
+):
+    """Raw relayed streams cannot be replayed, so a retry would run twice."""
+    route = respx.post(MLX_URL).mock(return_value=httpx.Response(200, content=b""))
+    replay = StreamReplayStore(ttl=60)
+    idempotency = IdempotencyStore(ttl=60, max_bytes=1024 * 1024)
+    app.dependency_overrides[get_stream_replay] = lambda: replay
+    app.dependency_overrides[get_idempotency] = lambda: idempotency
+    payload = {
+        "model": "mlx-model",
+        "messages": [{"role": "user", "content": "Stream"}],
+        "stream": True,
+    }
+
+    try:
+        response = await async_client.post(
+            "/v1/chat/completions", json=payload, headers={"Idempotency-Key": "k"}
+        )
+    finally:
+        await replay.aclose()
+        await idempotency.aclose()
+
+    assert response.status_code == 400
+    assert not route.called
@@ -0,0 +1,266 @@
+"""Unit tests for admission control."""
+
+import asyncio
+
+import pytest
+
+from nexus.admission import (
+    AdmissionController,
+    AdmissionRejectedError,
+    ConcurrencyLimiter,
+    FairQueue,
+    GradientLimit,
+    acquire_all,
+)
+from nexus.config import AdmissionSettings
+from nexus.dispatch import Deadline, DeadlineExceededError, LatencySample
+
+
+async def test_requests_queue_in_fifo_order_once_limit_is_reached() -> None:
+    limiter = ConcurrencyLimiter(1, max_queue=10, max_wait=5)
+    first = await limiter.acquire()
+    order: list[int] = []
+
+    async def wait(position: int) -> None:
+        permit = await limiter.acquire()
+        order.append(position)
+        permit.release()
+
+    waiters = [asyncio.create_task(wait(position)) for position in range(3)]
+    await asyncio.sleep(0)
+    assert limiter.queued == 3 and limiter.in_flight == 1
+
+    first.release()
+    await asyncio.gather(*waiters)
+
+    assert order == [0, 1, 2]
+    assert limiter.in_flight == 0 and limiter.queued == 0
+
+
+async def test_full_queue_is_rejected_with_429() -> None:
+    limiter = ConcurrencyLimiter(1, max_queue=0, max_wait=5)
+    await limiter.acquire()
+
+    with pytest.raises(AdmissionRejectedError) as excinfo:
+        await limiter.acquire()
+
+    assert excinfo.value.status_code == 429
+    assert excinfo.value.retry_after >= 1
+    assert limiter.stats()["rejected_queue_full"] == 1
+
+
+async def test_urgent_request_displaces_queued_batch_work() -> None:
+    queue: FairQueue = FairQueue(("interactive", "batch"), default_priority="batch")
+    limiter = ConcurrencyLimiter(1, max_queue=1, max_wait=5, queue=queue)
+    first = await limiter.acquire()
+    batch = asyncio.create_task(limiter.acquire(priority="batch"))
+    await asyncio.sleep(0)
+
+    with pytest.raises(AdmissionRejectedError):
+        await limiter.acquire(priority="batch")
+    urgent = asyncio.create_task(limiter.acquire(priority="interactive"))
+    await asyncio.sleep(0)
+
+    with pytest.raises(AdmissionRejectedError) as displaced:
+        await batch
+    assert displaced.value.status_code == 429
+    assert limiter.stats()["queued_by_priority"] == {"interactive": 1, "batch": 0}
+    first.release()
+    (await urgent).release()
+    assert limiter.in_flight == 0 and limiter.queued == 0
+
+
+async def test_expired_wait_is_rejected_with_503() -> None:
+    limiter = ConcurrencyLimiter(1, max_queue=5, max_wait=0.01)
+    await limiter.acquire()
+
+    with pytest.raises(AdmissionRejectedError) as excinfo:
+        await limiter.acquire()
+
+    assert excinfo.value.status_code == 503
+    assert limiter.queued == 0
+    assert limiter.stats()["rejected_timeout"] == 1
+
+
+async def test_cancelled_waiter_leaves_the_queue_and_slots_are_not_lost() -> None:
+    limiter = ConcurrencyLimiter(1, max_queue=5, max_wait=5)
+    held = await limiter.acquire()
+    cancelled = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+
+    cancelled.cancel()
+    await asyncio.gather(cancelled, return_exceptions=True)
+    assert limiter.queued == 0
+
+    held.release()
+    held.release()  # releasing twice is harmless
+    assert limiter.in_flight == 0
+    async with limiter.slot():
+        assert limiter.in_flight == 1
+
+
+async def test_retry_after_scales_with_backlog_and_service_time() -> None:
+    clock = [0.0]
+    limiter = ConcurrencyLimiter(2, max_queue=5, max_wait=5, clock=lambda: clock[0])
+    permit = await limiter.acquire()
+    clock[0] = 4.0
+    permit.release()
+
+    assert limiter.retry_after() == 2.0
+    await limiter.acquire()
+    await limiter.acquire()
+    waiter = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    assert limiter.retry_after() == 4.0
+    waiter.cancel()
+    await asyncio.gather(waiter, return_exceptions=True)
+
+
+def _sample(ttft: float | None = None, total: float | None = None, failed=False):
+    return LatencySample("http://a", ttft=ttft, total=total, failed=failed)
+
+
+def test_gradient_limit_grows_while_latency_is_flat() -> None:
+    limit = GradientLimit(initial=4, min_limit=1, max_limit=32)
+
+    for _ in range(50):
+        limit.update(_sample(ttft=0.1, total=1.0), in_flight=limit.limit)
+
+    assert limit.limit == 32
+
+
+def test_gradient_limit_shrinks_when_backend_latency_climbs() -> None:
+    limit = GradientLimit(initial=16, min_limit=2, max_limit=32)
+    for _ in range(20):
+        limit.update(_sample(ttft=0.1), in_flight=limit.limit)
+    grown = limit.limit
+
+    for _ in range(20):
+        limit.update(_sample(ttft=1.0), in_flight=limit.limit)
+
+    assert limit.limit < grown / 2
+
+
+def test_gradient_limit_baseline_follows_a_lasting_latency_drop() -> None:
+    limit = GradientLimit(initial=16, min_limit=2, max_limit=32)
+    for _ in range(50):
+        limit.update(_sample(ttft=1.0), in_flight=limit.limit)
+    for _ in range(50):
+        limit.update(_sample(ttft=0.1), in_flight=limit.limit)
+    grown = limit.limit
+
+    # Five times slower than the new normal, but still faster than the old one.
+    for _ in range(20):
+        limit.update(_sample(ttft=0.5), in_flight=limit.limit)
+
+    assert limit.limit < grown * 2 / 3
+
+
+def test_gradient_limit_backs_off_on_failures_and_ignores_idle_samples() -> None:
+    limit = GradientLimit(initial=10, min_limit=1, max_limit=32)
+
+    assert limit.update(_sample(total=0.1), in_flight=1) == 10
+    assert limit.update(_sample(failed=True), in_flight=10) == 9
+
+
+async def test_raising_the_limit_admits_queued_requests() -> None:
+    limiter = ConcurrencyLimiter(1, max_queue=5, max_wait=5)
+    await limiter.acquire()
+    waiter = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+
+    limiter.set_limit(2)
+
+    await asyncio.wait_for(waiter, 1)
+    assert limiter.in_flight == 2
+
+
+async def test_controller_feeds_backend_samples_into_adaptive_limit() -> None:
+    controller = AdmissionController(
+        AdmissionSettings(
+            NEXUS_ADMISSION_MAX_CONCURRENCY=8, NEXUS_ADMISSION_ADAPTIVE=True
+        )
+    )
+    limiter = controller.limiter("mlx")
+    observe = controller.observer("mlx")
+    assert limiter.limit == 4
+
+    for _ in range(4):
+        await limiter.acquire()
+    for _ in range(30):
+        observe(_sample(ttft=0.1, total=0.5))
+
+    assert limiter.limit == 8
+    assert controller.observer("ollama") is not None
+    assert AdmissionController(AdmissionSettings()).observer("mlx") is None
+
+
+def test_admission_settings_validate_priorities_and_weights() -> None:
+    settings = AdmissionSettings(
+        NEXUS_ADMISSION_PRIORITY_CLASSES="high, low",
+        NEXUS_ADMISSION_DEFAULT_PRIORITY="low",
+        NEXUS_ADMISSION_TENANT_WEIGHTS="acme=3, free=0.5",
+    )
+
+    assert settings.priorities() == ["high", "low"]
+    assert settings.weights() == {"acme": 3.0, "free": 0.5}
+    with pytest.raises(ValueError):
+        AdmissionSettings(NEXUS_ADMISSION_DEFAULT_PRIORITY="urgent")
+    with pytest.raises(ValueError):
+        AdmissionSettings(NEXUS_ADMISSION_TENANT_WEIGHTS="acme")
+
+
+async def test_model_bulkheads_are_separate_from_the_backend_limit() -> None:
+    controller = AdmissionController(
+        AdmissionSettings(
+            NEXUS_ADMISSION_MAX_CONCURRENCY=4,
+            NEXUS_ADMISSION_MODEL_CONCURRENCY="big=1",
+        )
+    )
+    big = controller.model_limiter("mlx", "big")
+
+    assert big is controller.model_limiter("mlx", "big") and big.limit == 1
+    assert controller.model_limiter("mlx", "small") is None
+    assert controller.model_limiter("ollama", "big") is not big
+    assert {"mlx/big", "ollama/big"} <= set(controller.stats())
+
+
+async def test_unlisted_models_share_the_default_bulkhead() -> None:
+    controller = AdmissionController(
+        AdmissionSettings(
+            NEXUS_ADMISSION_MODEL_CONCURRENCY="big=1",
+            NEXUS_ADMISSION_DEFAULT_MODEL_CONCURRENCY=3,
+        )
+    )
+    shared = controller.model_limiter("mlx", "small")
+
+    assert shared is controller.model_limiter("mlx", "made-up") and shared.limit == 3
+    assert controller.model_limiter("mlx", "big") is not shared
+    assert set(controller.stats()) == {"mlx/big", "mlx/*"}
+
+
+async def test_acquire_all_returns_slots_when_a_later_limiter_rejects() -> None:
+    bulkhead = ConcurrencyLimiter(2, max_queue=0, max_wait=1)
+    backend = ConcurrencyLimiter(1, max_queue=0, max_wait=1)
+    held = await acquire_all([bulkhead, backend])
+
+    with pytest.raises(AdmissionRejectedError):
+        await acquire_all([bulkhead, backend])
+    assert bulkhead.in_flight == 1
+
+    held.release()
+    held.release()
+    assert bulkhead.in_flight == 0 and backend.in_flight == 0
+
+
+async def test_deadline_shortens_the_queue_wait() -> None:
+    limiter = ConcurrencyLimiter(1, max_queue=5, max_wait=5)
+    await limiter.acquire()
+
+    with pytest.raises(DeadlineExceededError):
+        await limiter.acquire(deadline=Deadline.after(0.01))
+    with pytest.raises(DeadlineExceededError):
+        await limiter.acquire(deadline=Deadline.after(0))
+
+    assert limiter.queued == 0
+    assert limiter.stats()["rejected_deadline"] == 2
@@ -0,0 +1,11 @@
+"""Smoke tests keeping the ``just bench`` benchmarks runnable."""
+
+from dev.benchmarks import bench_chat_completions
+
+
+async def test_chat_completions_benchmark_runs(capsys) -> None:
+    await bench_chat_completions.main(
+        ["--requests", "5", "--concurrency", "2", "--rounds", "1", "--warmup", "1"]
+    )
+
+    assert "speed-up" in capsys.readouterr().out
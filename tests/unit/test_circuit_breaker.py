@@ -0,0 +1,105 @@
+"""Unit tests for circuit breaking and health probing of replicas."""
+
+import pytest
+
+from nexus.dispatch import (
+    CircuitBreaker,
+    CircuitState,
+    HealthChecker,
+    NoHealthyReplicaError,
+    Replica,
+    ReplicaPool,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_breaker_opens_after_consecutive_failures_and_half_opens() -> None:
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=2, open_duration=5, clock=clock)
+
+    breaker.record_failure()
+    assert breaker.state is CircuitState.CLOSED
+    breaker.record_failure()
+    assert breaker.state is CircuitState.OPEN
+    assert not breaker.allows_request()
+    assert breaker.retry_after() == 5
+
+    clock.now = 5
+    assert breaker.state is CircuitState.HALF_OPEN
+    assert breaker.allows_request()
+    breaker.on_request()
+    assert not breaker.allows_request()  # only one trial at a time
+
+    breaker.record_success(latency=0.1)
+    assert breaker.state is CircuitState.CLOSED
+
+
+def test_failed_half_open_trial_reopens_circuit() -> None:
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, open_duration=1, clock=clock)
+    breaker.record_failure()
+    clock.now = 1
+    breaker.on_request()
+
+    breaker.record_failure()
+
+    assert breaker.state is CircuitState.OPEN
+
+
+def test_slow_calls_count_as_failures() -> None:
+    breaker = CircuitBreaker(failure_threshold=1, slow_call_threshold=0.5)
+
+    breaker.record_success(latency=2.0)
+
+    assert breaker.state is CircuitState.OPEN
+
+
+def test_pool_skips_open_replicas_and_fails_fast_when_all_open() -> None:
+    broken = Replica("http://broken", breaker=CircuitBreaker(failure_threshold=1))
+    healthy = Replica("http://healthy", ewma_latency=5.0, in_flight=10)
+    pool = ReplicaPool([broken, healthy])
+
+    pool.release(pool.acquire(), failed=True)  # broken is idle, so picked first
+    assert broken.breaker.state is CircuitState.OPEN
+    assert pool.acquire() is healthy
+
+    for _ in range(5):
+        healthy.breaker.record_failure()
+    with pytest.raises(NoHealthyReplicaError) as excinfo:
+        pool.acquire()
+    assert excinfo.value.retry_after > 0
+
+
+def test_cancelled_request_does_not_count_as_failure() -> None:
+    replica = Replica("http://a", breaker=CircuitBreaker(failure_threshold=1))
+    pool = ReplicaPool([replica])
+
+    pool.release(pool.acquire())
+
+    assert replica.breaker.state is CircuitState.CLOSED
+    assert replica.ewma_latency is None
+
+
+async def test_health_checker_ejects_and_restores_replicas() -> None:
+    up = {"http://a": False}
+    replica = Replica("http://a", breaker=CircuitBreaker(failure_threshold=1))
+
+    async def probe(target: Replica) -> None:
+        if not up[target.url]:
+            raise ConnectionError("down")
+
+    checker = HealthChecker([replica], probe, interval=60, timeout=1)
+
+    await checker.check_once()
+    assert replica.breaker.state is CircuitState.OPEN
+
+    up["http://a"] = True
+    await checker.check_once()
+    assert replica.breaker.state is CircuitState.CLOSED
@@ -0,0 +1,53 @@
+"""Unit tests for request deadlines and per-phase backend timeouts."""
+
+import asyncio
+
+import pytest
+
+from nexus.dispatch import (
+    BackendTimeoutError,
+    Deadline,
+    DeadlineExceededError,
+    StreamTimer,
+    wait_within,
+)
+
+
+async def _chunks(*delays: float):
+    for index, delay in enumerate(delays):
+        await asyncio.sleep(delay)
+        yield index
+
+
+async def test_wait_within_reports_which_limit_expired() -> None:
+    assert await wait_within(asyncio.sleep(0, "ok"), timeout=1) == "ok"
+
+    with pytest.raises(BackendTimeoutError):
+        await wait_within(asyncio.sleep(1), timeout=0.01, deadline=Deadline.after(5))
+    with pytest.raises(DeadlineExceededError):
+        await wait_within(asyncio.sleep(1), timeout=5, deadline=Deadline.after(0.01))
+    with pytest.raises(DeadlineExceededError):
+        await wait_within(asyncio.sleep(0), deadline=Deadline.after(0))
+
+
+async def test_stream_timer_times_first_token_and_gaps_separately() -> None:
+    timer = StreamTimer(first_token=0.2, inter_token=0.02)
+    assert [chunk async for chunk in timer.chunks(_chunks(0.05, 0, 0))] == [0, 1, 2]
+
+    timer = StreamTimer(first_token=0.02, inter_token=1)
+    with pytest.raises(BackendTimeoutError, match="first token"):
+        [chunk async for chunk in timer.chunks(_chunks(0.1))]
+
+    seen = []
+    timer = StreamTimer(first_token=1, inter_token=0.02)
+    with pytest.raises(BackendTimeoutError, match="next token"):
+        async for chunk in timer.chunks(_chunks(0, 0.1)):
+            seen.append(chunk)
+    assert seen == [0]
+
+
+async def test_stream_timer_ends_at_the_deadline() -> None:
+    timer = StreamTimer(inter_token=5, deadline=Deadline.after(0.05))
+
+    with pytest.raises(DeadlineExceededError):
+        [chunk async for chunk in timer.chunks(_chunks(0, 0.02, 0.02, 0.02))]
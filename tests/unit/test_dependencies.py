@@ -1,9 +1,22 @@
 """Unit tests for the dependency injection system."""
 
+import asyncio
+
+import pytest
+from pydantic import ValidationError
+
 from dev.mocks.mock_mlx_client import MockMLXClient
 from dev.mocks.mock_ollama_client import MockOllamaClient
+from nexus import dependencies
+from nexus.clients.registry import LLMClientRegistry
 from nexus.config import NexusSettings
-from nexus.dependencies import get_app_settings, get_llm_client
+from nexus.dependencies import (
+    get_app_settings,
+    get_llm_client,
+    get_mlx_settings,
+    get_settings_snapshot,
+    reload_settings,
+)
 
 
 def test_get_app_settings_returns_singleton() -> None:
@@ -47,3 +60,71 @@ def test_get_llm_client_falls_back_to_ollama_on_unknown_backend(monkeypatch) ->
     client = get_llm_client(settings=app_settings)
 
     assert isinstance(client, MockOllamaClient)
+
+
+def test_get_llm_client_reuses_client_for_same_settings(monkeypatch) -> None:
+    """Clients should be built once and shared while settings are unchanged."""
+    monkeypatch.setenv("NEXUS_LLM_BACKEND", "mlx")
+    monkeypatch.setenv("NEXUS_USE_MOCK_MLX", "true")
+
+    first = get_llm_client(settings=NexusSettings())
+    second = get_llm_client(settings=NexusSettings())
+
+    monkeypatch.setenv("NEXUS_USE_MOCK_OLLAMA", "true")
+    changed = get_llm_client(settings=NexusSettings())
+
+    assert first is second
+    assert changed is not first
+
+
+def test_backend_settings_are_loaded_once() -> None:
+    """Backend settings should come from the cached snapshot, not the disk."""
+    assert get_mlx_settings() is get_mlx_settings()
+    assert get_mlx_settings() is get_settings_snapshot().mlx
+
+
+def test_reload_settings_swaps_snapshot(monkeypatch) -> None:
+    """reload_settings should pick up environment changes atomically."""
+    monkeypatch.setattr(dependencies, "_snapshot", get_settings_snapshot())
+    monkeypatch.setenv("NEXUS_MLX_MODEL", "reloaded-model")
+
+    previous = get_settings_snapshot()
+    snapshot = reload_settings()
+
+    assert snapshot is get_settings_snapshot()
+    assert snapshot.fingerprint != previous.fingerprint
+    assert get_mlx_settings().model == "reloaded-model"
+
+
+def test_reload_settings_keeps_previous_on_invalid_config(monkeypatch) -> None:
+    """An invalid configuration must not replace the running snapshot."""
+    monkeypatch.setattr(dependencies, "_snapshot", get_settings_snapshot())
+    monkeypatch.setenv("NEXUS_MLX_TIMEOUT", "not-a-number")
+
+    previous = get_settings_snapshot()
+    with pytest.raises(ValidationError):
+        reload_settings()
+
+    assert get_settings_snapshot() is previous
+
+
+async def test_retired_clients_are_closed_after_the_grace_period() -> None:
+    """Clients replaced by a reload must not stay open until shutdown."""
+
+    class ClosingClient(MockOllamaClient):
+        closed = False
+
+        async def aclose(self) -> None:
+            self.closed = True
+
+    registry = LLMClientRegistry()
+    old = registry.get_or_create(("ollama", "old"), ClosingClient)
+    kept = registry.get_or_create(("ollama", "new"), ClosingClient)
+
+    assert registry.retire(lambda key: key[-1] == "old", grace=0.01) == 1
+    assert not old.closed
+    await asyncio.sleep(0.05)
+
+    assert old.closed and not kept.closed
+    await registry.aclose()
+    assert kept.closed
@@ -0,0 +1,97 @@
+"""Unit tests for cancelling work when the client disconnects."""
+
+import asyncio
+
+import pytest
+from starlette.requests import ClientDisconnect
+
+from nexus.api.disconnect import cancel_on_disconnect, stop_on_disconnect
+
+
+class FakeReceive:
+    def __init__(self) -> None:
+        self.disconnected = asyncio.Event()
+
+    async def __call__(self) -> dict:
+        await self.disconnected.wait()
+        return {"type": "http.disconnect"}
+
+
+async def test_completed_work_is_returned_untouched() -> None:
+    receive = FakeReceive()
+
+    async def work() -> str:
+        return "done"
+
+    assert await cancel_on_disconnect(receive, work) == "done"
+
+
+async def test_disconnect_cancels_pending_work_and_waits_for_cleanup() -> None:
+    receive = FakeReceive()
+    cleaned = []
+    cancelled = []
+
+    async def work() -> None:
+        try:
+            await asyncio.sleep(10)
+        finally:
+            cleaned.append(True)
+
+    task = asyncio.create_task(
+        cancel_on_disconnect(receive, work, lambda: cancelled.append(True))
+    )
+    await asyncio.sleep(0)
+    receive.disconnected.set()
+
+    with pytest.raises(ClientDisconnect):
+        await task
+    assert cleaned == [True] and cancelled == [True]
+
+
+async def test_stream_stops_and_closes_upstream_on_disconnect() -> None:
+    receive = FakeReceive()
+    closed = []
+    cancelled = []
+
+    async def upstream():
+        try:
+            yield b"first"
+            await asyncio.sleep(10)
+            yield b"never"
+        finally:
+            closed.append(True)
+
+    events = stop_on_disconnect(receive, upstream(), lambda: cancelled.append(True))
+    assert await events.__anext__() == b"first"
+    pending = asyncio.ensure_future(events.__anext__())
+    await asyncio.sleep(0)
+    receive.disconnected.set()
+
+    with pytest.raises(StopAsyncIteration):
+        await pending
+    assert closed == [True] and cancelled == [True]
+
+
+async def test_stream_relays_every_event_when_client_stays() -> None:
+    async def upstream():
+        for chunk in (b"a", b"b"):
+            yield chunk
+
+    events = stop_on_disconnect(FakeReceive(), upstream())
+
+    assert [event async for event in events] == [b"a", b"b"]
+
+
+async def test_stream_is_read_in_the_consuming_task() -> None:
+    readers = set()
+
+    async def upstream():
+        for index in range(5):
+            await asyncio.sleep(0)
+            readers.add(asyncio.current_task())
+            yield index
+
+    events = stop_on_disconnect(FakeReceive(), upstream())
+
+    assert [event async for event in events] == list(range(5))
+    assert readers == {asyncio.current_task()}
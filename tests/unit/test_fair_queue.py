@@ -0,0 +1,83 @@
+"""Unit tests for priority and tenant-fair queue ordering."""
+
+from collections import Counter
+
+import pytest
+
+from nexus.admission import FairQueue
+
+CLASSES = ("interactive", "default", "batch")
+
+
+def test_single_class_and_tenant_is_fifo() -> None:
+    queue: FairQueue[int] = FairQueue()
+    for item in range(5):
+        queue.push(item, priority=None, tenant=None)
+
+    assert [queue.pop() for _ in range(6)] == [0, 1, 2, 3, 4, None]
+
+
+def test_higher_classes_are_served_first() -> None:
+    queue: FairQueue[str] = FairQueue(CLASSES)
+    queue.push("batch", priority="batch", tenant="a")
+    queue.push("unknown", priority="nope", tenant="a")
+    queue.push("interactive", priority="interactive", tenant="b")
+
+    assert [queue.pop() for _ in range(3)] == ["interactive", "unknown", "batch"]
+
+
+def test_flooding_tenant_does_not_starve_others() -> None:
+    queue: FairQueue[str] = FairQueue()
+    for index in range(10):
+        queue.push(f"flood-{index}", priority=None, tenant="flood")
+    queue.push("quiet-0", priority=None, tenant="quiet")
+    queue.push("quiet-1", priority=None, tenant="quiet")
+
+    served = [queue.pop() for _ in range(4)]
+
+    assert {"quiet-0", "quiet-1"} <= set(served)
+
+
+def test_tenant_weights_set_share_of_dequeues() -> None:
+    queue: FairQueue[tuple[str, int]] = FairQueue(weights={"gold": 3})
+    for index in range(20):
+        queue.push(("gold", index), priority=None, tenant="gold")
+        queue.push(("free", index), priority=None, tenant="free")
+
+    served = Counter(queue.pop()[0] for _ in range(8))
+
+    assert served == {"gold": 6, "free": 2}
+
+
+def test_pop_lowest_evicts_newest_request_of_least_urgent_class() -> None:
+    queue: FairQueue[str] = FairQueue(CLASSES)
+    queue.push("default", priority="default", tenant="a")
+    queue.push("batch-old", priority="batch", tenant="a")
+    queue.push("batch-new", priority="batch", tenant="b")
+
+    assert queue.pop_lowest(queue.rank("batch")) is None
+    assert queue.pop_lowest(queue.rank("interactive")) == "batch-new"
+    assert queue.sizes() == {"interactive": 0, "default": 1, "batch": 1}
+    assert queue.remove("batch-old") and not queue.remove("batch-old")
+    assert len(queue) == 1
+
+
+def test_default_priority_must_be_a_known_class() -> None:
+    with pytest.raises(ValueError):
+        FairQueue(CLASSES, default_priority="urgent")
+
+
+def test_removed_items_do_not_charge_or_keep_their_tenant() -> None:
+    queue: FairQueue[str] = FairQueue()
+    queue.push("abandoned", priority=None, tenant="unique-tenant")
+
+    assert queue.remove("abandoned")
+    assert queue._classes[0].last_finish == {}
+
+    queue.push("queued", priority=None, tenant="a")
+    queue.push("first", priority=None, tenant="b")
+    queue.push("second", priority=None, tenant="b")
+    queue.remove("second")
+    queue.push("third", priority=None, tenant="b")
+    # b is charged only for requests that can still be served.
+    assert queue._classes[0].last_finish == {"a": 1.0, "b": 2.0}
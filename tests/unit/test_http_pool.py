@@ -0,0 +1,95 @@
+"""Unit tests for the pooled MLX HTTP clients."""
+
+import httpx
+import respx
+
+from nexus.clients.http_pool import HTTPClientPool
+from nexus.clients.mlx_client import MLXClient
+from nexus.config import MLXSettings
+
+
+async def test_pool_reuses_client_per_host() -> None:
+    """The same host should always map to the same long-lived client."""
+    pool = HTTPClientPool.from_settings(MLXSettings())
+
+    first = pool.get("http://mlx:8080/")
+    second = pool.get("http://mlx:8080")
+    other = pool.get("http://mlx-b:8080")
+
+    assert first is second
+    assert first is not other
+
+    await pool.aclose()
+    assert first.is_closed and other.is_closed
+
+
+async def test_partitions_get_independent_clients_per_host() -> None:
+    """Per-model partitions must not share connection limits."""
+    pool = HTTPClientPool.from_settings(MLXSettings())
+
+    big = pool.get("http://mlx:8080", "big-model")
+    small = pool.get("http://mlx:8080", "small-model")
+
+    assert big is not small and big is not pool.get("http://mlx:8080")
+    assert big is pool.get("http://mlx:8080/", "big-model")
+    await pool.aclose()
+
+
+def test_settings_translate_to_httpx_limits(monkeypatch) -> None:
+    """Pool sizing and timeouts should come from MLXSettings."""
+    monkeypatch.setenv("NEXUS_MLX_POOL_MAX_CONNECTIONS", "7")
+    monkeypatch.setenv("NEXUS_MLX_KEEPALIVE_EXPIRY", "12.5")
+    monkeypatch.setenv("NEXUS_MLX_CONNECT_TIMEOUT", "2")
+    settings = MLXSettings()
+
+    limits = settings.to_httpx_limits()
+    timeout = settings.to_httpx_timeout()
+
+    assert limits.max_connections == 7
+    assert limits.keepalive_expiry == 12.5
+    assert timeout.connect == 2
+    assert timeout.read == settings.timeout
+
+
+@respx.mock
+async def test_mlx_client_uses_shared_pool() -> None:
+    """MLXClient calls should go through the injected pool."""
+    route = respx.post("http://mlx:8080/v1/chat/completions").mock(
+        return_value=httpx.Response(
+            200, json={"choices": [{"message": {"content": "pooled"}}]}
+        )
+    )
+    pool = HTTPClientPool.from_settings(MLXSettings())
+    client = MLXClient(MLXSettings(NEXUS_MLX_HOST="http://mlx:8080"), http_pool=pool)
+
+    for content in ("hi", "again"):
+        response = await client.invoke([{"role": "user", "content": content}])
+        assert response["choices"][0]["message"]["content"] == "pooled"
+
+    assert route.call_count == 2
+    await client.aclose()
+    assert not pool.get("http://mlx:8080").is_closed
+    await pool.aclose()
+
+
+@respx.mock
+async def test_only_configured_models_get_their_own_pool() -> None:
+    """Unknown model names share the host's client instead of creating pools."""
+    respx.post("http://mlx:8080/v1/chat/completions").mock(
+        return_value=httpx.Response(
+            200, json={"choices": [{"message": {"content": "ok"}}]}
+        )
+    )
+    pool = HTTPClientPool.from_settings(MLXSettings())
+    client = MLXClient(
+        MLXSettings(NEXUS_MLX_HOST="http://mlx:8080", NEXUS_MLX_POOL_PER_MODEL=True),
+        http_pool=pool,
+        partitions={"big"},
+    )
+
+    for model in ("big", "made-up-1", "made-up-2", "big"):
+        await client.invoke("hi", model=model)
+
+    assert len(pool) == 2
+    await client.aclose()
+    await pool.aclose()
@@ -0,0 +1,104 @@
+"""Unit tests for deduplicating retries by idempotency key."""
+
+import asyncio
+
+import pytest
+
+from nexus.cache import IdempotencyConflictError, IdempotencyStore
+
+
+class Backend:
+    """Counts calls and completes them when released by the test."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.release = asyncio.Event()
+
+    async def call(self) -> bytes:
+        self.calls += 1
+        await self.release.wait()
+        return f"result-{self.calls}".encode()
+
+
+async def test_concurrent_and_later_duplicates_share_one_call() -> None:
+    store = IdempotencyStore(ttl=60, max_bytes=1024)
+    backend = Backend()
+
+    first = asyncio.ensure_future(store.complete("k", "fp", backend.call))
+    second = asyncio.ensure_future(store.complete("k", "fp", backend.call))
+    await asyncio.sleep(0)
+    backend.release.set()
+
+    assert await first == (b"result-1", False)
+    assert await second == (b"result-1", True)
+    assert await store.complete("k", "fp", backend.call) == (b"result-1", True)
+    assert backend.calls == 1
+
+
+async def test_departed_caller_leaves_the_call_running_for_its_retry() -> None:
+    store = IdempotencyStore(ttl=60, max_bytes=1024)
+    backend = Backend()
+    first = asyncio.ensure_future(store.complete("k", "fp", backend.call))
+    await asyncio.sleep(0)
+    first.cancel()
+    await asyncio.sleep(0)
+
+    retry = asyncio.ensure_future(store.complete("k", "fp", backend.call))
+    backend.release.set()
+
+    assert await retry == (b"result-1", True)
+    assert backend.calls == 1
+
+
+async def test_reusing_a_key_for_another_request_conflicts() -> None:
+    store = IdempotencyStore(ttl=60, max_bytes=1024)
+    backend = Backend()
+    backend.release.set()
+    await store.complete("k", "fp", backend.call)
+
+    with pytest.raises(IdempotencyConflictError) as conflict:
+        await store.complete("k", "other", backend.call)
+    assert conflict.value.status_code == 422
+    with pytest.raises(IdempotencyConflictError):
+        await store.claim("k", "other", b"id")
+
+
+async def test_failed_calls_are_not_stored() -> None:
+    store = IdempotencyStore(ttl=60, max_bytes=1024)
+    attempts = []
+
+    async def flaky() -> bytes:
+        attempts.append(None)
+        if len(attempts) == 1:
+            raise RuntimeError("backend down")
+        return b"ok"
+
+    with pytest.raises(RuntimeError):
+        await store.complete("k", "fp", flaky)
+    assert await store.complete("k", "fp", flaky) == (b"ok", False)
+    assert len(attempts) == 2
+
+
+async def test_claim_returns_the_first_value_until_it_expires() -> None:
+    now = [0.0]
+    store = IdempotencyStore(ttl=10, max_bytes=1024, clock=lambda: now[0])
+
+    assert await store.claim("k", "fp", b"first") is None
+    assert await store.claim("k", "fp", b"second") == b"first"
+
+    now[0] = 10.0
+    assert await store.claim("k", "fp", b"third") is None
+
+
+async def test_claims_can_be_shortened_and_released() -> None:
+    now = [0.0]
+    store = IdempotencyStore(ttl=60, max_bytes=1024, clock=lambda: now[0])
+
+    assert await store.claim("k", "fp", b"first", ttl=5) is None
+    await store.release("k", b"other")
+    assert await store.claim("k", "fp", b"second") == b"first"
+    await store.release("k", b"first")
+    assert await store.claim("k", "fp", b"third", ttl=5) is None
+
+    now[0] = 5.0
+    assert await store.claim("k", "fp", b"fourth") is None
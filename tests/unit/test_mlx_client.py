@@ -0,0 +1,176 @@
+"""Unit tests for the MLX HTTP client."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+import respx
+
+from nexus.clients.mlx_client import MLXClient
+from nexus.config import MLXSettings
+from nexus.dispatch import BackendTimeoutError, Deadline, DeadlineExceededError
+
+MLX_URL = "http://mlx:8080/v1/chat/completions"
+
+
+class RecordingStream(httpx.AsyncByteStream):
+    """Byte stream that records how far the consumer read and whether it closed."""
+
+    def __init__(self, events: list[bytes]) -> None:
+        self.events = events
+        self.sent = 0
+        self.closed = False
+
+    async def __aiter__(self):
+        for event in self.events:
+            self.sent += 1
+            yield event
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+def _sse(payload: dict) -> bytes:
+    return f"data: {json.dumps(payload)}\n\n".encode()
+
+
+def _client(*, relay: bool = False) -> MLXClient:
+    return MLXClient(
+        MLXSettings(NEXUS_MLX_HOST="http://mlx:8080", NEXUS_MLX_STREAM_RELAY=relay)
+    )
+
+
+@respx.mock
+async def test_stream_yields_chunks_while_connection_is_open() -> None:
+    """Chunks should be read incrementally from a live upstream response."""
+    upstream = RecordingStream(
+        [
+            _sse({"choices": [{"delta": {"content": "Hel"}}]}),
+            _sse({"choices": [{"delta": {"content": "lo"}}]}),
+            b"data: [DONE]\n\n",
+        ]
+    )
+    respx.post(MLX_URL).mock(return_value=httpx.Response(200, stream=upstream))
+    client = _client()
+
+    iterator = await client.stream([{"role": "user", "content": "hi"}])
+    first = await iterator.__anext__()
+
+    assert first["choices"][0]["delta"]["content"] == "Hel"
+    assert not upstream.closed
+
+    rest = [chunk async for chunk in iterator]
+    assert [c["choices"][0]["delta"]["content"] for c in rest] == ["lo"]
+    assert upstream.closed
+    await client.aclose()
+
+
+@respx.mock
+async def test_closing_stream_early_releases_upstream() -> None:
+    """Abandoning the iterator must close the upstream response immediately."""
+    upstream = RecordingStream(
+        [_sse({"choices": [{"delta": {"content": str(i)}}]}) for i in range(100)]
+    )
+    respx.post(MLX_URL).mock(return_value=httpx.Response(200, stream=upstream))
+    client = _client()
+
+    iterator = await client.stream([{"role": "user", "content": "hi"}])
+    await iterator.__anext__()
+    await iterator.aclose()
+
+    assert upstream.closed
+    assert upstream.sent < 100
+    await client.aclose()
+
+
+@respx.mock
+async def test_relay_mode_yields_raw_payload_bytes() -> None:
+    """Relay mode should hand back the data payloads without parsing them."""
+    upstream = RecordingStream(
+        [
+            b'data: {"id":"up","choices":[{"delta":{"content":"a"}}]}\n',
+            b'\ndata: {"id":"up","choices":[{"delta":{"content":"b"}}]}\r\n\r\n',
+            b"data: [DONE]\n\n",
+        ]
+    )
+    respx.post(MLX_URL).mock(return_value=httpx.Response(200, stream=upstream))
+    client = _client(relay=True)
+
+    chunks = [chunk async for chunk in await client.stream("hi")]
+
+    assert chunks == [
+        b'{"id":"up","choices":[{"delta":{"content":"a"}}]}',
+        b'{"id":"up","choices":[{"delta":{"content":"b"}}]}',
+    ]
+    await client.aclose()
+
+
+@respx.mock
+async def test_stream_reports_time_to_first_token_and_total_latency() -> None:
+    """Finished streams feed TTFT and total latency to the latency observer."""
+    upstream = RecordingStream(
+        [_sse({"choices": [{"delta": {"content": "a"}}]}), b"data: [DONE]\n\n"]
+    )
+    respx.post(MLX_URL).mock(return_value=httpx.Response(200, stream=upstream))
+    samples = []
+    client = MLXClient(
+        MLXSettings(NEXUS_MLX_HOST="http://mlx:8080"), latency_observer=samples.append
+    )
+
+    assert len([chunk async for chunk in await client.stream("hi")]) == 1
+
+    (sample,) = samples
+    assert sample.replica == "http://mlx:8080" and not sample.failed
+    assert 0 < sample.ttft <= sample.total
+    await client.aclose()
+
+
+class StallingStream(RecordingStream):
+    """Byte stream that stops sending after its events without closing."""
+
+    async def __aiter__(self):
+        async for event in super().__aiter__():
+            yield event
+        await asyncio.sleep(30)
+
+
+@respx.mock
+async def test_stalled_stream_hits_the_inter_token_timeout() -> None:
+    upstream = StallingStream([_sse({"choices": [{"delta": {"content": "a"}}]})])
+    respx.post(MLX_URL).mock(return_value=httpx.Response(200, stream=upstream))
+    client = MLXClient(
+        MLXSettings(
+            NEXUS_MLX_HOST="http://mlx:8080",
+            NEXUS_MLX_STREAM_RELAY=False,
+            NEXUS_MLX_FIRST_TOKEN_TIMEOUT=5,
+            NEXUS_MLX_INTER_TOKEN_TIMEOUT=0.05,
+        )
+    )
+
+    iterator = await client.stream([{"role": "user", "content": "hi"}])
+    assert (await iterator.__anext__())["choices"][0]["delta"]["content"] == "a"
+    with pytest.raises(BackendTimeoutError):
+        await iterator.__anext__()
+
+    assert upstream.closed
+    await client.aclose()
+
+
+@respx.mock
+async def test_expired_deadline_stops_the_stream_without_blaming_the_replica() -> None:
+    upstream = StallingStream([])
+    respx.post(MLX_URL).mock(return_value=httpx.Response(200, stream=upstream))
+    samples = []
+    client = MLXClient(
+        MLXSettings(NEXUS_MLX_HOST="http://mlx:8080"), latency_observer=samples.append
+    )
+
+    iterator = await client.stream(
+        [{"role": "user", "content": "hi"}], deadline=Deadline.after(0.05)
+    )
+    with pytest.raises(DeadlineExceededError):
+        await iterator.__anext__()
+
+    assert upstream.closed and samples == []
+    await client.aclose()
@@ -0,0 +1,135 @@
+"""Unit tests for replica load balancing."""
+
+import random
+
+import httpx
+import pytest
+import respx
+
+from nexus.clients.mlx_client import MLXClient
+from nexus.config import MLXSettings
+from nexus.config.dispatch_settings import parse_replicas
+from nexus.dispatch import Replica, ReplicaPool, prefix_hash
+
+
+def test_parse_replicas_reads_urls_and_weights() -> None:
+    assert parse_replicas("http://a:1=2, http://b:2/ ,", default="x") == [
+        ("http://a:1", 2.0),
+        ("http://b:2", 1.0),
+    ]
+    assert parse_replicas("", default="http://only/") == [("http://only", 1.0)]
+    for weight in ("0", "-1", "nan", "inf"):
+        with pytest.raises(ValueError):
+            parse_replicas(f"http://a={weight}", default="x")
+
+
+def test_least_outstanding_prefers_idle_replica() -> None:
+    busy = Replica("http://busy", in_flight=3)
+    idle = Replica("http://idle")
+    pool = ReplicaPool([busy, idle])
+
+    assert pool.acquire() is idle
+    assert idle.in_flight == 1
+
+
+def test_weights_scale_share_of_outstanding_requests() -> None:
+    big = Replica("http://big", weight=3)
+    small = Replica("http://small", weight=1)
+    pool = ReplicaPool([big, small], rng=random.Random(0))
+
+    for _ in range(8):
+        pool.acquire()
+
+    assert (big.in_flight, small.in_flight) == (6, 2)
+
+
+def test_release_updates_latency_ewma_and_skips_failures() -> None:
+    replica = Replica("http://a")
+    pool = ReplicaPool([replica], ewma_alpha=0.5)
+
+    pool.release(pool.acquire(), latency=2.0)
+    pool.release(pool.acquire(), latency=1.0)
+    pool.release(pool.acquire(), latency=None)
+
+    assert replica.ewma_latency == 1.5
+    assert replica.in_flight == 0
+
+
+def test_slow_replica_receives_less_traffic() -> None:
+    fast = Replica("http://fast", ewma_latency=0.1)
+    slow = Replica("http://slow", ewma_latency=1.0)
+    pool = ReplicaPool([fast, slow], strategy="p2c", rng=random.Random(1))
+
+    for _ in range(20):
+        pool.acquire()
+
+    assert fast.in_flight > slow.in_flight
+
+
+def _conversation(system: str, opener: str, *later: str) -> list[dict[str, str]]:
+    messages = [
+        {"role": "system", "content": system},
+        {"role": "user", "content": opener},
+    ]
+    return messages + [{"role": "assistant", "content": text} for text in later]
+
+
+def test_prefix_hash_ignores_history_after_the_prefix() -> None:
+    first = prefix_hash(_conversation("sys", "hello"), turns=1)
+
+    assert first == prefix_hash(_conversation("sys", "hello", "hi", "more"), turns=1)
+    assert first != prefix_hash(_conversation("sys", "other"), turns=1)
+    assert prefix_hash(_conversation("sys", "a"), turns=0) == prefix_hash(
+        _conversation("sys", "b"), turns=0
+    )
+    assert prefix_hash("plain prompt", turns=1) is None
+
+
+def test_prefix_affinity_keeps_conversations_on_one_replica() -> None:
+    replicas = [Replica(f"http://r{i}") for i in range(4)]
+    pool = ReplicaPool(replicas, strategy="prefix_affinity")
+    key = pool.affinity_key(_conversation("sys", "hello"))
+
+    chosen = {pool.choose(key) for _ in range(10)}
+    grown = pool.choose(pool.affinity_key(_conversation("sys", "hello", "hi")))
+
+    assert len(chosen) == 1 and grown in chosen
+
+
+def test_prefix_affinity_spills_over_when_owner_is_hot() -> None:
+    replicas = [Replica(f"http://r{i}") for i in range(4)]
+    pool = ReplicaPool(replicas, strategy="prefix_affinity", affinity_load_factor=1.5)
+    key = pool.affinity_key(_conversation("sys", "hello"))
+
+    held = [pool.acquire(key) for _ in range(12)]
+
+    assert all(replica.in_flight <= 5 for replica in replicas)
+    assert len(set(held)) > 1
+    assert held[0].in_flight == max(replica.in_flight for replica in replicas)
+
+
+def test_affinity_key_is_disabled_for_other_strategies() -> None:
+    pool = ReplicaPool([Replica("http://a")])
+
+    assert pool.affinity_key(_conversation("sys", "hello")) is None
+
+
+@respx.mock
+async def test_mlx_client_spreads_requests_across_replicas() -> None:
+    body = {"choices": [{"message": {"content": "ok"}}]}
+    first = respx.post("http://mlx-a:8080/v1/chat/completions").mock(
+        return_value=httpx.Response(200, json=body)
+    )
+    second = respx.post("http://mlx-b:8080/v1/chat/completions").mock(
+        return_value=httpx.Response(200, json=body)
+    )
+    client = MLXClient(
+        MLXSettings(NEXUS_MLX_REPLICAS="http://mlx-a:8080,http://mlx-b:8080")
+    )
+
+    for _ in range(10):
+        response = await client.invoke("hi")
+        assert response["choices"][0]["message"]["content"] == "ok"
+
+    assert first.call_count > 0 and second.call_count > 0
+    await client.aclose()
@@ -0,0 +1,135 @@
+"""Unit tests for the chat completion response cache."""
+
+from nexus.cache import (
+    MemoryResponseCache,
+    SQLiteResponseCache,
+    TieredResponseCache,
+    completion_cache_key,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_cache_key_ignores_field_order_but_not_values() -> None:
+    messages = [{"role": "user", "content": "hi"}]
+    key = completion_cache_key(
+        "mlx", "m", messages, {"temperature": 0, "top_p": 1.0, "tools": []}
+    )
+
+    assert key == completion_cache_key(
+        "mlx", "m", messages, {"tools": [], "top_p": 1.0, "temperature": 0}
+    )
+    assert key != completion_cache_key("mlx", "m", messages, {"temperature": 0})
+    assert key != completion_cache_key(
+        "ollama", "m", messages, {"temperature": 0, "top_p": 1.0, "tools": []}
+    )
+
+
+async def test_lru_eviction_is_bounded_by_bytes() -> None:
+    cache = MemoryResponseCache(max_bytes=25, ttl=60)
+
+    await cache.set("a", b"x" * 9)
+    await cache.set("b", b"x" * 9)
+    assert await cache.get("a") is not None  # "a" becomes most recent
+    await cache.set("c", b"x" * 9)
+
+    assert await cache.get("b") is None
+    assert await cache.get("a") is not None and await cache.get("c") is not None
+    assert cache.size == 20
+
+    await cache.set("huge", b"x" * 100)
+    assert await cache.get("huge") is None and len(cache) == 2
+
+
+async def test_entries_expire_after_ttl() -> None:
+    clock = FakeClock()
+    cache = MemoryResponseCache(max_bytes=1024, ttl=10, clock=clock)
+    await cache.set("k", b"v")
+
+    clock.now = 9.9
+    assert await cache.get("k") == b"v"
+    clock.now = 10
+    assert await cache.get("k") is None
+    assert cache.size == 0
+
+
+async def test_disk_cache_survives_restart_and_is_shared(tmp_path) -> None:
+    path = tmp_path / "cache" / "responses.sqlite3"
+    writer = SQLiteResponseCache(path, max_bytes=1024, ttl=60)
+    reader = SQLiteResponseCache(path, max_bytes=1024, ttl=60)
+
+    await writer.set("k", b"payload")
+    assert await reader.get("k") == b"payload"
+    await writer.aclose()
+
+    restarted = SQLiteResponseCache(path, max_bytes=1024, ttl=60)
+    assert await restarted.get("k") == b"payload"
+    await restarted.aclose()
+    await reader.aclose()
+
+
+async def test_disk_cache_evicts_least_recently_used_and_expired(tmp_path) -> None:
+    clock = FakeClock()
+    cache = SQLiteResponseCache(
+        tmp_path / "c.sqlite3", max_bytes=25, ttl=10, clock=clock
+    )
+
+    await cache.set("a", b"x" * 9)
+    clock.now = 1
+    await cache.set("b", b"x" * 9)
+    clock.now = 2
+    assert await cache.get("a") is not None
+    clock.now = 3
+    await cache.set("c", b"x" * 9)
+
+    assert await cache.get("b") is None
+    assert await cache.lookup("a") == (b"x" * 9, 7)
+
+    clock.now = 12
+    assert await cache.get("a") is None
+    assert await cache.get("c") == b"x" * 9
+    await cache.aclose()
+
+
+async def test_disk_cache_keeps_a_running_total_across_writers(tmp_path) -> None:
+    path = tmp_path / "c.sqlite3"
+    first = SQLiteResponseCache(path, max_bytes=25, ttl=60)
+    second = SQLiteResponseCache(path, max_bytes=25, ttl=60)
+
+    for _ in range(3):
+        # Overwrites replace the entry's size rather than adding to it.
+        await first.set("a", b"x" * 9)
+    await second.set("b", b"x" * 9)
+    assert await first.get("a") is not None and await first.get("b") is not None
+
+    await second.set("c", b"x" * 9)
+    assert await first.get("a") is None
+    assert await first.get("c") is not None
+    await first.aclose()
+    await second.aclose()
+
+
+async def test_tiered_cache_promotes_disk_hits_with_remaining_ttl(tmp_path) -> None:
+    clock = FakeClock()
+    disk = SQLiteResponseCache(
+        tmp_path / "c.sqlite3", max_bytes=1024, ttl=10, clock=clock
+    )
+    await disk.set("k", b"v")
+    clock.now = 6
+    memory = MemoryResponseCache(max_bytes=1024, ttl=10, clock=clock)
+    cache = TieredResponseCache(memory, disk)
+
+    assert await cache.get("k") == b"v"
+    assert await memory.get("k") == b"v"
+    clock.now = 10
+    assert await memory.get("k") is None
+
+    await cache.set("other", b"w")
+    assert await disk.get("other") == b"w"
+    await cache.aclose()
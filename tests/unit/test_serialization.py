@@ -0,0 +1,41 @@
+"""Unit tests for the fast JSON response helpers."""
+
+import json
+
+import pytest
+
+from nexus.api import serialization
+from nexus.api.serialization import JSONBytesResponse, dumps
+
+
+def test_dumps_produces_compact_utf8_json() -> None:
+    payload = {"content": "héllo", "n": [1, 2]}
+
+    encoded = dumps(payload)
+
+    assert isinstance(encoded, bytes)
+    assert json.loads(encoded) == payload
+    assert b" " not in encoded.replace(b"h\xc3\xa9llo", b"")
+
+
+def test_json_bytes_response_passes_bytes_through() -> None:
+    assert JSONBytesResponse(b'{"a":1}').body == b'{"a":1}'
+    assert JSONBytesResponse({"a": 1}).body == b'{"a":1}'
+    assert JSONBytesResponse({"a": 1}).media_type == "application/json"
+
+
+PAYLOAD = {"a": [1, "é", None, True], "b": {"c": 1.5}}
+
+
+def test_dumps_uses_orjson_when_installed(monkeypatch) -> None:
+    orjson = pytest.importorskip("orjson")
+    monkeypatch.setattr(serialization, "orjson", orjson)
+
+    assert dumps(PAYLOAD) == orjson.dumps(PAYLOAD)
+    assert dumps(PAYLOAD) == '{"a":[1,"é",null,true],"b":{"c":1.5}}'.encode()
+
+
+def test_dumps_falls_back_to_stdlib(monkeypatch) -> None:
+    monkeypatch.setattr(serialization, "orjson", None)
+
+    assert dumps(PAYLOAD) == '{"a":[1,"é",null,true],"b":{"c":1.5}}'.encode()
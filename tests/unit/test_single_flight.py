@@ -0,0 +1,83 @@
+"""Unit tests for single-flight coalescing of identical calls."""
+
+import asyncio
+
+import pytest
+
+from nexus.cache import SingleFlight
+
+
+class GatedCall:
+    """Upstream stand-in that blocks until released and counts invocations."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.cancelled = False
+        self.release = asyncio.Event()
+
+    async def __call__(self) -> str:
+        self.calls += 1
+        try:
+            await self.release.wait()
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        return f"result-{self.calls}"
+
+
+async def test_concurrent_callers_share_one_call() -> None:
+    group = SingleFlight()
+    upstream = GatedCall()
+
+    waiters = [asyncio.create_task(group.do("k", upstream)) for _ in range(5)]
+    await asyncio.sleep(0)
+    upstream.release.set()
+
+    assert await asyncio.gather(*waiters) == ["result-1"] * 5
+    assert upstream.calls == 1 and len(group) == 0
+    assert await group.do("k", upstream) == "result-2"
+
+
+async def test_leader_cancellation_does_not_abort_followers() -> None:
+    group = SingleFlight()
+    upstream = GatedCall()
+    leader = asyncio.create_task(group.do("k", upstream))
+    follower = asyncio.create_task(group.do("k", upstream))
+    await asyncio.sleep(0)
+
+    leader.cancel()
+    await asyncio.sleep(0)
+    upstream.release.set()
+
+    assert await follower == "result-1"
+    assert leader.cancelled() and not upstream.cancelled
+
+
+async def test_upstream_is_cancelled_when_every_caller_leaves() -> None:
+    group = SingleFlight()
+    upstream = GatedCall()
+    callers = [asyncio.create_task(group.do("k", upstream)) for _ in range(2)]
+    await asyncio.sleep(0)
+
+    for caller in callers:
+        caller.cancel()
+    await asyncio.gather(*callers, return_exceptions=True)
+    await asyncio.sleep(0)
+
+    assert upstream.cancelled and len(group) == 0
+
+
+async def test_errors_are_delivered_to_every_caller() -> None:
+    group = SingleFlight()
+
+    async def failing() -> None:
+        await asyncio.sleep(0)
+        raise RuntimeError("backend down")
+
+    results = await asyncio.gather(
+        group.do("k", failing), group.do("k", failing), return_exceptions=True
+    )
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    with pytest.raises(RuntimeError):
+        await group.do("k", failing)
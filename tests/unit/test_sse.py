@@ -0,0 +1,171 @@
+"""Unit tests for the SSE helpers."""
+
+import asyncio
+import json
+
+from nexus.api.sse import (
+    StreamBufferBudget,
+    buffer_events,
+    coalesce_events,
+    encode_header_members,
+    format_sse,
+    splice_header,
+)
+
+HEADER = {
+    "id": "chatcmpl-local",
+    "object": "chat.completion.chunk",
+    "created": 1,
+    "model": "local-model",
+}
+MEMBERS = encode_header_members(HEADER)
+
+
+def test_splice_keeps_complete_upstream_chunk_untouched() -> None:
+    data = (
+        b'{"id": "up", "object": "chat.completion.chunk", "created": 5, '
+        b'"model": "m", "choices": [{"delta": {"content": "x"}}]}'
+    )
+
+    assert splice_header(data, MEMBERS) == data
+
+
+def test_splice_inserts_only_missing_members() -> None:
+    data = b'{"id":"up","choices":[{"delta":{"content":"x"}}]}'
+
+    spliced = json.loads(splice_header(data, MEMBERS))
+
+    assert spliced == {
+        "id": "up",
+        "object": "chat.completion.chunk",
+        "created": 1,
+        "model": "local-model",
+        "choices": [{"delta": {"content": "x"}}],
+    }
+
+
+def test_splice_ignores_nested_ids_after_choices() -> None:
+    data = b'{"choices":[{"delta":{"tool_calls":[{"id":"call_1"}]}}]}'
+
+    spliced = json.loads(splice_header(data, MEMBERS))
+
+    assert spliced["id"] == "chatcmpl-local"
+    assert spliced["choices"][0]["delta"]["tool_calls"][0]["id"] == "call_1"
+
+
+def test_splice_requires_parsing_for_unusual_layouts() -> None:
+    assert splice_header(b'{"meta":{"id":1},"choices":[]}', MEMBERS) is None
+    assert splice_header(b'{"model":"choices","id":"x"}', MEMBERS) is None
+    assert splice_header(b"[1, 2]", MEMBERS) is None
+
+
+def test_format_sse_emits_compact_event() -> None:
+    assert format_sse({"a": 1}) == b'data: {"a":1}\n\n'
+
+
+async def _timed_events(schedule):
+    for delay, event in schedule:
+        if delay:
+            await asyncio.sleep(delay)
+        yield event
+
+
+async def test_coalesce_flushes_first_event_then_batches_within_window() -> None:
+    schedule = [(0, b"a"), (0, b"b"), (0, b"c"), (0.05, b"d"), (0, b"e")]
+
+    batches = [
+        batch
+        async for batch in coalesce_events(
+            _timed_events(schedule), max_delay=0.01, max_bytes=1024
+        )
+    ]
+
+    assert batches == [b"a", b"bc", b"de"]
+
+
+async def test_coalesce_flushes_when_buffer_reaches_max_bytes() -> None:
+    schedule = [(0, b"first")] + [(0, b"xx")] * 5
+
+    batches = [
+        batch
+        async for batch in coalesce_events(
+            _timed_events(schedule), max_delay=10, max_bytes=4
+        )
+    ]
+
+    assert batches == [b"first", b"xxxx", b"xxxx", b"xx"]
+
+
+async def test_coalesce_reads_the_backend_with_one_task() -> None:
+    schedule = [(0.001, b"x")] * 20
+    tasks = set()
+
+    async for _ in coalesce_events(
+        _timed_events(schedule), max_delay=0.002, max_bytes=1024
+    ):
+        tasks |= asyncio.all_tasks()
+
+    assert len(tasks - {asyncio.current_task()}) == 1
+
+
+def _tracked_events(count: int, closed: list, size: int = 10):
+    async def _events():
+        try:
+            for index in range(count):
+                yield str(index).encode().ljust(size, b".")
+        finally:
+            closed.append(True)
+
+    return _events()
+
+
+async def test_buffer_drains_backend_ahead_of_a_slow_reader() -> None:
+    closed: list = []
+    budget = StreamBufferBudget(1000)
+    events = buffer_events(_tracked_events(5, closed), max_bytes=100, budget=budget)
+
+    first = await events.__anext__()
+    await asyncio.sleep(0.01)
+    assert closed == [True] and budget.used == 40
+
+    rest = [event async for event in events]
+    assert [first, *rest] == [str(i).encode().ljust(10, b".") for i in range(5)]
+    assert budget.used == 0
+
+
+async def test_buffer_reads_ahead_at_most_max_bytes() -> None:
+    closed: list = []
+    budget = StreamBufferBudget(1000)
+    events = buffer_events(_tracked_events(10, closed), max_bytes=30, budget=budget)
+
+    await events.__anext__()
+    await asyncio.sleep(0.01)
+    assert not closed and budget.used == 30
+
+    await events.aclose()
+    assert closed == [True] and budget.used == 0
+
+
+async def test_exhausted_budget_falls_back_to_backpressure() -> None:
+    closed: list = []
+    budget = StreamBufferBudget(15)
+    events = buffer_events(_tracked_events(5, closed), max_bytes=100, budget=budget)
+
+    received = [event async for event in events]
+
+    assert len(received) == 5 and budget.overflows > 0 and budget.used == 0
+
+
+async def test_exhausted_budget_aborts_stream_with_error_event() -> None:
+    closed: list = []
+    budget = StreamBufferBudget(15)
+    events = buffer_events(
+        _tracked_events(5, closed), max_bytes=100, budget=budget, overflow="abort"
+    )
+
+    first = await events.__anext__()
+    await asyncio.sleep(0.01)
+    rest = [event async for event in events]
+
+    assert first.startswith(b"0") and b"budget exhausted" in rest[-1]
+    assert len(rest) < 5 and budget.aborted == 1 and closed == [True]
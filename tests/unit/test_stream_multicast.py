@@ -0,0 +1,124 @@
+"""Unit tests for sharing one upstream stream among identical requests."""
+
+import asyncio
+
+import pytest
+
+from nexus.cache import StreamMulticast, SubscriberLaggedError
+
+
+class Upstream:
+    """Controllable upstream stream: chunks are pushed by the test."""
+
+    def __init__(self) -> None:
+        self.opened = 0
+        self.closed = False
+        self.queue: asyncio.Queue = asyncio.Queue()
+
+    async def open(self):
+        self.opened += 1
+        return self._iterate()
+
+    async def _iterate(self):
+        try:
+            while (item := await self.queue.get()) is not None:
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            self.closed = True
+
+    async def push(self, *items) -> None:
+        for item in items:
+            self.queue.put_nowait(item)
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+
+async def test_late_joiner_replays_buffer_then_follows_live() -> None:
+    group = StreamMulticast()
+    upstream = Upstream()
+    first = await group.subscribe("k", upstream.open)
+    await upstream.push("a", "b")
+    assert await anext(first) == "a"
+
+    late = await group.subscribe("k", upstream.open)
+    await upstream.push("c", None)
+
+    assert [item async for item in first] == ["b", "c"]
+    assert [item async for item in late] == ["a", "b", "c"]
+    assert upstream.opened == 1 and upstream.closed and len(group) == 0
+
+
+async def test_slow_subscriber_does_not_stall_others() -> None:
+    group = StreamMulticast(max_replay=4)
+    upstream = Upstream()
+    fast = await group.subscribe("k", upstream.open)
+    slow = await group.subscribe("k", upstream.open)
+
+    received = []
+    for item in range(10):
+        await upstream.push(item)
+        received.append(await anext(fast))
+    await upstream.push(None)
+
+    assert received == list(range(10)) and [item async for item in fast] == []
+    with pytest.raises(SubscriberLaggedError):
+        await anext(slow)
+    assert upstream.closed
+
+
+async def test_subscriber_that_never_reads_does_not_hold_the_stream() -> None:
+    group = StreamMulticast(max_replay=2)
+    upstream = Upstream()
+    idle = await group.subscribe("k", upstream.open)
+
+    await upstream.push(*range(5))
+
+    assert upstream.closed and len(group) == 0
+    with pytest.raises(SubscriberLaggedError):
+        await anext(idle)
+
+
+async def test_upstream_is_closed_when_last_subscriber_leaves() -> None:
+    group = StreamMulticast()
+    upstream = Upstream()
+    first = await group.subscribe("k", upstream.open)
+    second = await group.subscribe("k", upstream.open)
+    await upstream.push("a")
+    assert await anext(first) == "a" and await anext(second) == "a"
+
+    await first.aclose()
+    await upstream.push()
+    assert not upstream.closed
+    await second.aclose()
+    await upstream.push()
+
+    assert upstream.closed and len(group) == 0
+
+
+async def test_generation_stops_accepting_joiners_after_replay_limit() -> None:
+    group = StreamMulticast(max_replay=2)
+    upstream = Upstream()
+    first = await group.subscribe("k", upstream.open)
+    await upstream.push("a", "b")
+
+    other = Upstream()
+    fresh = await group.subscribe("k", other.open)
+    await other.push("x", None)
+    await upstream.push(None)
+
+    assert [item async for item in fresh] == ["x"]
+    assert [item async for item in first] == ["a", "b"]
+
+
+async def test_upstream_errors_reach_every_subscriber() -> None:
+    group = StreamMulticast()
+    upstream = Upstream()
+    subscribers = [await group.subscribe("k", upstream.open) for _ in range(2)]
+    await upstream.push("a", RuntimeError("backend down"))
+
+    for subscriber in subscribers:
+        assert await anext(subscriber) == "a"
+        with pytest.raises(RuntimeError):
+            await anext(subscriber)
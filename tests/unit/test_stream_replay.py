@@ -0,0 +1,121 @@
+"""Unit tests for resuming SSE streams from a replay buffer."""
+
+import asyncio
+
+import pytest
+
+from nexus.cache import StreamExpiredError, StreamReplayStore
+
+
+class Generation:
+    """Controllable event stream: events are pushed by the test."""
+
+    def __init__(self) -> None:
+        self.closed = False
+        self.queue: asyncio.Queue = asyncio.Queue()
+
+    async def events(self):
+        try:
+            while (item := await self.queue.get()) is not None:
+                yield item
+        finally:
+            self.closed = True
+
+    async def push(self, *items) -> None:
+        for item in items:
+            self.queue.put_nowait(item)
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+
+async def test_events_carry_resumable_ids() -> None:
+    store = StreamReplayStore(ttl=60)
+    generation = Generation()
+    reader = store.start("r1", generation.events())
+    await generation.push(b"data: a\n\n", b"data: b\n\n", None)
+
+    assert [event async for event in reader] == [
+        b"id: r1:0\ndata: a\n\n",
+        b"id: r1:1\ndata: b\n\n",
+    ]
+
+
+async def test_resume_follows_the_live_generation_after_a_drop() -> None:
+    store = StreamReplayStore(ttl=60)
+    generation = Generation()
+    reader = store.start("r1", generation.events())
+    await generation.push(b"a", b"b")
+    assert await anext(reader) == b"id: r1:0\na"
+    await reader.aclose()
+
+    # The generation keeps running while the client is away.
+    await generation.push(b"c")
+    resumed = store.resume("r1:0")
+    await generation.push(None)
+
+    assert [event async for event in resumed] == [b"id: r1:1\nb", b"id: r1:2\nc"]
+    assert generation.closed
+
+
+async def test_resume_replays_a_finished_stream() -> None:
+    store = StreamReplayStore(ttl=60)
+    generation = Generation()
+    reader = store.start("r1", generation.events())
+    await generation.push(b"a", b"b", None)
+    assert [event async for event in reader] == [b"id: r1:0\na", b"id: r1:1\nb"]
+
+    assert [event async for event in store.resume("r1:0")] == [b"id: r1:1\nb"]
+    assert [event async for event in store.resume("r1:1")] == []
+
+
+async def test_resume_rejects_unknown_and_trimmed_positions() -> None:
+    now = [0.0]
+    store = StreamReplayStore(ttl=10, max_bytes=2, clock=lambda: now[0])
+    generation = Generation()
+    reader = store.start("r1", generation.events())
+    await generation.push(b"a", b"b", b"c", None)
+    assert len([event async for event in reader]) == 3
+
+    with pytest.raises(StreamExpiredError) as trimmed:
+        store.resume("r1:-1")
+    assert trimmed.value.status_code == 410
+    assert [event async for event in store.resume("r1:1")] == [b"id: r1:2\nc"]
+
+    for last_event_id in ("other:0", "r1:x"):
+        with pytest.raises(StreamExpiredError) as unknown:
+            store.resume(last_event_id)
+        assert unknown.value.status_code == 404
+
+    now[0] = 10.0
+    with pytest.raises(StreamExpiredError):
+        store.resume("r1:1")
+    assert len(store) == 0
+
+
+async def test_generation_waits_for_a_slow_reader_instead_of_dropping() -> None:
+    store = StreamReplayStore(ttl=60, max_bytes=2)
+    generation = Generation()
+    reader = store.start("r1", generation.events())
+    await generation.push(b"a", b"b", b"c", b"d", None)
+
+    assert [event async for event in reader] == [
+        b"id: r1:0\na",
+        b"id: r1:1\nb",
+        b"id: r1:2\nc",
+        b"id: r1:3\nd",
+    ]
+
+
+async def test_abandoned_generation_stops_after_ttl() -> None:
+    store = StreamReplayStore(ttl=0.01)
+    generation = Generation()
+    reader = store.start("r1", generation.events())
+    await generation.push(b"a")
+    await anext(reader)
+    await reader.aclose()
+
+    await asyncio.sleep(0.05)
+
+    assert generation.closed and len(store) == 0
+    with pytest.raises(StreamExpiredError):
+        store.resume("r1:0")
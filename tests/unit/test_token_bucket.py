@@ -0,0 +1,132 @@
+"""Unit tests for per-tenant token rate limiting."""
+
+import math
+import sqlite3
+
+import pytest
+
+from nexus.admission import (
+    AdmissionRejectedError,
+    MemoryTokenBucketStore,
+    SQLiteTokenBucketStore,
+    TokenRateLimiter,
+    estimate_prompt_tokens,
+)
+from nexus.dispatch import Deadline, DeadlineExceededError
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_prompt_estimate_grows_with_text_and_messages() -> None:
+    short = estimate_prompt_tokens([{"role": "user", "content": "hi"}])
+    long = estimate_prompt_tokens([{"role": "user", "content": "x" * 400}])
+    parts = estimate_prompt_tokens(
+        [{"role": "user", "content": [{"type": "text", "text": "x" * 400}]}]
+    )
+
+    assert short < long == parts
+    assert estimate_prompt_tokens("x" * 400) == long
+
+
+async def test_budget_is_debited_per_tenant_and_refills_over_time() -> None:
+    clock = FakeClock()
+    limiter = TokenRateLimiter(
+        MemoryTokenBucketStore(clock), tokens_per_minute=600, clock=clock
+    )
+
+    await limiter.reserve("a", 500)
+    with pytest.raises(AdmissionRejectedError) as rejected:
+        await limiter.reserve("a", 200)
+    await limiter.reserve("b", 500)
+
+    assert rejected.value.status_code == 429
+    assert rejected.value.retry_after == pytest.approx(10.0)
+    clock.now = 10.0
+    await limiter.reserve("a", 200)
+    assert limiter.stats()["rejected"] == 1
+
+
+async def test_settling_reconciles_estimate_with_reported_usage() -> None:
+    clock = FakeClock()
+    store = MemoryTokenBucketStore(clock)
+    limiter = TokenRateLimiter(store, tokens_per_minute=1000, clock=clock)
+
+    under = await limiter.reserve("a", 400)
+    await under.settle(100)
+    await under.settle(1000)
+    over = await limiter.reserve("a", 100)
+    await over.settle(900)
+
+    # 1000 - 100 (actual) - 900 (actual) leaves the tenant empty.
+    assert await store.take("a", 0, required=1, rate=1000 / 60, burst=1000) > 0
+
+
+async def test_oversized_request_only_needs_a_full_bucket() -> None:
+    clock = FakeClock()
+    limiter = TokenRateLimiter(
+        MemoryTokenBucketStore(clock), tokens_per_minute=60, clock=clock
+    )
+
+    await limiter.reserve("a", 600)
+    clock.now = 60.0
+    with pytest.raises(AdmissionRejectedError):
+        await limiter.reserve("a", 1)
+
+
+async def test_requests_wait_for_a_refill_within_max_wait() -> None:
+    limiter = TokenRateLimiter(
+        MemoryTokenBucketStore(), tokens_per_minute=6000, max_wait=1.0
+    )
+
+    await limiter.reserve("a", 6000)
+    await limiter.reserve("a", 5)
+
+    assert limiter.stats()["waited"] == 1
+    with pytest.raises(DeadlineExceededError):
+        await limiter.reserve("a", 100, deadline=Deadline.after(0.01))
+
+
+async def test_sqlite_store_shares_buckets_between_instances(tmp_path) -> None:
+    path = tmp_path / "buckets.sqlite"
+    first = SQLiteTokenBucketStore(path)
+    second = SQLiteTokenBucketStore(path)
+
+    assert await first.take("a", 90, required=90, rate=0.001, burst=100) == 0
+    assert await second.take("a", 90, required=90, rate=0.001, burst=100) > 0
+    assert await second.take("b", 90, required=90, rate=0.001, burst=100) == 0
+
+    await first.aclose()
+    await second.aclose()
+
+
+async def test_full_buckets_are_dropped(tmp_path) -> None:
+    clock = FakeClock()
+    path = tmp_path / "buckets.sqlite"
+    memory = MemoryTokenBucketStore(clock)
+    shared = SQLiteTokenBucketStore(path, clock=clock)
+
+    def keys(store) -> set:
+        if store is memory:
+            return set(memory._buckets)
+        with sqlite3.connect(path) as connection:
+            return {key for (key,) in connection.execute("SELECT key FROM buckets")}
+
+    for store in (memory, shared):
+        clock.now = 0.0
+        await store.take("a", 50, required=50, rate=10, burst=100)
+        await store.take("b", 50, required=50, rate=10, burst=100)
+        # A refund that fills the bucket removes it straight away.
+        await store.take("b", -50, required=-math.inf, rate=10, burst=100)
+        assert keys(store) == {"a"}
+
+        # Idle buckets are swept once a refill period has passed.
+        clock.now = 10.0
+        await store.take("c", 1, required=1, rate=10, burst=100)
+        assert keys(store) == {"c"}
+    await shared.aclose()